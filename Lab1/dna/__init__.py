@@ -0,0 +1,39 @@
+"""
+DNA analysis for Lab 1, usable without the notebook.
+
+Submodules:
+    reader    open plain, gzip and bgzip files and stream (seq_id, sequence) records
+    counting  NumPy nucleotide counting
+    index     FASTA index (.fai) and memory-mapped random access
+    parallel  process-pool counting of many files and of huge sequences
+    pipeline  process_dna_file: read, count, print and chart one file
+    report    bar charts and headless PDF/PNG reports (matplotlib)
+    export    Parquet/NPZ export of the counts (Parquet needs pyarrow)
+    cache     on-disk SQLite cache of the counts
+    kmers     k-mer, dinucleotide and GC-window analysis
+    packed    2-bit packed sequences
+    bench     benchmarks and the regression gate
+
+Only the light core is imported here, so "import dna" does not load matplotlib,
+pyarrow or SQLite. The command line tool is run with "python -m dna".
+"""
+
+from .counting import count_letters, count_nucleotides, merge_counts
+from .index import IndexedFasta, load_fasta_index
+from .parallel import count_file_chunked, process_dna_files
+from .pipeline import process_dna_file
+from .reader import iter_dna_records, open_dna_file, read_dna_file
+
+__all__ = [
+    "count_letters",
+    "count_nucleotides",
+    "merge_counts",
+    "IndexedFasta",
+    "load_fasta_index",
+    "count_file_chunked",
+    "process_dna_files",
+    "process_dna_file",
+    "iter_dna_records",
+    "open_dna_file",
+    "read_dna_file",
+]
@@ -0,0 +1,159 @@
+"""
+Command line tool for the dna package.
+
+    python -m dna count dna_raw.txt dna_raw_complicated.txt
+    python -m dna count "data/*.fa.gz" --workers 4 --export counts.npz
+    python -m dna count dna_raw.txt --report counts.pdf
+    python -m dna count dna_raw.txt --cache
+    python -m dna count big.fa.gz --threaded
+    python -m dna index dna_raw.txt
+    python -m dna kmers dna_raw.txt -k 3 --top 5
+    python -m dna bench --fail-on-regression
+
+Only the modules that a command needs are imported, so counting without --plot or
+--report never loads matplotlib.
+"""
+
+import argparse
+import sys
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+
+from .parallel import expand_dna_files
+
+
+def _count(args) -> int:
+    # count the sequences of every file, in a process pool when --workers is given
+    if args.workers and not (args.seq_id or args.report or args.plot or args.cache):
+        from .parallel import iter_dna_files_counts
+        filenames = expand_dna_files(args.files)
+        results = iter_dna_files_counts(filenames, args.max_sequences, args.workers)
+        if not args.export:
+            deque(_print_counts(results), maxlen=0)
+            return 0
+        from .export import export_counts
+        for filename, file_results in groupby(results, key=itemgetter(0)):  # one export per input file, like below
+            # written batch by batch, the results are never all in memory
+            written = export_counts(_print_counts(file_results), _output_name(args.export, filename, filenames))
+            print(f"Counts exported to {written}")
+        return 0
+
+    from .pipeline import process_dna_file
+    cache = None
+    if args.cache:
+        from .cache import CountCache
+        cache = CountCache(args.cache)
+    try:
+        filenames = expand_dna_files(args.files)
+        for filename in filenames:
+            process_dna_file(filename, args.max_sequences, args.seq_id, _output_name(args.report, filename, filenames),
+                             _output_name(args.export, filename, filenames), plot=args.plot, cache=cache,
+                             threaded=args.threaded)
+    finally:
+        if cache is not None:
+            cache.close()
+    return 0
+
+
+def _print_counts(results):
+    # print every (filename, seq_id, counts) result as it arrives and pass (seq_id, counts) on to the export
+    for filename, seq_id, counts in results:
+        print(f"Nucleotide counts for {seq_id} (from {filename}):")
+        print({letter: counts[letter] for letter in "ACGT"})
+        yield seq_id, counts
+
+
+def _output_name(output, filename, filenames):
+    # one report or export per input file, named after the file when there is more than one
+    if output is None or len(filenames) == 1:
+        return output
+    stem, dot, extension = output.rpartition(".")
+    name = filename.replace("/", "_").replace("\\", "_")
+    return f"{stem}_{name}.{extension}" if dot else f"{output}_{name}"
+
+
+def _index(args) -> int:
+    # build (or reuse) the .fai file of every file and print its entries
+    from .index import load_fasta_index
+    for filename in expand_dna_files(args.files):
+        try:
+            index = load_fasta_index(filename)
+        except FileNotFoundError:
+            print(f"Error: The file '{filename}' could not be found.")
+            continue
+        except ValueError as error:  # compressed input has no byte offsets
+            print(f"Error: {error}")
+            continue
+        print(f"{filename}.fai: {len(index)} sequences")
+        for entry in index.values():
+            print("\t".join(str(value) for value in entry))
+    return 0
+
+
+def _kmers(args) -> int:
+    # print the most frequent k-mers and the dinucleotide ratios of one file
+    from .kmers import analyze_kmers
+    from .reader import iter_dna_records
+    analyzer = analyze_kmers(iter_dna_records(args.file), k=args.k, window=args.window)
+    print(f"Top {args.top} {args.k}-mers in {args.file}:")
+    for kmer, count in analyzer.top_kmers(args.top):
+        print(f"{kmer}\t{count}")
+    print(f"CpG observed/expected: {analyzer.dinucleotide_ratios()['CG']:.3f}")
+    return 0
+
+
+def _bench(args) -> int:
+    # run the benchmark suite, a regression returns exit code 1 with --fail-on-regression
+    from .bench import run_benchmarks
+    results, regressions = run_benchmarks(baseline_path=args.baseline, tolerance=args.tolerance,
+                                          update_baseline=args.update_baseline)
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the command line tool."""
+    parser = argparse.ArgumentParser(prog="python -m dna", description="DNA analysis for FASTA files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    count = commands.add_parser("count", help="count the nucleotides of every sequence")
+    count.add_argument("files", nargs="+", help="DNA files or glob patterns (plain, gzip or bgzip)")
+    count.add_argument("--max-sequences", type=int, help="only count the first N sequences of each file")
+    count.add_argument("--seq-id", action="append", help="only count this sequence (repeatable, uses the FASTA index)")
+    count.add_argument("--workers", type=int, help="count in a pool of N processes")
+    count.add_argument("--report", help="write the charts to a .pdf or .png report")
+    count.add_argument("--export", help="write the counts to a .parquet or .npz file")
+    count.add_argument("--plot", action="store_true", help="show a chart per sequence")
+    count.add_argument("--threaded", action="store_true", help="read and parse the file in a background thread")
+    count.add_argument("--cache", nargs="?", const="dna_counts_cache.sqlite",
+                       help="reuse the counts of unchanged files from this SQLite cache (default dna_counts_cache.sqlite)")
+    count.set_defaults(handler=_count)
+
+    index = commands.add_parser("index", help="build the .fai index of FASTA files")
+    index.add_argument("files", nargs="+", help="plain text FASTA files or glob patterns")
+    index.set_defaults(handler=_index)
+
+    kmers = commands.add_parser("kmers", help="k-mer and dinucleotide statistics of a file")
+    kmers.add_argument("file", help="the DNA file")
+    kmers.add_argument("-k", type=int, default=6, help="k-mer length, 1 to 12 (default 6)")
+    kmers.add_argument("--top", type=int, default=10, help="number of k-mers to print (default 10)")
+    kmers.add_argument("--window", type=int, default=100, help="bases per GC window (default 100)")
+    kmers.set_defaults(handler=_kmers)
+
+    bench = commands.add_parser("bench", help="run the benchmark suite against the saved baseline")
+    bench.add_argument("--baseline", default="benchmark_baseline.json", help="the baseline JSON file")
+    bench.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    bench.add_argument("--update-baseline", action="store_true", help="save this run as the new baseline")
+    bench.add_argument("--fail-on-regression", action="store_true", help="exit with code 1 on a regression")
+    bench.set_defaults(handler=_bench)
+    return parser
+
+
+def main(argv=None) -> int:
+    """Run the command line tool and return its exit code."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Benchmarks for the DNA pipeline.
+
+benchmark_counting compares the original per-character loop with count_nucleotides.
+run_benchmarks writes synthetic FASTA files, from many short records to a few giant
+ones, and measures parse throughput, counting throughput and the growth of peak RSS,
+each scenario in a fresh worker process. The first run saves a baseline file. Later
+runs flag every metric that is more than tolerance worse than the baseline.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .counting import count_letters, count_nucleotides
+from .reader import iter_dna_records
+
+try:
+    import resource  # peak RSS of the worker process on Linux and macOS
+except ImportError:  # Windows: tracemalloc is used instead
+    resource = None
+
+
+def count_letters_loop(dna_sequence) -> dict:
+    """The original per-character loop, kept here only as the reference for the benchmark."""
+    letter_count = {"A": 0, "C": 0, "G": 0, "T": 0}
+    for letter in dna_sequence:
+        if letter in letter_count:
+            letter_count[letter] += 1
+    return letter_count
+
+
+def benchmark_counting(sizes=(10**3, 10**6, 10**8, 10**9)):
+    """Time the loop and the counting engine on sequences of the given sizes (in bytes) and print the throughput."""
+    rng = random.Random(42)  # fixed seed so every run uses the same sequence
+    block = "".join(rng.choice("ACGTN") for _ in range(10**6))  # 1 MB random block that is repeated for bigger sizes
+    print(f"{'size':>12} {'loop MB/s':>12} {'engine MB/s':>12} {'speedup':>9}")
+    for size in sizes:
+        seq = (block * (size // len(block) + 1))[:size]  # build a sequence of exactly `size` letters
+        assert count_letters_loop(seq) == count_letters(seq)  # both versions must give the same answer
+        repeats = 5 if size <= 10**6 else 1  # repeat the small sizes to get a stable timing
+        loop_time = min(timeit.repeat(lambda: count_letters_loop(seq), number=1, repeat=repeats))
+        engine_time = min(timeit.repeat(lambda: count_nucleotides(seq), number=1, repeat=repeats))
+        megabytes = size / 10**6
+        print(f"{size:>12} {megabytes / loop_time:>12.1f} {megabytes / engine_time:>12.1f} {loop_time / engine_time:>8.0f}x")
+        del seq  # free the big sequence before building the next one
+
+
+BENCHMARK_SCENARIOS = {  # name -> arguments for generate_synthetic_fasta, about 100 MB each
+    "many_short_records": {"n_records": 500_000, "record_length": 200},
+    "medium_records": {"n_records": 2_000, "record_length": 50_000},
+    "few_giant_records": {"n_records": 2, "record_length": 50_000_000},
+}
+
+
+def generate_synthetic_fasta(path, n_records, record_length, line_width=60, seed=42):
+    """Write a reproducible FASTA file with random A/C/G/T and about 1 % N."""
+    rng = np.random.default_rng(seed)
+    letters = np.frombuffer(b"ACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTN", dtype=np.uint8)
+    with open(path, "wb") as fasta_file:
+        for record in range(n_records):
+            bases = letters[rng.integers(0, len(letters), record_length)]
+            full_lines = record_length // line_width * line_width
+            lines = np.hstack((bases[:full_lines].reshape(-1, line_width),
+                               np.full((full_lines // line_width, 1), ord("\n"), dtype=np.uint8)))
+            tail = bases[full_lines:]  # the last, shorter line
+            fasta_file.write(f">seq{record}\n".encode())
+            fasta_file.write(lines.tobytes())
+            if len(tail):
+                fasta_file.write(tail.tobytes() + b"\n")
+
+
+def _peak_memory():
+    # peak RSS of this process in bytes (tracemalloc peak where resource is not available)
+    if resource is None:
+        return tracemalloc.get_traced_memory()[1]
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports kilobytes, macOS bytes
+
+
+def _measure_scenario(path):
+    # worker: parse and count one file, timing the two steps separately
+    if resource is None:
+        tracemalloc.start()
+    start_memory = _peak_memory()
+    parse_time = count_time = 0.0
+    total_bases = 0
+    records = iter_dna_records(path)
+    while True:
+        started = time.perf_counter()
+        record = next(records, None)
+        parse_time += time.perf_counter() - started
+        if record is None:
+            break
+        started = time.perf_counter()
+        count_nucleotides(record[1])
+        count_time += time.perf_counter() - started
+        total_bases += len(record[1])
+    megabytes = os.path.getsize(path) / 10**6
+    return {
+        "parse_mb_per_s": megabytes / parse_time,
+        "count_mb_per_s": total_bases / 10**6 / max(count_time, 1e-9),
+        "peak_rss_mb": (_peak_memory() - start_memory) / 10**6,
+    }
+
+
+def check_regressions(results, baseline, tolerance=0.2) -> list:
+    """Return a list of messages for every result that is more than tolerance worse than the baseline."""
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(scenario, {}).get(metric)
+            if reference is None:
+                continue
+            worse = value > reference * (1 + tolerance) if metric == "peak_rss_mb" else value < reference * (1 - tolerance)
+            if worse:
+                regressions.append(f"{scenario}: {metric} {value:.1f} vs. baseline {reference:.1f}")
+    return regressions
+
+
+def run_benchmarks(scenarios=None, baseline_path="benchmark_baseline.json", tolerance=0.2,
+                   update_baseline=False, fail_on_regression=False) -> tuple:
+    """
+    Run every scenario in a fresh process, print the results and compare them with the stored baseline.
+
+    Args:
+        scenarios (dict, optional): name -> arguments for generate_synthetic_fasta. Defaults to BENCHMARK_SCENARIOS.
+        baseline_path (str, optional): JSON file with the baseline, written on the first run.
+        tolerance (float, optional): Allowed relative slowdown or memory growth. Defaults to 0.2.
+        update_baseline (bool, optional): Save these results as the new baseline.
+        fail_on_regression (bool, optional): Raise RuntimeError when a regression is found.
+
+    Returns:
+        tuple: (results, list of regression messages).
+    """
+    scenarios = BENCHMARK_SCENARIOS if scenarios is None else scenarios
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, arguments in scenarios.items():
+            path = os.path.join(directory, f"{name}.fa")
+            generate_synthetic_fasta(path, **arguments)
+            with ProcessPoolExecutor(max_workers=1) as executor:  # a new process per scenario, so peak RSS is not shared
+                results[name] = executor.submit(_measure_scenario, path).result()
+            os.remove(path)
+
+    print(f"{'scenario':<22} {'parse MB/s':>11} {'count MB/s':>11} {'peak RSS MB':>12}")
+    for name, metrics in results.items():
+        print(f"{name:<22} {metrics['parse_mb_per_s']:>11.1f} {metrics['count_mb_per_s']:>11.1f} {metrics['peak_rss_mb']:>12.1f}")
+
+    if update_baseline or not os.path.exists(baseline_path):
+        with open(baseline_path, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+        return results, []
+    with open(baseline_path) as baseline_file:
+        regressions = check_regressions(results, json.load(baseline_file), tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if regressions and fail_on_regression:
+        raise RuntimeError(f"{len(regressions)} benchmark regression(s) against {baseline_path}.")
+    return results, regressions
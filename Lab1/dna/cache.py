@@ -0,0 +1,104 @@
+"""
+Size-bounded on-disk cache of nucleotide counts.
+
+A file is unchanged when its size and modification time match the stored ones, or,
+with verify_hash=True, when its SHA-256 matches. The counts of an unchanged file are
+returned without reading it. A changed file is read and counted again in full: hashing
+each record to find the unchanged ones would cost about as much as counting them. When
+the cache grows past max_bytes, the least recently used files are removed first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from itertools import islice
+
+from .counting import count_nucleotides
+from .reader import iter_dna_records
+
+
+def file_sha256(filename, block_size=1 << 20) -> str:
+    """Return the SHA-256 of the content of a file, read block by block."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as dna_file:
+        for block in iter(lambda: dna_file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CountCache:
+    """On-disk cache of the nucleotide counts of whole files, with a size-bounded LRU eviction."""
+
+    def __init__(self, path="dna_counts_cache.sqlite", max_bytes=64 * 1024 * 1024, verify_hash=False):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path (str, optional): The SQLite file of the cache.
+            max_bytes (int, optional): Upper bound for the stored counts. Defaults to 64 MiB.
+            verify_hash (bool, optional): Compare a SHA-256 of the content instead of trusting size and mtime.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.verify_hash = verify_hash
+        self._db = sqlite3.connect(path)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT, max_sequences INTEGER, size INTEGER, mtime_ns INTEGER, sha256 TEXT,
+                results TEXT, nbytes INTEGER, last_used REAL, PRIMARY KEY (path, max_sequences))
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._db.close()
+
+    def counts(self, filename, max_sequences=None) -> list:
+        """Return [(seq_id, counts), ...] for a file, reading and counting it only when it is not cached."""
+        path = os.path.abspath(filename)
+        limit = max_sequences or 0  # 0 means all records
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            print(f"Error: The file '{filename}' could not be found.")
+            return []
+        sha256 = file_sha256(filename) if self.verify_hash else None
+        row = self._db.execute("SELECT size, mtime_ns, sha256, results FROM files WHERE path = ? AND max_sequences = ?",
+                               (path, limit)).fetchone()
+        if row is not None:
+            same_stat = row[0] == stat.st_size and row[1] == stat.st_mtime_ns
+            if (same_stat and not self.verify_hash) or (self.verify_hash and row[2] == sha256):
+                self._db.execute("UPDATE files SET last_used = ?, mtime_ns = ? WHERE path = ? AND max_sequences = ?",
+                                 (time.time(), stat.st_mtime_ns, path, limit))
+                self._db.commit()
+                return [(seq_id, counts) for seq_id, counts in json.loads(row[3])]
+
+        records = iter_dna_records(filename)
+        if max_sequences:
+            records = islice(records, max_sequences)
+        results = [(seq_id, count_nucleotides(seq)) for seq_id, seq in records]
+
+        text = json.dumps(results)
+        self._db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         (path, limit, stat.st_size, stat.st_mtime_ns, sha256, text, len(path) + len(text), time.time()))
+        self._evict()
+        self._db.commit()
+        return results
+
+    def _evict(self) -> None:
+        # remove the least recently used files until the cache fits in max_bytes
+        total = self._db.execute("SELECT COALESCE(SUM(nbytes), 0) FROM files").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for rowid, nbytes in self._db.execute("SELECT rowid, nbytes FROM files ORDER BY last_used").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM files WHERE rowid = ?", (rowid,))
+            total -= nbytes
@@ -0,0 +1,51 @@
+"""
+Nucleotide counting.
+
+count_nucleotides counts a whole str or bytes-like buffer with one NumPy bincount pass
+instead of one Python step per letter.
+"""
+
+import numpy as np
+
+COUNT_BLOCK_SIZE = 1 << 24  # bincount works on 16 MB blocks so its int64 temporary array stays small
+WHITESPACE = b" \t\n\r\v\f"  # ASCII whitespace, what str.strip removes from the lines of a file
+
+
+def count_nucleotides(dna_sequence) -> dict:
+    """
+    Count A, C, G, T, N and other letters in a sequence.
+
+    Upper and lower case count as the same letter and ASCII whitespace (line breaks, and
+    spaces or tabs at the end of a line) is ignored, so raw slices of a file can be counted
+    directly and give the same counts as the stripped lines of the reader.
+
+    Args:
+        dna_sequence (str | bytes | bytearray | memoryview | mmap): The sequence to count.
+    """
+    if isinstance(dna_sequence, str):
+        dna_sequence = dna_sequence.encode("ascii", "replace")  # non-ASCII letters become "?" and end up in "other"
+    data = np.frombuffer(dna_sequence, dtype=np.uint8)  # zero-copy view of the buffer
+    byte_counts = np.zeros(256, dtype=np.int64)
+    for start in range(0, len(data), COUNT_BLOCK_SIZE):
+        byte_counts += np.bincount(data[start:start + COUNT_BLOCK_SIZE], minlength=256)
+    counts = {}
+    for letter in "ACGTN":
+        counts[letter] = int(byte_counts[ord(letter)] + byte_counts[ord(letter.lower())])
+    whitespace = int(sum(byte_counts[byte] for byte in WHITESPACE))
+    counts["other"] = len(data) - whitespace - sum(counts.values())
+    return counts
+
+
+def count_letters(dna_sequence) -> dict:
+    """Return the counts of A, C, G and T in a sequence."""
+    counts = count_nucleotides(dna_sequence)
+    return {letter: counts[letter] for letter in "ACGT"}
+
+
+def merge_counts(partial_counts) -> dict:
+    """Add up partial count dictionaries from count_nucleotides into one total."""
+    total = count_nucleotides(b"")
+    for counts in partial_counts:
+        for letter, count in counts.items():
+            total[letter] += count
+    return total
@@ -0,0 +1,92 @@
+"""
+Columnar export of per-sequence counts.
+
+Rows have a seq_id column and one uint64 column per count (A, C, G, T, N, other).
+A name ending in .parquet writes Arrow/Parquet (needs the optional pyarrow package) and
+streams every batch to disk. Any other name writes a NumPy .npz file, and .npz is added
+to a name that does not end with it already (out.csv becomes out.csv.npz).
+"""
+
+from itertools import islice
+
+import numpy as np
+
+from .counting import count_nucleotides
+from .reader import iter_dna_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # without pyarrow only .npz files can be written
+    pa = pq = None
+
+EXPORT_COLUMNS = ["A", "C", "G", "T", "N", "other"]
+
+
+def iter_counts(filename, max_sequences=None):
+    """Yield (seq_id, counts) for the records of a file without keeping the sequences."""
+    records = iter_dna_records(filename)
+    if max_sequences:
+        records = islice(records, max_sequences)
+    for seq_id, seq in records:
+        yield seq_id, count_nucleotides(seq)
+
+
+def iter_count_batches(results, batch_size):
+    """Group (seq_id, counts) results into (ids, {column: uint64 array}) batches."""
+    results = iter(results)
+    while True:
+        batch = list(islice(results, batch_size))
+        if not batch:
+            return
+        ids = [seq_id for seq_id, counts in batch]
+        columns = {column: np.fromiter((counts[column] for seq_id, counts in batch), dtype=np.uint64, count=len(batch))
+                   for column in EXPORT_COLUMNS}
+        yield ids, columns
+
+
+def export_counts(results, output, batch_size=65536) -> str:
+    """
+    Write (seq_id, counts) results to a .parquet or .npz file.
+
+    Args:
+        results (iterable): (seq_id, counts) pairs, e.g. from iter_counts.
+        output (str): The file to write. .npz is added unless the name ends with .parquet or .npz.
+        batch_size (int, optional): Rows per batch (one Parquet row group per batch).
+
+    Returns:
+        str: The file that was written.
+    """
+    if output.lower().endswith(".parquet"):
+        if pq is None:
+            raise ImportError("Writing Parquet files needs pyarrow (pip install pyarrow), or use an .npz file name.")
+        schema = pa.schema([("seq_id", pa.string())] + [(column, pa.uint64()) for column in EXPORT_COLUMNS])
+        with pq.ParquetWriter(output, schema) as writer:
+            for ids, columns in iter_count_batches(results, batch_size):
+                arrays = [pa.array(ids, type=pa.string())] + [pa.array(columns[column]) for column in EXPORT_COLUMNS]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+        return output
+
+    if not output.lower().endswith(".npz"):
+        output += ".npz"  # the name np.savez would pick, so the caller gets the real file name
+    all_ids = []
+    column_batches = {column: [] for column in EXPORT_COLUMNS}
+    for ids, columns in iter_count_batches(results, batch_size):
+        all_ids.extend(ids)
+        for column in EXPORT_COLUMNS:
+            column_batches[column].append(columns[column])
+    arrays = {column: np.concatenate(batches) if batches else np.zeros(0, dtype=np.uint64)
+              for column, batches in column_batches.items()}
+    np.savez(output, seq_id=np.array(all_ids, dtype=str), **arrays)
+    return output
+
+
+def load_counts(path) -> dict:
+    """Read an exported file back as {column: NumPy array} (Parquet files are memory-mapped)."""
+    if path.lower().endswith(".parquet"):
+        if pq is None:
+            raise ImportError("Reading Parquet files needs pyarrow (pip install pyarrow).")
+        table = pq.read_table(path, memory_map=True)
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+    with np.load(path) as npz_file:
+        return {name: npz_file[name] for name in npz_file.files}
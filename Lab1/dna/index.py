@@ -0,0 +1,339 @@
+"""
+FASTA index (.fai) and memory-mapped random access.
+
+build_fasta_index scans a file once and records the byte offset, length and line width
+of every sequence in the five columns of a samtools .fai file. The file is scanned in
+blocks of whole lines: NumPy finds the line ends and header lines of a block, so Python
+code only runs once per record instead of once per line. load_fasta_index saves
+the index next to the DNA file and reuses it until the DNA file changes. IndexedFasta
+memory-maps the file, so any sequence or sub-range is fetched from its offset without
+parsing the rest of the file.
+
+Sequences with uneven line lengths are stored with a line width of 0. They are still
+found by offset, but their lines are cleaned when fetched.
+
+Byte offsets only exist in plain text files. gzip and bgzip files are refused with a
+ValueError, and no .fai file is written for them. iter_indexed_records reads them with
+the streaming reader instead.
+"""
+
+import mmap
+import os
+from collections import namedtuple
+from itertools import starmap
+
+import numpy as np
+
+from .reader import is_gzip, iter_dna_records
+
+FaiEntry = namedtuple("FaiEntry", ["name", "length", "offset", "line_bases", "line_width"])
+
+NEWLINE, CARRIAGE_RETURN, HEADER = ord("\n"), ord("\r"), ord(">")
+
+
+def _check_plain_text(filename) -> None:
+    # offsets into compressed bytes are meaningless, so compressed files are refused
+    if is_gzip(filename):
+        raise ValueError(f"'{filename}' is compressed, a FASTA index needs a plain text file.")
+
+
+def _finish_entry(record) -> FaiEntry:
+    # turn the scanned values into an index entry, uneven records get line width 0
+    if not record["regular"]:
+        record["line_bases"] = record["line_width"] = 0
+    return FaiEntry(record["name"], record["length"], record["offset"], record["line_bases"], record["line_width"])
+
+
+def build_fasta_index(filename, block_size=1 << 24) -> dict:
+    """
+    Scan a file once in binary mode and return {seq_id: FaiEntry} in file order.
+
+    Args:
+        filename (str): The plain text FASTA file.
+        block_size (int, optional): Bytes scanned at a time, extended to the end of the last line.
+    """
+    _check_plain_text(filename)
+    index = {}
+    record = None  # the record that continues in the next block
+    offset = 0  # byte offset of the block
+    with open(filename, "rb") as fasta_file:
+        while block := fasta_file.read(block_size):
+            if not block.endswith(b"\n"):
+                block += fasta_file.readline()  # a block always ends with a whole line
+            lines = _block_lines(block)
+            if lines is None:  # whitespace inside the sequence lines needs the rules of the line scanner
+                return _scan_fasta_lines(filename)
+            record = _index_block(block, offset, lines, index, record)
+            offset += len(block)
+    if record is not None:
+        index[record["name"]] = _finish_entry(record)
+    return index
+
+
+def _block_lines(block):
+    # (starts, ends, lengths, bases, has_newline, is_header) of every line in a block, where ends and lengths
+    # include the line ending, or None when a sequence line holds a space, tab or lone carriage return
+    data = np.frombuffer(block, dtype=np.uint8)
+    ends = np.flatnonzero(data == NEWLINE) + 1
+    if len(ends) == 0 or ends[-1] != len(data):  # the last line of the file has no newline
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1]))
+    is_header = data[starts] == HEADER
+    if any(space in block for space in (b" ", b"\t", b"\v", b"\f")) or block.count(b"\r") != block.count(b"\r\n"):
+        # only header lines may hold whitespace, the name is stripped like in the line scanner
+        carriage_returns = np.flatnonzero(data == CARRIAGE_RETURN)
+        following = data[np.minimum(carriage_returns + 1, len(data) - 1)]
+        lone = carriage_returns[(carriage_returns + 1 == len(data)) | (following != NEWLINE)]
+        spaces = np.flatnonzero(np.isin(data, np.frombuffer(b" \t\v\f", dtype=np.uint8)))
+        if not is_header[np.searchsorted(ends, np.concatenate((spaces, lone)), side="right")].all():
+            return None
+    lengths = ends - starts
+    has_newline = data[ends - 1] == NEWLINE
+    has_return = has_newline & (lengths >= 2) & (data[np.maximum(ends - 2, 0)] == CARRIAGE_RETURN)
+    bases = lengths - has_newline - has_return
+    return starts, ends, lengths, bases, has_newline, is_header
+
+
+def _index_block(block, offset, lines, index, record):
+    # add the records that end in this block to the index and return the record that continues after it
+    starts, ends, lengths, bases, has_newline, is_header = lines
+    headers = np.flatnonzero(is_header)
+    segment = np.cumsum(is_header)  # 0: lines of the record from the previous block, j + 1: record of header j
+    n_segments = len(headers) + 1
+    segment_starts = np.concatenate(([0], headers + 1))
+    segment_ends = np.append(headers, len(starts))  # one past the last sequence line of each segment
+    has_lines = segment_starts < segment_ends
+    first = np.minimum(segment_starts, len(starts) - 1)
+
+    # line width of every segment: taken from its first line, or from the record when it started earlier
+    continued = record is not None and record["previous_bases"] is not None
+    segment_bases = np.where(has_lines, bases[first], 0)
+    segment_widths = np.where(has_lines, lengths[first], 0)
+    previous = np.concatenate(([0], bases[:-1]))  # bases of the line before, within a segment
+    is_first = np.zeros(len(starts), dtype=bool)
+    is_first[segment_starts[has_lines]] = True
+    if continued:
+        segment_bases[0], segment_widths[0] = record["line_bases"], record["line_width"]
+        if has_lines[0]:
+            previous[0] = record["previous_bases"]
+            is_first[0] = False
+
+    # the rules of the line scanner: every line but the last has line_bases bases and the same line ending,
+    # the last one may be shorter, and only blank lines may follow it
+    line_bases, line_width = segment_bases[segment], segment_widths[segment]
+    sequence = ~is_header
+    irregular = sequence & ~is_first & (bases > 0) & (
+        (bases > line_bases) | (previous < line_bases) | (has_newline & (lengths - bases != line_width - line_bases)))
+    irregular |= sequence & is_first & (bases == 0)  # a blank first line
+    segment_lengths = np.bincount(segment[sequence], weights=bases[sequence], minlength=n_segments).astype(np.int64)
+    segment_irregular = np.bincount(segment[irregular], minlength=n_segments) > 0
+    last_bases = bases[np.maximum(segment_ends - 1, 0)]
+
+    def extend(record, position):
+        # add the lines of one segment to a record that is still open
+        if not has_lines[position]:
+            return
+        if record["previous_bases"] is None:
+            record["line_bases"], record["line_width"] = int(segment_bases[position]), int(segment_widths[position])
+        record["length"] += int(segment_lengths[position])
+        record["regular"] = record["regular"] and not segment_irregular[position]
+        record["previous_bases"] = int(last_bases[position])
+
+    if record is not None:  # lines before the first header are not part of a record
+        extend(record, 0)
+    if len(headers) == 0:
+        return record
+    if record is not None:
+        index[record["name"]] = _finish_entry(record)
+
+    names = [block[start:end].strip()[1:].upper().decode("ascii", "replace")
+             for start, end in zip(starts[headers].tolist(), ends[headers].tolist())]
+    offsets = offset + ends[headers]
+    # records that start and end in this block go straight into the index, one column at a time
+    regular = ~segment_irregular[1:-1]
+    columns = (names[:-1], segment_lengths[1:-1].tolist(), offsets[:-1].tolist(),
+               np.where(regular, segment_bases[1:-1], 0).tolist(), np.where(regular, segment_widths[1:-1], 0).tolist())
+    index.update(zip(names[:-1], starmap(FaiEntry, zip(*columns))))
+
+    record = {"name": names[-1], "length": 0, "offset": int(offsets[-1]),
+              "line_bases": 0, "line_width": 0, "regular": True, "previous_bases": None}
+    extend(record, n_segments - 1)
+    return record
+
+
+def _scan_fasta_lines(filename) -> dict:
+    # line by line scan for files with spaces or tabs in the sequence lines
+    index = {}
+    record = None  # the record that is being scanned
+    offset = 0  # byte offset of the current line
+
+    with open(filename, "rb") as fasta_file:
+        for line in fasta_file:
+            stripped = line.strip()
+            if stripped.startswith(b">"):
+                if record is not None:
+                    index[record["name"]] = _finish_entry(record)
+                name = stripped[1:].upper().decode("ascii", "replace")  # the same seq_id as iter_dna_records
+                record = {"name": name, "length": 0, "offset": offset + len(line),
+                          "line_bases": 0, "line_width": 0, "regular": True, "ended": False}
+            elif record is not None:
+                bases = len(stripped)
+                if bases != len(line.rstrip(b"\r\n")):  # leading spaces or tabs break the offset arithmetic
+                    record["regular"] = False
+                if bases == 0:  # blank line: only allowed after the last line of the sequence
+                    record["regular"] = record["regular"] and record["length"] > 0
+                    record["ended"] = True
+                elif record["ended"]:  # more bases after a short or blank line
+                    record["regular"] = False
+                elif record["line_bases"] == 0:  # the first line sets the line width of the record
+                    record["line_bases"], record["line_width"] = bases, len(line)
+                elif bases > record["line_bases"] or (
+                        line.endswith(b"\n") and len(line) - bases != record["line_width"] - record["line_bases"]):
+                    record["regular"] = False  # longer line or different line ending
+                elif bases < record["line_bases"]:  # a shorter line must be the last one
+                    record["ended"] = True
+                record["length"] += bases
+            offset += len(line)
+    if record is not None:
+        index[record["name"]] = _finish_entry(record)
+    return index
+
+
+def write_fasta_index(index, fai_filename) -> None:
+    """Write an index as tab separated text, one sequence per line."""
+    with open(fai_filename, "w") as fai_file:
+        for entry in index.values():
+            fai_file.write("\t".join(str(value) for value in entry) + "\n")
+
+
+def read_fasta_index(fai_filename) -> dict:
+    """Read an index written by write_fasta_index back into a dictionary."""
+    index = {}
+    with open(fai_filename, "r") as fai_file:
+        for line in fai_file:
+            name, *numbers = line.rstrip("\n").split("\t")
+            index[name] = FaiEntry(name, *(int(number) for number in numbers))
+    return index
+
+
+def has_fasta_index(filename) -> bool:
+    """Return True if the .fai file of a file exists and is not older than the file."""
+    fai_filename = filename + ".fai"
+    return os.path.exists(fai_filename) and os.path.getmtime(fai_filename) >= os.path.getmtime(filename)
+
+
+def load_fasta_index(filename) -> dict:
+    """Return the index of a file, building and saving it only when the .fai file is missing or older."""
+    _check_plain_text(filename)  # also ignores a .fai file that was built from compressed bytes
+    if has_fasta_index(filename):
+        return read_fasta_index(filename + ".fai")
+    index = build_fasta_index(filename)
+    try:
+        write_fasta_index(index, filename + ".fai")
+    except OSError:  # read-only directory: keep the index in memory only
+        pass
+    return index
+
+
+class IndexedFasta:
+    """Random access to the sequences of a FASTA file through its index and a memory map."""
+
+    def __init__(self, filename, index=None):
+        """
+        Open a FASTA file and load (or build) its index.
+
+        Args:
+            filename (str): The plain text FASTA file.
+            index (dict, optional): {seq_id: FaiEntry} entries that were loaded already, e.g. sent
+                to a worker process. The .fai file is then neither read nor built.
+        """
+        self.filename = filename
+        if index is None:
+            self.index = load_fasta_index(filename)
+        else:
+            _check_plain_text(filename)
+            self.index = index
+        self._file = open(filename, "rb")
+        if os.path.getsize(filename) > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""  # an empty file cannot be memory-mapped
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def close(self) -> None:
+        """Release the memory map and the file handle."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def fetch_bytes(self, seq_id, start=0, end=None) -> bytes:
+        """Return bases start..end of a sequence as uppercase bytes."""
+        if seq_id not in self.index:
+            raise KeyError(f"Sequence '{seq_id}' is not in {self.filename}.")
+        entry = self.index[seq_id]
+        start = max(start, 0)
+        end = entry.length if end is None else min(end, entry.length)
+        if start >= end:
+            return b""
+        if entry.line_bases:  # even lines: the byte offset of any base is plain arithmetic
+            first = entry.offset + (start // entry.line_bases) * entry.line_width + start % entry.line_bases
+            last = entry.offset + ((end - 1) // entry.line_bases) * entry.line_width + (end - 1) % entry.line_bases + 1
+            raw = self._map[first:last]
+            if entry.line_width != entry.line_bases:
+                raw = raw.translate(None, b"\r\n")
+            return raw.upper()
+        stop = self._map.find(b"\n>", entry.offset)  # uneven lines: read up to the next header and clean the lines
+        raw = self._map[entry.offset:len(self._map) if stop == -1 else stop]
+        return b"".join(line.strip() for line in raw.splitlines())[start:end].upper()
+
+    def fetch(self, seq_id, start=0, end=None) -> str:
+        """Return bases start..end of a sequence as an uppercase string."""
+        return self.fetch_bytes(seq_id, start, end).decode("ascii", "replace")
+
+
+def iter_indexed_records(filename, seq_ids=None):
+    """
+    Yield (seq_id, sequence) records through the FASTA index, reading only the requested sequences.
+
+    Requested IDs are uppercased like the IDs of iter_dna_records. IDs that are not in
+    the file are reported and skipped, the same way as a missing file. gzip and bgzip
+    files cannot be memory-mapped: they are read with iter_dna_records, and the
+    requested sequences come in file order.
+    """
+    try:
+        if is_gzip(filename):
+            yield from _iter_compressed_records(filename, seq_ids)
+            return
+        with IndexedFasta(filename) as fasta:
+            for seq_id in (list(fasta) if seq_ids is None else [seq_id.upper() for seq_id in seq_ids]):
+                if seq_id not in fasta.index:
+                    print(f"Error: The sequence '{seq_id}' could not be found in '{filename}'.")
+                    continue
+                yield seq_id, fasta.fetch(seq_id)
+    except FileNotFoundError:
+        print(f"Error: The file '{filename}' could not be found.")
+
+
+def _iter_compressed_records(filename, seq_ids):
+    # stream a compressed file and keep only the requested records, then report the ones that were not found
+    wanted = None if seq_ids is None else {seq_id.upper() for seq_id in seq_ids}
+    for seq_id, seq in iter_dna_records(filename):
+        if wanted is None:
+            yield seq_id, seq
+        elif seq_id in wanted:
+            wanted.discard(seq_id)
+            yield seq_id, seq
+    for seq_id in [seq_id.upper() for seq_id in seq_ids or []]:
+        if seq_id in wanted:
+            print(f"Error: The sequence '{seq_id}' could not be found in '{filename}'.")
@@ -0,0 +1,131 @@
+"""
+k-mer, dinucleotide and GC-content analysis.
+
+KmerAnalyzer reads (seq_id, sequence) records from iter_dna_records (or any other
+reader) in one streaming pass. Each record is processed in chunks. Every chunk becomes
+an array of 2-bit codes (A=0, C=1, G=2, T=3), and each k-mer becomes one integer of
+2k bits. These integers index a flat NumPy counter array, so no dictionary of
+substrings is built. k-mers that contain N or another letter are skipped.
+
+Memory use, in addition to the record that is being read:
+
+    k      k-mer counter (4**k x uint64)
+    1-6    at most 32 KiB
+    7      128 KiB
+    8      512 KiB
+    9      2 MiB
+    10     8 MiB
+    11     32 MiB
+    12     128 MiB
+
+Each chunk also needs about 15 bytes per base for temporary arrays, which is about
+60 MiB with the default chunk_size of 4 Mi bases. The GC windows take 4 bytes per window.
+"""
+
+import numpy as np
+
+BASE_CODES = np.full(256, 4, dtype=np.uint8)  # byte value -> 2-bit code, 4 marks anything that is not A, C, G or T
+for code, letter in enumerate("ACGT"):
+    BASE_CODES[ord(letter)] = BASE_CODES[ord(letter.lower())] = code
+
+
+def encode_bases(dna_sequence):
+    """Turn a str or bytes sequence into a uint8 array of 2-bit codes (0-3) and 4 for other letters."""
+    if isinstance(dna_sequence, str):
+        dna_sequence = dna_sequence.encode("ascii", "replace")
+    return BASE_CODES[np.frombuffer(dna_sequence, dtype=np.uint8)]
+
+
+def decode_kmer(code, k) -> str:
+    """Turn a 2-bit packed k-mer code back into letters."""
+    return "".join("ACGT"[(code >> (2 * (k - 1 - position))) & 3] for position in range(k))
+
+
+def count_kmer_codes(codes, k, n_windows, counts):
+    """Add the k-mers that start at the first n_windows positions of codes to the counter array."""
+    if n_windows <= 0:
+        return
+    kmers = np.zeros(n_windows, dtype=np.uint32)  # 2k bits per k-mer, at most 24 bits for k = 12
+    for position in range(k):
+        kmers = (kmers << 2) | (codes[position:position + n_windows] & 3)
+    invalid = np.concatenate(([0], np.cumsum(codes[:n_windows + k - 1] > 3, dtype=np.int64)))
+    kmers = kmers[invalid[k:k + n_windows] == invalid[:n_windows]]  # keep k-mers without N or other letters
+    if len(kmers) >= len(counts):  # dense chunk: one bincount over all codes
+        counts += np.bincount(kmers, minlength=len(counts)).astype(np.uint64)
+    else:  # sparse chunk (large k): only touch the codes that occur
+        values, value_counts = np.unique(kmers, return_counts=True)
+        counts[values] += value_counts.astype(np.uint64)
+
+
+class KmerAnalyzer:
+    """Streaming k-mer, dinucleotide and GC-window statistics over (seq_id, sequence) records."""
+
+    def __init__(self, k=6, window=100, step=None, chunk_size=1 << 22):
+        """
+        Create an empty analyzer.
+
+        Args:
+            k (int, optional): k-mer length, 1 to 12. Defaults to 6.
+            window (int, optional): Bases per GC window. Defaults to 100.
+            step (int, optional): Distance between window starts. Defaults to window.
+            chunk_size (int, optional): Bases processed at a time.
+        """
+        if not 1 <= k <= 12:
+            raise ValueError(f"k must be between 1 and 12, got {k}.")
+        self.k = k
+        self.window = window
+        self.step = step or window
+        self.chunk_size = max(self.step, chunk_size // self.step * self.step)  # chunks start on a window start
+        self.kmer_counts = np.zeros(4 ** k, dtype=np.uint64)
+        self.dinucleotide_counts = np.zeros(16, dtype=np.uint64)
+        self.base_counts = np.zeros(4, dtype=np.uint64)
+        self.gc_windows = {}  # seq_id -> GC fraction of every window (NaN for windows without A, C, G or T)
+
+    def add(self, seq_id, dna_sequence) -> None:
+        """Add one record to the statistics."""
+        length = len(dna_sequence)
+        overlap = max(self.k, 2, self.window) - 1  # extra bases so k-mers and windows can cross the chunk end
+        gc_parts = []
+        for start in range(0, length, self.chunk_size):
+            codes = encode_bases(dna_sequence[start:start + self.chunk_size + overlap])
+            chunk_length = min(self.chunk_size, length - start)
+            count_kmer_codes(codes, self.k, min(chunk_length, len(codes) - self.k + 1), self.kmer_counts)
+            count_kmer_codes(codes, 2, min(chunk_length, len(codes) - 1), self.dinucleotide_counts)
+            self.base_counts += np.bincount(codes[:chunk_length], minlength=5)[:4].astype(np.uint64)
+
+            window_starts = np.arange(0, chunk_length, self.step)
+            window_starts = window_starts[window_starts + self.window <= len(codes)]
+            if len(window_starts):
+                gc = np.concatenate(([0], np.cumsum((codes == 1) | (codes == 2), dtype=np.int64)))
+                acgt = np.concatenate(([0], np.cumsum(codes < 4, dtype=np.int64)))
+                gc_count = gc[window_starts + self.window] - gc[window_starts]
+                acgt_count = acgt[window_starts + self.window] - acgt[window_starts]
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    gc_parts.append((gc_count / acgt_count).astype(np.float32))
+        self.gc_windows[seq_id] = np.concatenate(gc_parts) if gc_parts else np.zeros(0, dtype=np.float32)
+
+    def top_kmers(self, n=10) -> list:
+        """Return the n most frequent k-mers as (kmer, count) pairs."""
+        codes = np.argsort(self.kmer_counts, kind="stable")[::-1][:n]
+        return [(decode_kmer(int(code), self.k), int(self.kmer_counts[code])) for code in codes if self.kmer_counts[code]]
+
+    def dinucleotide_frequencies(self) -> dict:
+        """Return {dinucleotide: count} for all 16 dinucleotides."""
+        return {decode_kmer(code, 2): int(count) for code, count in enumerate(self.dinucleotide_counts)}
+
+    def dinucleotide_ratios(self) -> dict:
+        """Return observed/expected ratios f(xy) / (f(x) f(y)), e.g. the CpG ratio as ratios["CG"]."""
+        base_frequencies = self.base_counts / max(self.base_counts.sum(), 1)
+        pair_frequencies = self.dinucleotide_counts / max(self.dinucleotide_counts.sum(), 1)
+        expected = np.outer(base_frequencies, base_frequencies).ravel()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratios = pair_frequencies / expected
+        return {decode_kmer(code, 2): float(ratio) for code, ratio in enumerate(ratios)}
+
+
+def analyze_kmers(records, k=6, window=100, step=None) -> KmerAnalyzer:
+    """Run a KmerAnalyzer over (seq_id, sequence) records, for example analyze_kmers(iter_dna_records(filename))."""
+    analyzer = KmerAnalyzer(k, window, step)
+    for seq_id, seq in records:
+        analyzer.add(seq_id, seq)
+    return analyzer
@@ -0,0 +1,121 @@
+"""
+2-bit packed DNA sequences.
+
+PackedSequence stores four bases per byte, using the same 2-bit codes as the k-mer
+engine, and keeps an int64 array of (start, end) runs for N. Any other letter is stored as N.
+"""
+
+import numpy as np
+
+from .kmers import encode_bases
+from .reader import open_dna_file
+
+BYTE_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)  # position of the four 2-bit codes inside one byte
+LETTERS = np.frombuffer(b"ACGTN", dtype=np.uint8)  # code -> letter, code 4 is N
+PACKED_CODES = (np.arange(256, dtype=np.uint8)[:, None] >> BYTE_SHIFTS) & 3  # packed byte -> its four codes
+PACKED_BASE_COUNTS = np.stack([(PACKED_CODES == code).sum(axis=1) for code in range(4)], axis=1)  # packed byte -> A/C/G/T counts
+
+
+class PackedSequence:
+    """DNA sequence stored with 2 bits per base and an (n, 2) int64 array of (start, end) runs of N."""
+
+    def __init__(self, dna_sequence=""):
+        """
+        Pack a sequence.
+
+        Args:
+            dna_sequence (str | bytes): The bases, in upper or lower case.
+        """
+        self._pack(encode_bases(dna_sequence))
+
+    @classmethod
+    def from_codes(cls, codes):
+        """Build a PackedSequence from a uint8 array of codes (0-3 for A/C/G/T, anything else is N)."""
+        sequence = cls.__new__(cls)
+        sequence._pack(codes)
+        return sequence
+
+    def _pack(self, codes):
+        # store the codes four per byte and remember where the N runs are
+        self._length = len(codes)
+        is_n = np.concatenate(([False], codes > 3, [False]))
+        edges = np.flatnonzero(is_n[1:] != is_n[:-1])  # starts and ends of the N runs, alternating
+        self.n_runs = edges.astype(np.int64).reshape(-1, 2)
+        codes = np.where(codes > 3, 0, codes).astype(np.uint8)  # N is stored as A and restored from n_runs
+        codes = np.concatenate((codes, np.zeros(-len(codes) % 4, dtype=np.uint8))).reshape(-1, 4)
+        self._packed = (codes << BYTE_SHIFTS).sum(axis=1, dtype=np.uint8).tobytes()
+
+    def codes(self, start=0, end=None):
+        """Return the codes of bases start..end as a uint8 array, with 4 for N."""
+        end = self._length if end is None else end
+        first_byte = start // 4
+        packed = np.frombuffer(self._packed, dtype=np.uint8)[first_byte:(end + 3) // 4]
+        codes = ((packed[:, None] >> BYTE_SHIFTS) & 3).ravel()[start - first_byte * 4:end - first_byte * 4]
+        overlapping = self.n_runs[(self.n_runs[:, 0] < end) & (self.n_runs[:, 1] > start)]
+        for run_start, run_end in overlapping.tolist():
+            codes[max(run_start, start) - start:min(run_end, end) - start] = 4
+        return codes
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, end, step = index.indices(self._length)
+            if step == 1:
+                return PackedSequence.from_codes(self.codes(start, max(start, end)))
+            return PackedSequence(str(self)[index])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PackedSequence index out of range")
+        return "ACGTN"[self.codes(index, index + 1)[0]]
+
+    def __str__(self) -> str:
+        return LETTERS[self.codes()].tobytes().decode("ascii")
+
+    def __repr__(self) -> str:
+        preview = str(self[:20]) + ("..." if self._length > 20 else "")
+        return f"PackedSequence('{preview}', length={self._length})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedSequence):
+            return NotImplemented
+        return self._length == other._length and np.array_equal(self.n_runs, other.n_runs) and self._packed == other._packed
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the packed bases and the N runs."""
+        return len(self._packed) + self.n_runs.nbytes
+
+    def count(self) -> dict:
+        """Return {letter: count} for A, C, G, T and N without unpacking the sequence."""
+        base_counts = np.bincount(np.frombuffer(self._packed, dtype=np.uint8), minlength=256) @ PACKED_BASE_COUNTS
+        n_count = int((self.n_runs[:, 1] - self.n_runs[:, 0]).sum())
+        padding = len(self._packed) * 4 - self._length
+        counts = {letter: int(count) for letter, count in zip("ACGT", base_counts)}
+        counts["A"] -= n_count + padding  # N and the padding at the end are stored as A
+        counts["N"] = n_count
+        return counts
+
+
+def iter_packed_records(filename):
+    """Like iter_dna_records, but yields (seq_id, PackedSequence) and never makes uppercase copies of the lines."""
+    seq_id = ""
+    chunks = []
+
+    try:
+        with open_dna_file(filename, binary=True) as dna_file:
+            for line in dna_file:
+                line = line.strip()
+                if line.startswith(b">"):
+                    if seq_id:
+                        yield seq_id, PackedSequence(b"".join(chunks))
+                    seq_id = line[1:].upper().decode("ascii", "replace")
+                    chunks = []
+                else:
+                    chunks.append(line)
+            if seq_id:
+                yield seq_id, PackedSequence(b"".join(chunks))
+    except FileNotFoundError:
+        print(f"Error: The file '{filename}' could not be found.")
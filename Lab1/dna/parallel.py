@@ -0,0 +1,164 @@
+"""
+Process-pool counting of many files and of single huge sequences.
+
+process_dna_files spreads the records of many files over a process pool.
+count_file_chunked splits one sequence, or a whole file, into byte-range chunks.
+Workers read through a memory map, so only file names and index entries (IDs and
+offsets) are sent between processes. Results always come back in serial order.
+
+Only files with an up-to-date .fai file are split into batches by the parent process.
+A file without one is a single task: its worker builds and saves the index, so on a
+first run the indexes of many files are built in parallel and the next run can batch
+them. gzip and bgzip files have no byte offsets to share out: each one is read whole by
+one worker with the streaming reader, and count_file_chunked counts them serially.
+"""
+
+import glob
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .counting import count_nucleotides, merge_counts
+from .index import IndexedFasta, has_fasta_index, load_fasta_index
+from .reader import is_gzip, iter_dna_records
+
+
+def expand_dna_files(files) -> list:
+    """Return the files of one file name or glob pattern, or of a list of them, in a stable order."""
+    if isinstance(files, str):
+        files = [files]
+    filenames = []
+    for pattern in files:
+        matches = sorted(glob.glob(pattern))  # sorted so the order never depends on the file system
+        filenames.extend(matches if matches else [pattern])  # keep names without matches so a missing file is reported
+    return filenames
+
+
+def _count_indexed_batch(task):
+    # worker: memory-map one file and count a batch of its sequences from the index entries of the batch,
+    # so the .fai file is not read again (or rebuilt, in a read-only directory) for every task
+    filename, entries = task
+    with IndexedFasta(filename, {entry.name: entry for entry in entries}) as fasta:
+        return [count_nucleotides(fasta.fetch_bytes(entry.name)) for entry in entries]
+
+
+def _count_task(task):
+    # worker: count a batch of index entries, or a whole file when entries is None, and return [(seq_id, counts), ...]
+    filename, entries, max_sequences = task
+    if entries is None and is_gzip(filename):
+        return [(seq_id, count_nucleotides(seq)) for seq_id, seq in islice(iter_dna_records(filename), max_sequences)]
+    if entries is None:  # no .fai file yet: build and save it here instead of in the parent process
+        with IndexedFasta(filename) as fasta:
+            entries = list(fasta.index.values())[:max_sequences]
+            return [(entry.name, count_nucleotides(fasta.fetch_bytes(entry.name))) for entry in entries]
+    return list(zip((entry.name for entry in entries), _count_indexed_batch((filename, entries))))
+
+
+def process_dna_files(files, max_sequences=None, workers=None, batch_bases=1 << 22) -> list:
+    """
+    Count the sequences of many files in a process pool.
+
+    Records are grouped into tasks of roughly batch_bases bases, so many short records
+    share a task and a giant record gets its own. A file without an up-to-date .fai file,
+    or a gzip or bgzip file, is one task.
+
+    Args:
+        files (str | list): File names or glob patterns.
+        max_sequences (int, optional): Only count the first max_sequences records of each file.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        batch_bases (int, optional): Target number of bases per task.
+
+    Returns:
+        list: [(filename, seq_id, counts), ...] in the same order as the serial process_dna_file.
+    """
+    return list(iter_dna_files_counts(files, max_sequences, workers, batch_bases))
+
+
+def iter_dna_files_counts(files, max_sequences=None, workers=None, batch_bases=1 << 22):
+    """Like process_dna_files, but yield each (filename, seq_id, counts) result as soon as its task is done, in order."""
+    tasks = []
+    for filename in expand_dna_files(files):
+        try:
+            if is_gzip(filename) or not has_fasta_index(filename):  # one worker indexes or streams the whole file
+                tasks.append((filename, None, max_sequences or None))
+                continue
+            index = load_fasta_index(filename)  # read once here, the workers get the entries of their batch
+        except FileNotFoundError:
+            print(f"Error: The file '{filename}' could not be found.")
+            continue
+        entries = list(index.values())
+        if max_sequences:
+            entries = entries[:max_sequences]
+        batch, batch_size = [], 0
+        for entry in entries:
+            batch.append(entry)
+            batch_size += entry.length
+            if batch_size >= batch_bases:
+                tasks.append((filename, batch, None))
+                batch, batch_size = [], 0
+        if batch:
+            tasks.append((filename, batch, None))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for task, task_counts in zip(tasks, executor.map(_count_task, tasks)):  # map keeps task order
+            for seq_id, counts in task_counts:
+                yield task[0], seq_id, counts
+
+
+def _count_file_range(task):
+    # worker: count the bases in bytes start..end of a file and skip every header line that overlaps the range
+    filename, start, end = task
+    with open(filename, "rb") as fasta_file, mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        partial_counts = []
+        position = start
+        line_start = mapped.rfind(b"\n", 0, start) + 1  # start of the line that contains the first byte of the range
+        if mapped[line_start:line_start + 1] == b">":  # the range starts inside a header line
+            line_end = mapped.find(b"\n", start, end)
+            position = end if line_end == -1 else line_end + 1
+        while position < end:
+            if mapped[position:position + 1] == b">":  # position is always at a line start after a header was found
+                line_end = mapped.find(b"\n", position, end)
+                position = end if line_end == -1 else line_end + 1
+                continue
+            header = mapped.find(b"\n>", position, end)
+            stop = end if header == -1 else header + 1
+            partial_counts.append(count_nucleotides(mapped[position:stop]))  # line breaks and whitespace are ignored by the counter
+            position = stop
+        return merge_counts(partial_counts)
+
+
+def count_file_chunked(filename, seq_id=None, chunk_size=1 << 26, workers=None) -> dict:
+    """
+    Count one sequence, or the whole file, in byte-range chunks on a process pool.
+
+    A chunk may start or end anywhere in a line. Header lines are skipped, also when a
+    header started in the previous chunk.
+
+    Args:
+        filename (str): The FASTA file. gzip and bgzip files are counted serially with the streaming reader.
+        seq_id (str, optional): The sequence to count. Defaults to all sequences of the file.
+        chunk_size (int, optional): Bytes per chunk.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+    """
+    if is_gzip(filename):  # compressed bytes cannot be split into ranges
+        return merge_counts(count_nucleotides(seq) for record_id, seq in iter_dna_records(filename)
+                            if seq_id is None or record_id == seq_id.upper())
+    if seq_id is None:
+        start, end = 0, os.path.getsize(filename)
+    else:
+        entry = load_fasta_index(filename)[seq_id.upper()]  # IDs are stored uppercase
+        start = entry.offset
+        with open(filename, "rb") as fasta_file, mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            next_header = mapped.find(b"\n>", start)  # the sequence ends where the next header starts
+            end = len(mapped) if next_header == -1 else next_header + 1
+    tasks = [(filename, chunk_start, min(chunk_start + chunk_size, end)) for chunk_start in range(start, end, chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_counts(executor.map(_count_file_range, tasks))
+
+
+def count_sequence_chunked(dna_sequence, chunk_size=1 << 26, workers=None) -> dict:
+    """Count an in-memory sequence in chunks on a process pool (every chunk is copied to a worker once)."""
+    chunks = (dna_sequence[chunk_start:chunk_start + chunk_size] for chunk_start in range(0, len(dna_sequence), chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_counts(executor.map(count_nucleotides, chunks))
@@ -0,0 +1,75 @@
+"""
+The process_dna_file pipeline: read, count, print and chart the sequences of one file.
+
+The chart and export modules are imported only when they are used, so printing the
+counts does not load matplotlib or pyarrow.
+"""
+
+from collections import deque
+from itertools import islice
+
+from .counting import count_nucleotides
+from .index import iter_indexed_records
+from .reader import iter_dna_records, iter_dna_records_threaded
+
+
+def process_dna_file(filename, max_sequences=None, seq_ids=None, report=None, export=None, plot=True,
+                     cache=None, threaded=False) -> None:
+    """
+    Count the nucleotides of every sequence in a file, print them and chart them.
+
+    Args:
+        filename (str): The DNA file (plain, gzip or bgzip).
+        max_sequences (int, optional): Stop after this many records.
+        seq_ids (list, optional): Read only these sequences, through the FASTA index.
+        report (str, optional): A .pdf or .png file name, all charts go into one headless report
+            instead of one plt.show() per sequence.
+        export (str, optional): A .parquet or .npz file name, the counts are also saved as columns,
+            streamed to the file in batches while the records are counted.
+        plot (bool, optional): Show a chart per sequence when no report is written. Defaults to True.
+        cache (CountCache, optional): Take the counts of an unchanged file from this cache instead of
+            reading it again. Not used together with seq_ids.
+        threaded (bool, optional): Read and parse the file in a background thread while the previous
+            record is counted. Useful for gzip and bgzip files, where decompression is the slow part.
+    """
+    print(f"Processing file: {filename}")
+    if cache is not None and seq_ids is None:
+        results = cache.counts(filename, max_sequences)  # only read and counted when the file changed
+    else:
+        if seq_ids is None:
+            # stream the records one at a time instead of loading the whole file
+            records = iter_dna_records_threaded(filename) if threaded else iter_dna_records(filename)
+        else:
+            records = iter_indexed_records(filename, seq_ids)  # jump straight to the requested sequences
+        if max_sequences:
+            records = islice(records, max_sequences)
+        # count A, C, G, T, N and other letters of each record in one pass
+        results = ((seq_id, count_nucleotides(seq)) for seq_id, seq in records)
+
+    report_results = []  # (seq_id, counts) pairs for the report, only the small count dictionaries are kept
+    counted = _show_counts(filename, results, report_results if report else None, plot)
+    if export:
+        from .export import export_counts
+        written = export_counts(counted, export)  # written batch by batch while the records are counted
+        print(f"Counts exported to {written}")
+    else:
+        deque(counted, maxlen=0)  # run the counting loop without keeping the results
+
+    if report:
+        from .report import write_report
+        for page_file in write_report(report_results, report, filename):
+            print(f"Report written to {page_file}")
+
+
+def _show_counts(filename, results, report_results, plot):
+    # print and chart the counts of every record, passing (seq_id, all counts) on to the export
+    for seq_id, all_counts in results:
+        counts = {letter: all_counts[letter] for letter in "ACGT"}  # the same letters as count_letters
+        print(f"Nucleotide counts for {seq_id} (from {filename}):")
+        print(counts)
+        if report_results is not None:
+            report_results.append((seq_id, counts))
+        elif plot:
+            from .report import visualize_counts
+            visualize_counts(counts, seq_id, filename)
+        yield seq_id, all_counts
@@ -0,0 +1,188 @@
+"""
+Reading DNA files.
+
+Plain, gzip and bgzip (BGZF) FASTA files are opened through open_dna_file and read
+one (seq_id, sequence) record at a time, so only one sequence is held in memory.
+"""
+
+import gzip
+import io
+import os
+import queue
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def is_bgzf(header: bytes) -> bool:
+    """Return True if header is the start of a BGZF file (a gzip member with a "BC" extra subfield)."""
+    return header[:4] == b"\x1f\x8b\x08\x04" and len(header) >= 18 and header[12:14] == b"BC"
+
+
+def is_gzip(filename) -> bool:
+    """Return True if a file is gzip or bgzip compressed (every BGZF file is also a gzip file)."""
+    with open(filename, "rb") as probe:
+        return probe.read(2) == GZIP_MAGIC
+
+
+def read_bgzf_blocks(raw_file):
+    """Yield the compressed deflate data of every BGZF block in a binary file."""
+    while True:
+        header = raw_file.read(12)
+        if not header:
+            return
+        if len(header) < 12 or header[:4] != b"\x1f\x8b\x08\x04":
+            raise ValueError("Not a BGZF block.")
+        extra = raw_file.read(int.from_bytes(header[10:12], "little"))
+        block_size = None
+        position = 0
+        while position + 4 <= len(extra):  # look for the BC subfield that stores the block size
+            length = int.from_bytes(extra[position + 2:position + 4], "little")
+            if extra[position:position + 2] == b"BC":
+                block_size = int.from_bytes(extra[position + 4:position + 6], "little") + 1
+            position += 4 + length
+        if block_size is None:
+            raise ValueError("BGZF block without a BC field.")
+        rest = raw_file.read(block_size - len(header) - len(extra))
+        yield rest[:-8]  # the last 8 bytes are the CRC32 and the uncompressed size
+
+
+def iter_bgzf_data(filename, threads=None):
+    """
+    Yield the decompressed blocks of a BGZF file in order.
+
+    Up to 4 x threads blocks are decompressed at the same time. zlib releases the GIL,
+    so the blocks really are decompressed in parallel.
+
+    Args:
+        filename (str): The BGZF file.
+        threads (int, optional): Number of decompression threads. Defaults to the number of CPUs.
+    """
+    threads = threads or os.cpu_count() or 1
+    with open(filename, "rb") as raw_file, ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = deque()
+        for data in read_bgzf_blocks(raw_file):
+            pending.append(executor.submit(zlib.decompress, data, -15))  # -15: raw deflate data without a header
+            if len(pending) >= 4 * threads:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class BgzfReader(io.RawIOBase):
+    """Read-only binary stream over the decompressed content of a BGZF file."""
+
+    def __init__(self, filename, threads=None):
+        self._blocks = iter_bgzf_data(filename, threads)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            self._buffer = next(self._blocks, None)
+            if self._buffer is None:  # end of the file
+                self._buffer = b""
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        self._blocks.close()  # stops the thread pool and closes the file
+        super().close()
+
+
+def open_dna_file(filename, binary=False, threads=None):
+    """
+    Open a plain, gzip or bgzip DNA file.
+
+    Args:
+        filename (str): The file to open.
+        binary (bool, optional): Return a binary stream instead of text. Defaults to False.
+        threads (int, optional): Decompression threads for bgzip files.
+    """
+    with open(filename, "rb") as probe:
+        header = probe.read(18)
+    if is_bgzf(header):
+        stream = io.BufferedReader(BgzfReader(filename, threads), buffer_size=1 << 20)
+        return stream if binary else io.TextIOWrapper(stream)
+    if header[:2] == GZIP_MAGIC:
+        return gzip.open(filename, "rb" if binary else "rt")
+    return open(filename, "rb" if binary else "r")
+
+
+def iter_dna_records(filename):
+    """
+    Yield one (seq_id, sequence) record at a time from a DNA file.
+
+    Lines are collected in a list and joined once per record, which is linear in the
+    sequence length. IDs and sequences are uppercase.
+    """
+    seq_id = ""
+    chunks = []
+
+    try:
+        with open_dna_file(filename) as txt_file:
+            for line in txt_file:
+                line = line.strip().upper()
+                if line.startswith(">"):  # a header starts a new sequence
+                    if seq_id:
+                        yield seq_id, "".join(chunks)
+                    seq_id = line[1:]
+                    chunks = []
+                else:
+                    chunks.append(line)
+            if seq_id != "":
+                yield seq_id, "".join(chunks)
+    except FileNotFoundError:
+        print(f"Error: The file '{filename}' could not be found.")
+
+
+def read_dna_file(filename) -> dict:
+    """Read the whole DNA file into a dictionary {seq_id: sequence}."""
+    return dict(iter_dna_records(filename))
+
+
+def iter_dna_records_threaded(filename, queue_size=8):
+    """
+    Like iter_dna_records, but the file is read and parsed in a background thread.
+
+    The caller can count one record while the next one is read. At most queue_size
+    parsed records wait in memory.
+    """
+    records = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    finished = object()  # marks the end of the file in the queue
+    errors = []
+
+    def produce():
+        try:
+            for record in iter_dna_records(filename):
+                if stop.is_set():  # the caller stopped early
+                    return
+                records.put(record)
+        except Exception as error:  # handed to the caller instead of being lost in the thread
+            errors.append(error)
+        finally:
+            records.put(finished)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while (record := records.get()) is not finished:
+            yield record
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        while producer.is_alive():  # empty the queue so a waiting producer can finish
+            try:
+                records.get(timeout=0.1)
+            except queue.Empty:
+                pass
@@ -0,0 +1,92 @@
+"""
+Charts of nucleotide counts.
+
+matplotlib is only imported inside the functions, so importing this module (and
+running the command line tool without plots) does not pay for it.
+"""
+
+import os
+from itertools import islice, zip_longest
+
+REPORT_LETTERS = ["A", "C", "G", "T"]
+REPORT_COLORS = ["blue", "orange", "green", "red"]
+
+
+def visualize_counts(letter_count, seq_id, filename) -> None:
+    """Show the counts of one sequence as a bar chart in a pyplot window."""
+    import matplotlib.pyplot as plt
+
+    letters = list(letter_count.keys())
+    counts = list(letter_count.values())
+    plt.bar(letters, counts, color=REPORT_COLORS)
+    plt.xlabel("Nucleotide")
+    plt.ylabel("Count")
+    plt.title(f"Nucleotide Counts for {seq_id}\n(Source: {filename})")
+    plt.tight_layout()
+    plt.show()
+
+
+def write_report(results, output, filename="", rows=3, columns=3) -> list:
+    """
+    Render (seq_id, counts) results into pages of bar charts without a GUI.
+
+    The charts are drawn on one plain matplotlib Figure that is reused for every page.
+    Only the bar heights and titles change per page, so the time per page stays flat.
+
+    Args:
+        results (iterable): (seq_id, counts) pairs.
+        output (str): A .pdf file name for one multi-page PDF, any other name for numbered PNG pages.
+        filename (str, optional): Source file shown in the page title.
+        rows (int, optional): Rows of charts per page. Defaults to 3.
+        columns (int, optional): Columns of charts per page. Defaults to 3.
+
+    Returns:
+        list: The written files.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    results = iter(results)
+    page_results = list(islice(results, rows * columns))
+    if not page_results:  # nothing to draw, so no empty report is written
+        return []
+
+    figure = Figure(figsize=(4 * columns, 3 * rows), layout="constrained")
+    panels = []  # (axes, bars, title) for every panel, created once
+    for axes in figure.subplots(rows, columns, squeeze=False).ravel():
+        bars = axes.bar(REPORT_LETTERS, [0] * len(REPORT_LETTERS), color=REPORT_COLORS)
+        axes.set_xlabel("Nucleotide")
+        axes.set_ylabel("Count")
+        panels.append((axes, bars, axes.set_title("")))
+
+    is_pdf = output.lower().endswith(".pdf")
+    stem, extension = os.path.splitext(output)
+    written = []
+    pdf = PdfPages(output) if is_pdf else None
+    try:
+        page = 1
+        while page_results:
+            for panel, result in zip_longest(panels, page_results):
+                axes, bars, title = panel
+                axes.set_visible(result is not None)  # hide the panels that are not used on the last page
+                if result is None:
+                    continue
+                seq_id, counts = result
+                for bar, letter in zip(bars, REPORT_LETTERS):
+                    bar.set_height(counts.get(letter, 0))
+                axes.set_ylim(0, max(max(counts.get(letter, 0) for letter in REPORT_LETTERS), 1) * 1.1)
+                title.set_text(f"Nucleotide Counts for {seq_id}")
+            figure.suptitle(f"Source: {filename} (page {page})")
+            if is_pdf:
+                pdf.savefig(figure)
+            else:
+                written.append(f"{stem}_{page:03d}{extension or '.png'}")
+                figure.savefig(written[-1])
+            figure.set_layout_engine("none")  # keep the layout of the first page, so later pages skip the layout pass
+            page_results = list(islice(results, rows * columns))
+            page += 1
+    finally:
+        if pdf is not None:
+            pdf.close()
+            written.append(output)
+    return written
@@ -0,0 +1,52 @@
+"""
+Unit tests for the benchmark helpers of the dna package.
+
+This file verifies:
+- check_regressions reports throughput drops and memory growth beyond the tolerance only
+- metrics and scenarios that are not in the baseline are ignored
+- generate_synthetic_fasta writes the requested records, reproducibly
+"""
+
+import os
+import tempfile
+import unittest
+from dna.bench import check_regressions, generate_synthetic_fasta
+from dna.reader import read_dna_file
+
+
+class TestBench(unittest.TestCase):
+    def setUp(self):
+        self.baseline = {"short": {"parse_mb_per_s": 100.0, "count_mb_per_s": 500.0, "peak_rss_mb": 10.0}}
+
+    def test_no_regression(self):
+        results = {"short": {"parse_mb_per_s": 81.0, "count_mb_per_s": 900.0, "peak_rss_mb": 11.9}}
+        self.assertEqual(check_regressions(results, self.baseline, tolerance=0.2), [])
+
+    def test_regressions(self):
+        results = {"short": {"parse_mb_per_s": 79.0, "count_mb_per_s": 500.0, "peak_rss_mb": 12.1}}
+        messages = check_regressions(results, self.baseline, tolerance=0.2)
+        self.assertEqual(len(messages), 2)
+        self.assertTrue(messages[0].startswith("short: parse_mb_per_s 79.0"))
+        self.assertTrue(messages[1].startswith("short: peak_rss_mb 12.1"))
+        self.assertEqual(check_regressions(results, self.baseline, tolerance=0.5), [])
+
+    def test_unknown_metrics(self):
+        results = {"short": {"new_metric": 0.0}, "giant": {"parse_mb_per_s": 0.0}}
+        self.assertEqual(check_regressions(results, self.baseline), [])
+
+    def test_generate_synthetic_fasta(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "synthetic.fa")
+            generate_synthetic_fasta(path, n_records=3, record_length=125, line_width=60)
+            records = read_dna_file(path)
+            with open(path, "rb") as fasta_file:
+                first = fasta_file.read()
+            generate_synthetic_fasta(path, n_records=3, record_length=125, line_width=60)
+            with open(path, "rb") as fasta_file:
+                self.assertEqual(fasta_file.read(), first)
+        self.assertEqual(list(records), ["SEQ0", "SEQ1", "SEQ2"])
+        self.assertTrue(all(len(seq) == 125 and set(seq) <= set("ACGTN") for seq in records.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
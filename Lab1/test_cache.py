@@ -0,0 +1,103 @@
+"""
+Unit tests for the count cache of the dna package.
+
+This file verifies:
+- a second lookup of an unchanged file is a hit and does not count again
+- a changed file is a miss and is counted again
+- the least recently used files are evicted when the cache grows past max_bytes
+- process_dna_file and the command line tool take the counts from the cache
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+import dna.cache
+from dna.__main__ import main
+from dna.cache import CountCache
+from dna.counting import count_nucleotides
+from dna.pipeline import process_dna_file
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestCountCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = self.write("sample.fa", ">SEQ1\nACGTN\n>SEQ2\nGGCC\n")
+        self.cache = CountCache(os.path.join(self.directory, "cache.sqlite"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as dna_file:
+            dna_file.write(text)
+        return path
+
+    def counted(self, *args, **kwargs):
+        # run cache.counts and return its results with the number of counted records
+        with mock.patch.object(dna.cache, "count_nucleotides", wraps=count_nucleotides) as counter:
+            results = self.cache.counts(*args, **kwargs)
+        return results, counter.call_count
+
+    def test_hit(self):
+        first, calls = self.counted(self.filename)
+        self.assertEqual(calls, 2)
+        self.assertEqual(first, [("SEQ1", count_nucleotides("ACGTN")), ("SEQ2", count_nucleotides("GGCC"))])
+        second, calls = self.counted(self.filename)
+        self.assertEqual(calls, 0)
+        self.assertEqual(second, first)
+
+    def test_miss(self):
+        self.counted(self.filename)
+        self.write("sample.fa", ">SEQ1\nAAAA\n>SEQ2\nGGCC\n>SEQ3\nTT\n")
+        results, calls = self.counted(self.filename)
+        self.assertEqual(calls, 3)
+        self.assertEqual(results[0], ("SEQ1", count_nucleotides("AAAA")))
+        # another max_sequences is stored as a separate entry
+        results, calls = self.counted(self.filename, max_sequences=1)
+        self.assertEqual((len(results), calls), (1, 1))
+
+    def test_lru_eviction(self):
+        names = [self.write(f"file{i}.fa", f">SEQ{i}\nACGT\n") for i in range(3)]
+        self.cache.counts(names[0])
+        entry_bytes = self.cache._db.execute("SELECT nbytes FROM files").fetchone()[0]
+        self.cache.max_bytes = 2 * entry_bytes + 1  # room for two files
+        self.cache.counts(names[1])
+        self.cache.counts(names[0])  # names[0] is now the most recently used
+        self.cache.counts(names[2])
+        self.assertEqual(self.counted(names[0])[1], 0)
+        self.assertEqual(self.counted(names[1])[1], 1)  # evicted
+
+    def test_missing_file(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(self.cache.counts(os.path.join(self.directory, "missing.fa")), [])
+        self.assertIn("could not be found", output.getvalue())
+
+    def test_pipeline_and_command_line(self):
+        expected = StringIO()
+        with redirect_stdout(expected):
+            process_dna_file(self.filename, plot=False)
+        for _ in range(2):
+            output = StringIO()
+            with redirect_stdout(output):
+                process_dna_file(self.filename, plot=False, cache=self.cache)
+            self.assertEqual(output.getvalue(), expected.getvalue())
+        self.assertEqual(self.counted(self.filename)[1], 0)
+
+        path = os.path.join(self.directory, "cli.sqlite")
+        with redirect_stdout(StringIO()):
+            self.assertEqual(main(["count", self.filename, "--cache", path]), 0)
+        with CountCache(path) as cache:
+            self.assertEqual(len(cache._db.execute("SELECT * FROM files").fetchall()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Unit tests for the counting functions of the dna package.
+
+This file verifies:
+- counts of A, C, G, T, N and other letters
+- upper and lower case, line breaks, whitespace and bytes-like input
+- count_letters against a plain loop
+- merge_counts of partial counts
+"""
+
+import unittest
+from dna.counting import count_letters, count_nucleotides, merge_counts
+
+
+class TestCounting(unittest.TestCase):
+    def test_count_nucleotides(self):
+        counts = count_nucleotides("ACGTNNXA")
+        self.assertEqual(counts, {"A": 2, "C": 1, "G": 1, "T": 1, "N": 2, "other": 1})
+
+    def test_lower_case_and_line_breaks(self):
+        self.assertEqual(count_nucleotides("acg\nTn\r\n"), count_nucleotides("ACGTN"))
+        self.assertEqual(count_nucleotides("AC \t\nGT\v\f"), count_nucleotides("ACGT"))
+
+    def test_bytes_like_input(self):
+        seq = "GATTACA" * 3
+        self.assertEqual(count_nucleotides(seq.encode()), count_nucleotides(seq))
+        self.assertEqual(count_nucleotides(bytearray(seq.encode())), count_nucleotides(seq))
+        self.assertEqual(count_nucleotides(memoryview(seq.encode())), count_nucleotides(seq))
+
+    def test_empty_sequence(self):
+        self.assertEqual(sum(count_nucleotides("").values()), 0)
+
+    def test_count_letters(self):
+        seq = "AACGTTTNXG"
+        expected = {letter: seq.count(letter) for letter in "ACGT"}
+        self.assertEqual(count_letters(seq), expected)
+
+    def test_merge_counts(self):
+        parts = [count_nucleotides("ACGT"), count_nucleotides("NNA"), count_nucleotides("")]
+        self.assertEqual(merge_counts(parts), count_nucleotides("ACGTNNA"))
+
+
+if __name__ == "__main__":
+    unittest.main()
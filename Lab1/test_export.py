@@ -0,0 +1,112 @@
+"""
+Unit tests for the export of the dna package.
+
+This file verifies:
+- counts exported to .npz and .parquet are loaded back unchanged
+- any other file name gets .npz added, and the real file name is returned and printed
+- rows are grouped into batches of the requested size
+- process_dna_file and the command line tool stream the counts into the export
+- with several files and --workers, every file gets its own export, like without --workers
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+import numpy as np
+import dna.export
+from dna.__main__ import _output_name, main
+from dna.counting import count_nucleotides
+from dna.export import export_counts, iter_count_batches, iter_counts, load_counts
+from dna.pipeline import process_dna_file
+from dna.reader import iter_dna_records
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COMPLICATED = os.path.join(HERE, "dna_raw_complicated.txt")
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.records = list(iter_dna_records(COMPLICATED))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_export(self, path):
+        columns = load_counts(path)
+        self.assertEqual(columns["seq_id"].tolist(), [seq_id for seq_id, seq in self.records])
+        for letter in ("A", "C", "G", "T", "N", "other"):
+            self.assertEqual(columns[letter].dtype, np.uint64)
+            self.assertEqual(columns[letter].tolist(), [count_nucleotides(seq)[letter] for seq_id, seq in self.records])
+
+    def test_export_and_load(self):
+        path = os.path.join(self.directory, "counts.npz")
+        self.assertEqual(export_counts(iter_counts(COMPLICATED), path, batch_size=3), path)
+        self.check_export(path)
+
+    def test_other_extension(self):
+        path = os.path.join(self.directory, "counts.csv")
+        self.assertEqual(export_counts(iter_counts(COMPLICATED), path), path + ".npz")
+        self.check_export(path + ".npz")
+        self.assertFalse(os.path.exists(path))
+        output = StringIO()
+        with redirect_stdout(output):
+            process_dna_file(COMPLICATED, export=path, plot=False)
+        self.assertIn(f"Counts exported to {path}.npz", output.getvalue())
+
+    @unittest.skipIf(dna.export.pq is None, "pyarrow is not installed")
+    def test_parquet(self):
+        path = os.path.join(self.directory, "counts.parquet")
+        self.assertEqual(export_counts(iter_counts(COMPLICATED), path, batch_size=3), path)
+        self.check_export(path)
+
+    def test_batches(self):
+        batches = list(iter_count_batches(iter_counts(COMPLICATED), 3))
+        self.assertEqual([ids for ids, columns in batches], [["SEQ1", "SEQ2", "SEQ3"], ["SEQ4"]])
+        self.assertEqual(len(batches[1][1]["A"]), 1)
+
+    def test_pipeline_streams_export(self):
+        path = os.path.join(self.directory, "counts.npz")
+        received = []
+
+        def export(results, output):
+            received.append(results)
+            return export_counts(results, output)
+
+        with mock.patch.object(dna.export, "export_counts", export), redirect_stdout(StringIO()):
+            process_dna_file(COMPLICATED, export=path, plot=False)
+        self.assertNotIsInstance(received[0], list)  # a generator, not collected results
+        self.check_export(path)
+
+    def test_cli_workers_export(self):
+        path = os.path.join(self.directory, "counts.npz")
+        filename = os.path.join(self.directory, "dna.txt")
+        shutil.copy(COMPLICATED, filename)  # the workers write a .fai file next to it
+        output = StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(["count", filename, "--workers", "2", "--export", path]), 0)
+        self.assertIn("Nucleotide counts for SEQ4", output.getvalue())
+        self.check_export(path)
+
+    def test_cli_workers_export_per_file(self):
+        path = os.path.join(self.directory, "counts.npz")
+        filenames = [os.path.join(self.directory, "dna.txt"), os.path.join(self.directory, "simple.txt")]
+        shutil.copy(COMPLICATED, filenames[0])
+        shutil.copy(os.path.join(HERE, "dna_raw.txt"), filenames[1])
+        for arguments in (["--workers", "2"], []):
+            with redirect_stdout(StringIO()):
+                self.assertEqual(main(["count", *filenames, "--export", path, *arguments]), 0)
+            self.assertFalse(os.path.exists(path))  # no single export that mixes the files
+            self.check_export(_output_name(path, filenames[0], filenames))
+            columns = load_counts(_output_name(path, filenames[1], filenames))
+            self.assertEqual(columns["seq_id"].tolist(), [seq_id for seq_id, seq in iter_dna_records(filenames[1])])
+            for filename in filenames:
+                os.remove(_output_name(path, filename, filenames))
+
+
+if __name__ == "__main__":
+    unittest.main()
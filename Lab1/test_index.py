@@ -0,0 +1,122 @@
+"""
+Unit tests for the FASTA index and the chunked counting of the dna package.
+
+This file verifies:
+- the .fai entries of even and uneven records
+- the block scanner gives the same entries as the line scanner, also for records across blocks
+- fetched sequences and sub-ranges match the streaming reader
+- the index is saved and read back
+- requested IDs are uppercased and missing IDs are reported
+- chunked counting gives the same counts as one pass, also with tiny chunks
+- gzip input is refused by the index, never gets a .fai file and is read with the streaming reader
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from dna.counting import count_nucleotides, merge_counts
+from dna.index import IndexedFasta, _scan_fasta_lines, build_fasta_index, iter_indexed_records, load_fasta_index
+from dna.parallel import count_file_chunked
+from dna.pipeline import process_dna_file
+from dna.reader import read_dna_file
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        # work on a copy, so no .fai file is written next to the lab files
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "dna.txt")
+        shutil.copy(os.path.join(HERE, "dna_raw_complicated.txt"), self.filename)
+        self.records = read_dna_file(self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_build_index(self):
+        index = build_fasta_index(self.filename)
+        self.assertEqual(list(index), list(self.records))
+        self.assertEqual(index["SEQ1"].length, len(self.records["SEQ1"]))
+        self.assertEqual(index["SEQ3"].line_bases, 0)  # uneven lines
+
+    def test_block_scanner(self):
+        texts = [
+            ">A\nACGT\nACGT\nAC\n\n>b desc\nACGT\nAC\nACGT\n>C\n\nACGT\n>D\n>E\nACGTA\nACGT",
+            ">A\r\nACGT\r\nACGT\r\nA\r\n>B\r\nACGT\nACGT\n>C\nACGT\r\nACGT\r\n",
+            "junk before\n>A\nACGTACGT\nACGTACGTAA\n>B\n\n>C\nAC GT\nACGT\n",  # a space: line scanner
+            ">A\nACGT\rACGT\n",  # a lone carriage return: line scanner
+            "",
+        ]
+        for text in texts:
+            with open(self.filename, "w", newline="") as dna_file:
+                dna_file.write(text)
+            expected = _scan_fasta_lines(self.filename)
+            for block_size in (1, 5, 1 << 20):  # tiny blocks split every record
+                index = build_fasta_index(self.filename, block_size)
+                self.assertEqual(list(index.items()), list(expected.items()))
+        with open(self.filename, "w") as dna_file:
+            dna_file.write(texts[0])
+        self.assertEqual(build_fasta_index(self.filename)["A"], ("A", 10, 3, 4, 5))
+        self.assertEqual(build_fasta_index(self.filename)["B DESC"].line_bases, 0)  # a short line in the middle
+
+    def test_fetch(self):
+        with IndexedFasta(self.filename) as fasta:
+            for seq_id, seq in self.records.items():
+                self.assertEqual(fasta.fetch(seq_id), seq)
+                self.assertEqual(fasta.fetch(seq_id, 5, 40), seq[5:40])
+            with self.assertRaises(KeyError):
+                fasta.fetch("SEQ9")
+
+    def test_load_saves_index(self):
+        index = load_fasta_index(self.filename)
+        self.assertTrue(os.path.exists(self.filename + ".fai"))
+        self.assertEqual(load_fasta_index(self.filename), index)
+
+    def test_indexed_records(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            records = list(iter_indexed_records(self.filename, ["seq2", "SEQ9", "SEQ1"]))
+        self.assertEqual(records, [("SEQ2", self.records["SEQ2"]), ("SEQ1", self.records["SEQ1"])])
+        self.assertIn("'SEQ9' could not be found", output.getvalue())
+
+    def test_gzip_input(self):
+        gz_filename = self.filename + ".gz"
+        with open(self.filename, "rb") as source, gzip.open(gz_filename, "wb") as target:
+            shutil.copyfileobj(source, target)
+        with self.assertRaises(ValueError):
+            load_fasta_index(gz_filename)
+        with self.assertRaises(ValueError):
+            IndexedFasta(gz_filename, build_fasta_index(self.filename))
+        output = StringIO()
+        with redirect_stdout(output):
+            records = list(iter_indexed_records(gz_filename, ["seq3", "SEQ1", "SEQ9"]))
+            process_dna_file(gz_filename, seq_ids=["SEQ2"], plot=False)
+        self.assertEqual(records, [("SEQ1", self.records["SEQ1"]), ("SEQ3", self.records["SEQ3"])])
+        self.assertIn("'SEQ9' could not be found", output.getvalue())
+        self.assertIn(str(count_nucleotides(self.records["SEQ2"])["A"]), output.getvalue())
+        self.assertEqual(count_file_chunked(gz_filename, workers=1), count_file_chunked(self.filename, workers=1))
+        self.assertEqual(count_file_chunked(gz_filename, "seq2", workers=1), count_nucleotides(self.records["SEQ2"]))
+        self.assertFalse(os.path.exists(gz_filename + ".fai"))
+
+    def test_count_file_chunked(self):
+        expected = merge_counts(count_nucleotides(seq) for seq in self.records.values())
+        self.assertEqual(count_file_chunked(self.filename, chunk_size=7, workers=2), expected)
+        self.assertEqual(count_file_chunked(self.filename, "SEQ3", chunk_size=5, workers=2),
+                         count_nucleotides(self.records["SEQ3"]))
+
+    def test_chunked_trailing_whitespace(self):
+        with open(self.filename, "w") as dna_file:
+            dna_file.write(">a\nACGT  \nAC\n>b\nGG\t\n")  # the reader strips the spaces and tabs
+        expected = merge_counts(count_nucleotides(seq) for seq in read_dna_file(self.filename).values())
+        self.assertEqual(expected["other"], 0)
+        for chunk_size in (1, 3, 100):
+            self.assertEqual(count_file_chunked(self.filename, chunk_size=chunk_size, workers=1), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the k-mer analysis of the dna package.
+
+This file verifies:
+- k-mer and dinucleotide counts match a brute-force count, also across chunk borders
+- k-mers with N or other letters are skipped and lowercase bases are counted
+- GC fractions of the windows match a brute-force count
+- an invalid k is refused
+"""
+
+import random
+import unittest
+from collections import Counter
+import numpy as np
+from dna.kmers import KmerAnalyzer, analyze_kmers, decode_kmer
+
+
+def brute_force_kmers(sequences, k):
+    # count every substring of length k that only has A, C, G and T
+    counts = Counter()
+    for seq in sequences:
+        seq = seq.upper()
+        for start in range(len(seq) - k + 1):
+            kmer = seq[start:start + k]
+            if set(kmer) <= set("ACGT"):
+                counts[kmer] += 1
+    return counts
+
+
+class TestKmers(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.records = [(f"SEQ{i}", "".join(rng.choice("ACGTACGTacgtNX") for _ in range(length)))
+                        for i, length in enumerate((0, 2, 57, 300))]
+
+    def test_kmer_counts(self):
+        sequences = [seq for seq_id, seq in self.records]
+        for k in (1, 3, 5):
+            analyzer = KmerAnalyzer(k=k, window=10, chunk_size=16)  # chunks of 10 bases, so k-mers cross the borders
+            for seq_id, seq in self.records:
+                analyzer.add(seq_id, seq)
+            self.assertEqual(dict(analyzer.top_kmers(4 ** k)), dict(brute_force_kmers(sequences, k)))
+            dinucleotides = brute_force_kmers(sequences, 2)
+            self.assertEqual(analyzer.dinucleotide_frequencies(),
+                             {decode_kmer(code, 2): dinucleotides[decode_kmer(code, 2)] for code in range(16)})
+        self.assertEqual(dict(analyze_kmers(self.records, k=4).top_kmers(256)), dict(brute_force_kmers(sequences, 4)))
+
+    def test_gc_windows(self):
+        analyzer = KmerAnalyzer(k=2, window=10, step=5, chunk_size=16)  # windows overlap the chunk borders
+        for seq_id, seq in self.records:
+            analyzer.add(seq_id, seq)
+        for seq_id, seq in self.records:
+            seq = seq.upper()
+            expected = []
+            for start in range(0, len(seq) - 10 + 1, 5):
+                window = seq[start:start + 10]
+                acgt = sum(window.count(letter) for letter in "ACGT")
+                expected.append((window.count("G") + window.count("C")) / acgt if acgt else np.nan)
+            np.testing.assert_allclose(analyzer.gc_windows[seq_id], expected, rtol=1e-6)
+
+    def test_invalid_k(self):
+        with self.assertRaises(ValueError):
+            KmerAnalyzer(k=13)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Unit tests for the 2-bit packed sequences of the dna package.
+
+This file verifies:
+- str, slices, indexing and count() give back the original sequence, also with runs of N
+- N runs are stored in an int64 array that is counted in nbytes
+- iter_packed_records gives the same records as iter_dna_records and reports a missing file
+"""
+
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+import numpy as np
+from dna.packed import PackedSequence, iter_packed_records
+from dna.reader import iter_dna_records
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COMPLICATED = os.path.join(HERE, "dna_raw_complicated.txt")
+
+
+class TestPacked(unittest.TestCase):
+    def setUp(self):
+        self.sequence = "NNACGTNNNNacgtAXGGCTTN"  # N at both ends, a run in the middle, other letters become N
+        self.expected = self.sequence.upper().replace("X", "N")
+        self.packed = PackedSequence(self.sequence)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.packed), len(self.expected))
+        self.assertEqual(str(self.packed), self.expected)
+        for start in range(len(self.expected) + 1):
+            for end in range(start, len(self.expected) + 2):
+                self.assertEqual(str(self.packed[start:end]), self.expected[start:end])
+        self.assertEqual(str(self.packed[::3]), self.expected[::3])
+        self.assertEqual(self.packed[-1], "N")
+        self.assertEqual(self.packed[2], "A")
+        with self.assertRaises(IndexError):
+            self.packed[len(self.expected)]
+        self.assertEqual(self.packed, PackedSequence(self.expected))
+        self.assertEqual(str(PackedSequence("")), "")
+
+    def test_count(self):
+        self.assertEqual(self.packed.count(), {letter: self.expected.count(letter) for letter in "ACGTN"})
+        self.assertEqual(self.packed[3:9].count(), {letter: self.expected[3:9].count(letter) for letter in "ACGTN"})
+
+    def test_n_runs(self):
+        self.assertEqual(self.packed.n_runs.dtype, np.int64)
+        self.assertEqual(self.packed.n_runs.tolist(), [[0, 2], [6, 10], [15, 16], [21, 22]])
+        self.assertEqual(self.packed.nbytes, (len(self.expected) + 3) // 4 + 4 * 2 * 8)
+
+    def test_iter_packed_records(self):
+        expected = [(seq_id, "".join(letter if letter in "ACGT" else "N" for letter in seq))
+                    for seq_id, seq in iter_dna_records(COMPLICATED)]
+        self.assertEqual([(seq_id, str(seq)) for seq_id, seq in iter_packed_records(COMPLICATED)], expected)
+        output = StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(list(iter_packed_records("no_such_file.txt")), [])
+        self.assertIn("could not be found", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Unit tests for the process-pool counting of the dna package.
+
+This file verifies:
+- process_dna_files gives the same counts and order as the serial reader
+- files without a .fai file are indexed by the workers, the next run batches them from the index
+- workers count from the index entries they are sent, without reading the .fai file
+- gzip files are counted by the pool with the streaming reader, without a .fai file
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from dna.counting import count_nucleotides
+from dna.index import build_fasta_index
+from dna.parallel import _count_indexed_batch, process_dna_files
+from dna.reader import iter_dna_records
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        # work on copies, so no .fai file is written next to the lab files
+        self.directory = tempfile.mkdtemp()
+        self.filenames = []
+        for name in ("dna_raw.txt", "dna_raw_complicated.txt"):
+            self.filenames.append(os.path.join(self.directory, name))
+            shutil.copy(os.path.join(HERE, name), self.filenames[-1])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_process_dna_files(self):
+        expected = [(filename, seq_id, count_nucleotides(seq))
+                    for filename in self.filenames for seq_id, seq in iter_dna_records(filename)]
+        self.assertEqual(process_dna_files(self.filenames, workers=2, batch_bases=50), expected)
+        self.assertTrue(all(os.path.exists(filename + ".fai") for filename in self.filenames))  # built by the workers
+        self.assertEqual(process_dna_files(self.filenames, workers=2, batch_bases=50), expected)  # batched from the index
+        pattern = os.path.join(self.directory, "*.txt")
+        self.assertEqual(process_dna_files(pattern, max_sequences=1, workers=1), [expected[0], expected[4]])
+        for filename in self.filenames:
+            os.remove(filename + ".fai")
+        self.assertEqual(process_dna_files(pattern, max_sequences=1, workers=1), [expected[0], expected[4]])
+
+    def test_gzip_files(self):
+        expected = process_dna_files(self.filenames, workers=1)
+        gz_filenames = []
+        for filename in self.filenames:
+            gz_filenames.append(filename + ".gz")
+            with open(filename, "rb") as source, gzip.open(gz_filenames[-1], "wb") as target:
+                shutil.copyfileobj(source, target)
+        results = process_dna_files(os.path.join(self.directory, "*.gz"), workers=2)
+        self.assertEqual(results, [(filename + ".gz", seq_id, counts) for filename, seq_id, counts in expected])
+        self.assertEqual(len(process_dna_files(gz_filenames, max_sequences=2, workers=2)), 4)
+        self.assertFalse(any(os.path.exists(filename + ".fai") for filename in gz_filenames))
+
+    def test_worker_uses_sent_entries(self):
+        filename = self.filenames[1]
+        entries = list(build_fasta_index(filename).values())
+        counts = _count_indexed_batch((filename, entries))
+        self.assertEqual(counts, [count_nucleotides(seq) for seq_id, seq in iter_dna_records(filename)])
+        self.assertFalse(os.path.exists(filename + ".fai"))
+
+
+if __name__ == "__main__":
+    unittest.main()
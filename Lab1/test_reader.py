@@ -0,0 +1,94 @@
+"""
+Unit tests for the readers of the dna package.
+
+This file verifies:
+- records, IDs and sequences of the simple and the complicated file
+- gzip input gives the same records as plain text
+- bgzip (BGZF) input, split into many blocks, gives the same records and bytes as plain text
+- the threaded reader gives the same records as the plain reader, also inside process_dna_file
+- a missing file is reported instead of raising
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+from contextlib import redirect_stdout
+from io import StringIO
+from dna.pipeline import process_dna_file
+from dna.reader import (BgzfReader, iter_dna_records, iter_dna_records_threaded, open_dna_file, read_bgzf_blocks,
+                        read_dna_file)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+COMPLICATED = os.path.join(HERE, "dna_raw_complicated.txt")
+
+
+def write_bgzf(filename, data, block_size=100):
+    # write data as BGZF blocks of block_size bytes, followed by the empty end-of-file block
+    with open(filename, "wb") as bgzf_file:
+        for start in range(0, len(data), block_size):
+            bgzf_file.write(bgzf_block(data[start:start + block_size]))
+        bgzf_file.write(bgzf_block(b""))
+
+
+def bgzf_block(data):
+    compressor = zlib.compressobj(wbits=-15)  # raw deflate data without a header
+    deflated = compressor.compress(data) + compressor.flush()
+    size = 18 + len(deflated) + 8  # header with the BC subfield, data, CRC32 and uncompressed size
+    header = b"\x1f\x8b\x08\x04" + bytes(4) + b"\x00\xff" + (6).to_bytes(2, "little")
+    header += b"BC" + (2).to_bytes(2, "little") + (size - 1).to_bytes(2, "little")
+    return header + deflated + zlib.crc32(data).to_bytes(4, "little") + len(data).to_bytes(4, "little")
+
+
+class TestReader(unittest.TestCase):
+    def test_read_dna_file(self):
+        records = read_dna_file(COMPLICATED)
+        self.assertEqual(list(records), ["SEQ1", "SEQ2", "SEQ3", "SEQ4"])
+        self.assertTrue(records["SEQ1"].startswith("CGTAACCAATAAA"))
+        self.assertEqual(len(records["SEQ3"]), 112)  # four lines of different lengths are joined
+
+    def test_gzip_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            gz_filename = os.path.join(directory, "dna.txt.gz")
+            with open(COMPLICATED, "rb") as source, gzip.open(gz_filename, "wb") as target:
+                shutil.copyfileobj(source, target)
+            self.assertEqual(list(iter_dna_records(gz_filename)), list(iter_dna_records(COMPLICATED)))
+
+    def test_bgzf_file(self):
+        with open(COMPLICATED, "rb") as source:
+            data = source.read()
+        with tempfile.TemporaryDirectory() as directory:
+            bgzf_filename = os.path.join(directory, "dna.txt.gz")
+            write_bgzf(bgzf_filename, data)
+            with open(bgzf_filename, "rb") as raw_file:
+                self.assertEqual(len(list(read_bgzf_blocks(raw_file))), -(-len(data) // 100) + 1)
+            reader = BgzfReader(bgzf_filename, threads=2)
+            self.assertEqual(reader.read(), data)
+            reader.close()
+            with gzip.open(bgzf_filename, "rb") as gzip_file:  # BGZF is also valid multi-member gzip
+                self.assertEqual(gzip_file.read(), data)
+            with open_dna_file(bgzf_filename, binary=True) as dna_file:
+                self.assertIsInstance(dna_file.raw, BgzfReader)
+            self.assertEqual(list(iter_dna_records(bgzf_filename)), list(iter_dna_records(COMPLICATED)))
+            self.assertEqual(list(iter_dna_records_threaded(bgzf_filename)), list(iter_dna_records(COMPLICATED)))
+
+    def test_threaded_reader(self):
+        self.assertEqual(list(iter_dna_records_threaded(COMPLICATED, queue_size=1)), list(iter_dna_records(COMPLICATED)))
+        expected, output = StringIO(), StringIO()
+        with redirect_stdout(expected):
+            process_dna_file(COMPLICATED, plot=False)
+        with redirect_stdout(output):
+            process_dna_file(COMPLICATED, plot=False, threaded=True)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_missing_file(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(read_dna_file("no_such_file.txt"), {})
+        self.assertIn("could not be found", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
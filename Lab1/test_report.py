@@ -0,0 +1,50 @@
+"""
+Unit tests for the headless report of the dna package.
+
+This file verifies:
+- one numbered PNG file is written per page of charts
+- all pages go into one PDF file when the name ends with .pdf
+- no file is written when there are no results
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from dna.counting import count_nucleotides
+from dna.report import write_report
+
+
+class TestReport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.results = [(f"SEQ{i}", count_nucleotides("ACGT" * i + "GG")) for i in range(1, 12)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_png_pages(self):
+        output = os.path.join(self.directory.name, "counts.png")
+        written = write_report(iter(self.results), output, "dna.txt", rows=2, columns=2)
+        self.assertEqual([os.path.basename(name) for name in written],
+                         ["counts_001.png", "counts_002.png", "counts_003.png"])  # 11 charts, 4 per page
+        for name in written:
+            with open(name, "rb") as png_file:
+                self.assertEqual(png_file.read(8), b"\x89PNG\r\n\x1a\n")
+
+    def test_pdf(self):
+        output = os.path.join(self.directory.name, "counts.pdf")
+        self.assertEqual(write_report(self.results, output, rows=2, columns=2), [output])
+        with open(output, "rb") as pdf_file:
+            content = pdf_file.read()
+        self.assertTrue(content.startswith(b"%PDF"))
+        self.assertEqual(len(re.findall(rb"/Type\s*/Page\b(?!s)", content)), 3)
+
+    def test_no_results(self):
+        output = os.path.join(self.directory.name, "counts.pdf")
+        self.assertEqual(write_report([], output), [])
+        self.assertFalse(os.path.exists(output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Memory and attribute-access benchmark for the __slots__ layout of the shape classes.
+
+The shape modules are loaded a second time with their __slots__ lines removed, which gives
+the old classes with a per-instance __dict__. Both versions are then measured side by side:
+bytes per instance (tracemalloc) and the time of reading a property and the area or volume.
+
+Run it with:
+    python benchmark_slots.py
+"""
+
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+import types
+
+SHAPE_MODULES = ["shape2d", "circle", "rectangle", "shape3d", "cube", "sphere"]  # in import order
+SHAPE_CLASSES = {  # class name -> (module, constructor arguments, property read, derived metric read)
+    "Circle": ("circle", (2, 1, 1), "shape.radius", "shape.area"),
+    "Rectangle": ("rectangle", (3, 4, 1, 1), "shape.width", "shape.area"),
+    "Cube": ("cube", (2, 1, 1, 1), "shape.side", "shape.volume"),
+    "Sphere": ("sphere", (2, 1, 1, 1), "shape.radius", "shape.volume"),
+}
+
+
+def load_without_slots() -> dict:
+    """Return {module name: module} of the shape modules compiled without their __slots__ lines."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    saved = {name: sys.modules.get(name) for name in SHAPE_MODULES}
+    modules = {}
+    try:
+        for name in SHAPE_MODULES:
+            path = os.path.join(directory, f"{name}.py")
+            with open(path) as source_file:
+                source = re.sub(r"^\s*__slots__ = .*\n", "", source_file.read(), flags=re.MULTILINE)
+            module = types.ModuleType(name)
+            module.__file__ = path
+            sys.modules[name] = module  # later modules import the dict-based base classes
+            exec(compile(source, path, "exec"), module.__dict__)
+            modules[name] = module
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+    return modules
+
+
+def bytes_per_instance(cls, args, n=100_000) -> float:
+    """Return the memory of one instance in bytes, measured over n instances."""
+    shapes = [None] * n  # the list is allocated before the measurement starts
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(n):
+        shapes[i] = cls(*args)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / n
+
+
+def access_time(shape, expression, number=1_000_000) -> float:
+    """Return the time of one evaluation of expression on shape in nanoseconds."""
+    return min(timeit.repeat(expression, globals={"shape": shape}, number=number, repeat=3)) / number * 1e9
+
+
+def main() -> None:
+    """Print the memory and access times of the dict-based and the slotted classes."""
+    legacy = load_without_slots()
+    print(f"{'class':<10} {'dict B':>7} {'slots B':>8} {'saved':>6} {'dict get ns':>12} {'slots get ns':>13}"
+          f" {'dict metric ns':>15} {'slots metric ns':>16}")
+    for class_name, (module_name, args, getter, metric) in SHAPE_CLASSES.items():
+        slotted = getattr(__import__(module_name), class_name)
+        dict_based = getattr(legacy[module_name], class_name)
+        dict_bytes = bytes_per_instance(dict_based, args)
+        slot_bytes = bytes_per_instance(slotted, args)
+        times = [access_time(cls(*args), expression) for expression in (getter, metric) for cls in (dict_based, slotted)]
+        print(f"{class_name:<10} {dict_bytes:>7.0f} {slot_bytes:>8.0f} {1 - slot_bytes / dict_bytes:>6.0%}"
+              f" {times[0]:>12.1f} {times[1]:>13.1f} {times[2]:>15.1f} {times[3]:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
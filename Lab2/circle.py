@@ -11,6 +11,8 @@ class Circle(Shape2D):
     Provides calculation of area and perimeter and a method to check if it is a unit circle.
     """
 
+    __slots__ = ("_radius",)
+
     def __init__(self, radius: Number, x: Number = 0, y: Number = 0):
         """
         Initialize a Circle with given radius and coordinates.
@@ -24,20 +26,44 @@ class Circle(Shape2D):
         super().__init__(x, y)
         self._radius = radius
 
+    @classmethod
+    def trusted(cls, radius: Number, x: Number = 0, y: Number = 0) -> "Circle":
+        """
+        Create a circle without validating the radius.
+
+        Only for values that were validated already, e.g. in bulk with Utils.validate_positive_array.
+        An invalid radius is not detected and gives wrong results later.
+        """
+        circle = cls.__new__(cls)
+        Shape2D.__init__(circle, x, y)
+        circle._radius = radius
+        return circle
+
     @property
     def radius(self) -> Number:
         """Return the radius of the circle."""
         return self._radius
 
+    @radius.setter
+    def radius(self, value: Number) -> None:
+        """Set a new positive radius, the cached area and perimeter are recomputed on next access."""
+        Utils.validate_positive(value)
+        self._radius = value
+        self._invalidate()
+
     @property
     def area(self) -> Number:
         """Return the area of the circle."""
-        return pi * (self._radius ** 2)
+        if self._area is None:
+            self._area = pi * (self._radius ** 2)
+        return self._area
 
     @property
     def perimeter(self) -> Number:
         """Return the circumference (perimeter) of the circle."""
-        return 2 * pi * self._radius
+        if self._perimeter is None:
+            self._perimeter = 2 * pi * self._radius
+        return self._perimeter
 
     def is_unit_circle(self) -> bool:
         """Return True if the circle is a unit circle (radius == 1)."""
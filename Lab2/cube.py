@@ -10,24 +10,50 @@ class Cube(Shape3D):
     Provides calculation of surface area and volume.
     """
 
+    __slots__ = ("_side",)
+
     def __init__(self, side: Number, x: Number = 0, y: Number = 0, z: Number = 0):
         Utils.validate_positive(side)
         super().__init__(x, y, z)
         self._side = side
 
+    @classmethod
+    def trusted(cls, side: Number, x: Number = 0, y: Number = 0, z: Number = 0) -> "Cube":
+        """
+        Create a cube without validating the side length.
+
+        Only for values that were validated already, e.g. in bulk with Utils.validate_positive_array.
+        An invalid side length is not detected and gives wrong results later.
+        """
+        cube = cls.__new__(cls)
+        Shape3D.__init__(cube, x, y, z)
+        cube._side = side
+        return cube
+
     @property
     def side(self) -> Number:
         return self._side
 
+    @side.setter
+    def side(self, value: Number) -> None:
+        """Set a new positive side length, the cached volume and surface area are recomputed on next access."""
+        Utils.validate_positive(value)
+        self._side = value
+        self._invalidate()
+
     @property
     def surface_area(self) -> Number:
         """Return the total surface area of the cube."""
-        return 6 * (self._side ** 2)
+        if self._surface_area is None:
+            self._surface_area = 6 * (self._side ** 2)
+        return self._surface_area
 
     @property
     def volume(self) -> Number:
         """Return the volume of the cube."""
-        return self._side ** 3
+        if self._volume is None:
+            self._volume = self._side ** 3
+        return self._volume
 
     def translate(self, dx: Number, dy: Number, dz: Number) -> None:
         super().translate(dx, dy, dz)
@@ -10,6 +10,8 @@ class Rectangle(Shape2D):
     Provides calculation of area and perimeter and a method to check if it is a square.
     """
 
+    __slots__ = ("_width", "_height")
+
     def __init__(self, width: Number, height: Number, x: Number = 0, y: Number = 0):
         """
         Initialize a Rectangle with given width, height and coordinates.
@@ -26,25 +28,57 @@ class Rectangle(Shape2D):
         self._width = width
         self._height = height
 
+    @classmethod
+    def trusted(cls, width: Number, height: Number, x: Number = 0, y: Number = 0) -> "Rectangle":
+        """
+        Create a rectangle without validating the width and height.
+
+        Only for values that were validated already, e.g. in bulk with Utils.validate_positive_array.
+        An invalid width or height is not detected and gives wrong results later.
+        """
+        rectangle = cls.__new__(cls)
+        Shape2D.__init__(rectangle, x, y)
+        rectangle._width = width
+        rectangle._height = height
+        return rectangle
+
     @property
     def width(self) -> Number:
         """Return the width of the rectangle."""
         return self._width
 
+    @width.setter
+    def width(self, value: Number) -> None:
+        """Set a new positive width, the cached area and perimeter are recomputed on next access."""
+        Utils.validate_positive(value)
+        self._width = value
+        self._invalidate()
+
     @property
     def height(self) -> Number:
         """Return the height of the rectangle."""
         return self._height
 
+    @height.setter
+    def height(self, value: Number) -> None:
+        """Set a new positive height, the cached area and perimeter are recomputed on next access."""
+        Utils.validate_positive(value)
+        self._height = value
+        self._invalidate()
+
     @property
     def area(self) -> Number:
         """Return the area of the rectangle."""
-        return self._width * self._height
+        if self._area is None:
+            self._area = self._width * self._height
+        return self._area
 
     @property
     def perimeter(self) -> Number:
         """Return the perimeter of the rectangle."""
-        return 2 * (self._width + self._height)
+        if self._perimeter is None:
+            self._perimeter = 2 * (self._width + self._height)
+        return self._perimeter
 
     def is_square(self) -> bool:
         """Return True if the rectangle is a square."""
@@ -9,6 +9,8 @@ class Shape2D(ABC):
     methods for calculating area and perimeter. Translation method is also provided.
     """
 
+    __slots__ = ("_x", "_y", "_area", "_perimeter")  # no per-instance __dict__, subclasses add their own slots
+
     def __init__(self, x: Number, y: Number):
         """
         Initialize a 2D shape with x and y coordinates.
@@ -19,6 +21,8 @@ class Shape2D(ABC):
         """
         self._x = x
         self._y = y
+        self._area = None  # cached area and perimeter, computed on first access
+        self._perimeter = None
 
     @property
     def x(self) -> Number:
@@ -40,6 +44,11 @@ class Shape2D(ABC):
         """Return the perimeter of the shape (must be implemented by subclass)."""
         pass
 
+    def _invalidate(self) -> None:
+        """Forget the cached area and perimeter (call after changing a dimension)."""
+        self._area = None
+        self._perimeter = None
+
     def translate(self, dx: Number, dy: Number) -> None:
         """
         Translate the shape by given numeric offsets.
@@ -1,17 +1,91 @@
+import os
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import EllipseCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from circle import Circle
 from rectangle import Rectangle
 from shape2d import Shape2D
+from shapecollection2d import ShapeCollection2D
+from utils import Utils
+
+def _contains(outer: tuple, inner: tuple) -> bool:
+    # True if the box (min_x, min_y, max_x, max_y) inner lies inside the box outer
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
 
 class Shape2DPlotter:
-    """A class to plot 2D shapes like circles and rectangles using matplotlib."""
+    """
+    A class to plot 2D shapes like circles and rectangles using matplotlib.
+
+    plot_all() draws all circles as one EllipseCollection and all rectangles as one
+    PolyCollection, built straight from coordinate arrays, so the number of matplotlib
+    artists does not grow with the number of shapes.
+
+    A headless plotter renders off-screen without pyplot or a display, writes PNG, SVG or
+    PDF files with save(), and cuts large scenes into map tiles with save_tiles().
+
+    Only the shapes inside the axis limits are drawn, and shapes smaller than min_pixels
+    pixels are collapsed into point markers. Pan, zoom and resize only mark the view as
+    changed; the visible set is recomputed once when the next frame is drawn, so a pan that
+    sets the x and then the y limits costs one update. Zooming in only filters the shapes
+    that were visible. Otherwise the shapes are looked up in a list sorted by the x of their
+    centers, so a pan only tests the shapes in the vertical strip of the view.
+    """
+
+    def __init__(self, headless: bool = False, min_pixels: float = 1.0):
+        """
+        Initialize the plotter with a matplotlib figure and axis.
 
-    def __init__(self):
-        """Initialize the plotter with a matplotlib figure and axis."""
-        self.fig, self.ax = plt.subplots()
+        Args:
+            headless (bool, optional): Create the figure without pyplot, so no interactive
+                backend or display is needed and the figure is freed with the plotter. Defaults to False.
+            min_pixels (float, optional): Shapes whose width and height on screen are both below
+                this many pixels are drawn as point markers, 0 draws every shape in full. Defaults to 1.0.
+        """
+        Utils.validate_number(min_pixels)
+        if not min_pixels >= 0:
+            raise ValueError(f"{min_pixels} is not zero or positive.")
+        self.headless = headless
+        self.min_pixels = min_pixels
+        if headless:
+            self.fig = Figure()
+            self.ax = self.fig.subplots()
+        else:
+            self.fig, self.ax = plt.subplots()
         self.ax.set_aspect('equal', 'box')
         self.ax.grid(True)
         self.shapes = []  # collection of shapes
+        self.collections = []  # ShapeCollection2D objects, drawn together with the shapes
+
+        # state of the drawn scene: all shapes with their bounds, the artists on the axis,
+        # the indices of the shapes in the view, and the (view box, pixel size) they were picked for
+        self._scene = None
+        self._bounds = None
+        self._artists = []
+        self._visible = None
+        self._view = None
+        self._view_changed = False
+        # sweep over the x-axis: indices of the narrow shapes sorted by the x of their centers, those
+        # centers, the largest half width of a narrow shape, and the widest shapes that are always tested
+        self._order = None
+        self._centers = None
+        self._reach = 0.0
+        self._wide = None
+        self.ax.callbacks.connect('xlim_changed', self._mark_view_changed)
+        self.ax.callbacks.connect('ylim_changed', self._mark_view_changed)
+        self.fig.canvas.mpl_connect('resize_event', self._mark_view_changed)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _mark_view_changed(self, *args):
+        # pan and zoom set the x and then the y limits, so the update waits for the next frame
+        self._view_changed = True
+
+    def _on_draw(self, event):
+        # after a frame was drawn: update the shapes for the new view and draw once more if they changed
+        if self._view_changed and self.update_view():
+            self.fig.canvas.draw_idle()
 
     def add_shape(self, shape):
         """Add a 2D shape to internal storage for later plotting."""
@@ -19,6 +93,18 @@ class Shape2DPlotter:
             raise TypeError("Only 2D shapes can be added to Shape2DPlotter.")
         self.shapes.append(shape)
 
+    def add_collection(self, collection: ShapeCollection2D):
+        """Add a ShapeCollection2D for later plotting, without creating a Shape2D object per shape."""
+        if not isinstance(collection, ShapeCollection2D):
+            raise TypeError("Only ShapeCollection2D objects can be added with add_collection.")
+        self.collections.append(collection)
+
+    def _all_shapes(self) -> ShapeCollection2D:
+        # the stored shapes and collections as one array-backed collection; other 2D shapes have no
+        # drawing code and are skipped, as plot_all always did
+        shapes = [shape for shape in self.shapes if isinstance(shape, (Circle, Rectangle))]
+        return ShapeCollection2D.concatenate([ShapeCollection2D.from_shapes(shapes), *self.collections])
+
     def plot_circle(self, circle: Circle, color: str = 'blue'):
         """
         Plot a circle on the axis.
@@ -42,40 +128,60 @@ class Shape2DPlotter:
                                    edgecolor=color, fill=False, linewidth=3)
         self.ax.add_patch(rect_patch)
 
-    def plot_all(self):
-        """Plot all stored shapes in one figure using default colors, then set unified limits."""
-        if not self.shapes:
-            print("No 2D shapes to plot.")
-            return
+    def circle_collection(self, shapes: ShapeCollection2D, color: str = 'blue', ax=None) -> EllipseCollection:
+        """
+        Build one artist for all circles of a collection.
+
+        Args:
+            shapes (ShapeCollection2D): The shapes, rectangles are skipped.
+            color (str): The color of the circles.
+            ax (Axes, optional): The axis the artist is drawn on. Defaults to the plotter's axis.
+        """
+        circles = shapes[shapes.kind == ShapeCollection2D.CIRCLE]
+        diameters = 2 * circles.radius
+        return EllipseCollection(diameters, diameters, np.zeros(len(circles)), units='xy',
+                                 offsets=np.column_stack((circles.x, circles.y)),
+                                 offset_transform=(ax or self.ax).transData,
+                                 facecolors='none', edgecolors=color, linewidths=3)
+
+    def rectangle_collection(self, shapes: ShapeCollection2D, color: str = 'red') -> PolyCollection:
+        """
+        Build one artist for all rectangles of a collection.
+
+        Args:
+            shapes (ShapeCollection2D): The shapes, circles are skipped.
+            color (str): The color of the rectangles.
+        """
+        return PolyCollection(shapes.corners(), closed=True, facecolors='none', edgecolors=color, linewidths=3)
+
+    def _draw(self, ax, shapes: ShapeCollection2D, pixel: float = 0.0) -> list:
+        """
+        Draw shapes with one artist per kind and return the artists.
+
+        Shapes whose bounding box is smaller than pixel in both directions are drawn as
+        point markers at their center, in the color of their kind.
+        """
+        min_x, min_y, max_x, max_y = shapes.bounds()
+        tiny = np.maximum(max_x - min_x, max_y - min_y) < pixel
+        large = shapes[~tiny]
+        artists = [ax.add_collection(self.circle_collection(large, ax=ax), autolim=False),
+                   ax.add_collection(self.rectangle_collection(large), autolim=False)]
+        if np.any(tiny):
+            center_x, center_y = (min_x[tiny] + max_x[tiny]) / 2, (min_y[tiny] + max_y[tiny]) / 2
+            kind = shapes.kind[tiny]
+            for value, color in ((ShapeCollection2D.CIRCLE, 'blue'), (ShapeCollection2D.RECTANGLE, 'red')):
+                points = Line2D(center_x[kind == value], center_y[kind == value], linestyle='none',
+                                marker='.', markersize=2, color=color)
+                artists.append(ax.add_line(points))
+        return artists
+
+    @staticmethod
+    def _limits(shapes: ShapeCollection2D) -> tuple:
+        # (min_x, max_x, min_y, max_y) of a unified bounding box covering ALL shapes, with a small padding
+        bounds = shapes.bounds()
+        min_x, min_y = float(bounds[0].min()), float(bounds[1].min())
+        max_x, max_y = float(bounds[2].max()), float(bounds[3].max())
 
-        # 1) draw all shapes
-        for shape in self.shapes:
-            if isinstance(shape, Circle):
-                self.plot_circle(shape)
-            elif isinstance(shape, Rectangle):
-                self.plot_rectangle(shape)
-
-        # 2) compute a unified bounding box covering ALL shapes
-        min_x = float('inf')
-        max_x = float('-inf')
-        min_y = float('inf')
-        max_y = float('-inf')
-
-        for shape in self.shapes:
-            if isinstance(shape, Circle):
-                cx, cy, r = shape.x, shape.y, shape.radius
-                min_x = min(min_x, cx - r)
-                max_x = max(max_x, cx + r)
-                min_y = min(min_y, cy - r)
-                max_y = max(max_y, cy + r)
-            elif isinstance(shape, Rectangle):
-                rx, ry, rw, rh = shape.x, shape.y, shape.width, shape.height
-                min_x = min(min_x, rx)
-                max_x = max(max_x, rx + rw)
-                min_y = min(min_y, ry)
-                max_y = max(max_y, ry + rh)
-
-        # 3) add a small padding and apply once
         width = max_x - min_x
         height = max_y - min_y
         if width == 0:
@@ -83,10 +189,139 @@ class Shape2DPlotter:
         if height == 0:
             height = 1.0
         pad = 0.1 * max(width, height)
+        return min_x - pad, max_x + pad, min_y - pad, max_y + pad
+
+    def plot_all(self):
+        """Plot all stored circles, rectangles and collections in one figure using default colors, then set unified limits."""
+        shapes = self._all_shapes()
+        if not len(shapes):
+            print("No 2D shapes to plot.")
+            return
+
+        self._scene = None  # no redraws while the limits are set
+        min_x, max_x, min_y, max_y = self._limits(shapes)
+        self.ax.set_xlim(min_x, max_x)
+        self.ax.set_ylim(min_y, max_y)
+        self._scene, self._bounds, self._view = shapes, shapes.bounds(), None
+        min_x, min_y, max_x, max_y = self._bounds
+        centers, reach = (min_x + max_x) / 2, (max_x - min_x) / 2
+        wide = reach > np.quantile(reach, 0.99)  # a few very wide shapes must not widen the strip of every view
+        narrow = np.flatnonzero(~wide)
+        self._order = narrow[np.argsort(centers[narrow], kind='stable')]
+        self._centers = centers[self._order]
+        self._reach = float(reach[narrow].max())
+        self._wide = np.flatnonzero(wide)
+        self.update_view()
+
+    def update_view(self) -> bool:
+        """
+        Redraw the plotted shapes for the current axis limits and figure size.
+
+        Shapes outside the view are skipped and shapes smaller than min_pixels pixels become
+        point markers. This runs automatically when a frame is drawn after a pan, zoom or
+        resize, and does nothing if the view did not change. When the view shrinks, only the
+        shapes that were visible are tested again. Call it directly after changing the limits
+        of a headless plotter, whose figure is only drawn by save().
+
+        Returns:
+            bool: True if the artists were rebuilt.
+        """
+        self._view_changed = False
+        if self._scene is None:
+            return False
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        extent = self.ax.get_window_extent()
+        # data units per screen pixel, the larger of both axes like the equal-aspect box
+        pixel = self.min_pixels * max((x1 - x0) / max(extent.width, 1), (y1 - y0) / max(extent.height, 1))
+        box = (x0, y0, x1, y1)
+        if self._view == (box, pixel):
+            return False
+        if self._view is not None and _contains(self._view[0], box):
+            candidates = self._visible  # zoomed in: only the shapes visible before can still be visible
+        else:
+            # shapes whose center lies within reach of the x-range of the view, plus the wide shapes
+            start = np.searchsorted(self._centers, x0 - self._reach, side='left')
+            end = np.searchsorted(self._centers, x1 + self._reach, side='right')
+            candidates = np.sort(np.concatenate((self._order[start:end], self._wide)))
+        min_x, min_y, max_x, max_y = (values[candidates] for values in self._bounds)
+        self._visible = candidates[(max_x >= x0) & (min_x <= x1) & (max_y >= y0) & (min_y <= y1)]
+
+        for artist in self._artists:
+            artist.remove()
+        self._artists = self._draw(self.ax, self._scene[self._visible], pixel)
+        self._view = (box, pixel)
+        return True
+
+    def save(self, path: str, dpi: int = 100):
+        """
+        Write the figure to a file, the format (PNG, SVG, PDF, ...) follows the file extension.
+
+        Args:
+            path (str): The file to write.
+            dpi (int, optional): The resolution of raster formats. Defaults to 100.
+        """
+        self.update_view()  # the file must show the shapes of the current view, not of the last drawn frame
+        self.fig.savefig(path, dpi=dpi)
+
+    def save_tiles(self, directory: str, level: int = 0, tile_size: int = 256, fmt: str = 'png') -> list:
+        """
+        Render the stored shapes as a grid of square map tiles, one file per tile.
+
+        The padded bounding box of all shapes is extended to a square and split into
+        2**level tiles per side, so every level doubles the detail of the previous one.
+        Each tile is rendered with only the shapes that intersect it. The files are named
+        "<level>_<column>_<row>.<fmt>", counting columns from the left and rows from the top.
+
+        Args:
+            directory (str): The directory for the tiles, created if it does not exist.
+            level (int, optional): The zoom level, 0 renders the whole scene as one tile. Defaults to 0.
+            tile_size (int, optional): The width and height of a tile in pixels. Defaults to 256.
+            fmt (str, optional): The file format of the tiles. Defaults to 'png'.
+
+        Returns:
+            list: The paths of the written files.
+        """
+        if level < 0:
+            raise ValueError(f"{level} is not a valid zoom level.")
+        Utils.validate_positive(tile_size)
+        shapes = self._all_shapes()
+        if not len(shapes):
+            print("No 2D shapes to plot.")
+            return []
+
+        min_x, max_x, min_y, max_y = self._limits(shapes)
+        count = 2 ** level
+        size = max(max_x - min_x, max_y - min_y) / count
+        bounds = shapes.bounds()
 
-        self.ax.set_xlim(min_x - pad, max_x + pad)
-        self.ax.set_ylim(min_y - pad, max_y + pad)
+        # one reusable off-screen figure whose axis fills the whole tile
+        fig = Figure(figsize=(1, 1), dpi=tile_size)
+        ax = fig.add_axes((0, 0, 1, 1))
+        ax.set_axis_off()
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        artists = []
+        for column in range(count):
+            left = min_x + column * size
+            # filter by column first, so each row only tests the shapes of its column
+            in_column = np.flatnonzero((bounds[2] >= left) & (bounds[0] <= left + size))
+            column_min_y, column_max_y = bounds[1][in_column], bounds[3][in_column]
+            for row in range(count):
+                top = min_y + (count - row) * size
+                in_tile = in_column[(column_max_y >= top - size) & (column_min_y <= top)]
+                for artist in artists:
+                    artist.remove()
+                artists = self._draw(ax, shapes[in_tile], self.min_pixels * size / tile_size)
+                ax.set_xlim(left, left + size)
+                ax.set_ylim(top - size, top)
+                path = os.path.join(directory, f"{level}_{column}_{row}.{fmt}")
+                fig.savefig(path, format=fmt)
+                paths.append(path)
+        return paths
 
     def show(self):
         """Display the plot."""
+        if self.headless:
+            raise RuntimeError("A headless plotter cannot be shown, use save() instead.")
         plt.show()
@@ -9,6 +9,8 @@ class Shape3D(ABC):
     methods for calculating volume and surface area. Translation method is also provided.
     """
 
+    __slots__ = ("_x", "_y", "_z", "_volume", "_surface_area")  # no per-instance __dict__, subclasses add their own slots
+
     def __init__(self, x: Number, y: Number, z: Number):
         """
         Initialize a 3D shape with x, y, and z coordinates.
@@ -21,6 +23,20 @@ class Shape3D(ABC):
         self._x = x
         self._y = y
         self._z = z
+        self._volume = None  # cached volume and surface area, computed on first access
+        self._surface_area = None
+
+    @property
+    def x(self) -> Number:
+        return self._x
+
+    @property
+    def y(self) -> Number:
+        return self._y
+
+    @property
+    def z(self) -> Number:
+        return self._z
 
     @property
     @abstractmethod
@@ -34,6 +50,11 @@ class Shape3D(ABC):
         """Return the surface area of the shape (must be implemented by subclass)."""
         pass
 
+    def _invalidate(self) -> None:
+        """Forget the cached volume and surface area (call after changing a dimension)."""
+        self._volume = None
+        self._surface_area = None
+
     def translate(self, dx: Number, dy: Number, dz: Number) -> None:
         """
         Translate the shape by given numeric offsets.
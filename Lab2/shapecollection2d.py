@@ -0,0 +1,312 @@
+from numbers import Number
+import numpy as np
+from circle import Circle
+from rectangle import Rectangle
+from utils import Utils
+
+class ShapeCollection2D:
+    """
+    Array-backed collection of circles and rectangles.
+
+    Every shape is one row in contiguous NumPy arrays (x, y, radius, width, height and a kind tag),
+    so area, perimeter, total area and sort order are computed for all shapes in one vectorized call.
+    Columns that do not apply to a shape (radius for rectangles, width and height for circles) hold 0.
+
+    translate(), scale() and rotate() move all shapes in one vectorized operation. With lazy=True they
+    are only composed into one pending transform, which is applied in a single pass the next time
+    positions, sizes or derived values are read.
+    """
+
+    CIRCLE = 0
+    RECTANGLE = 1
+
+    def __init__(self, kind=(), x=(), y=(), radius=(), width=(), height=(), angle=()):
+        """
+        Initialize a collection from equally long columns.
+
+        Args:
+            kind (array-like): ShapeCollection2D.CIRCLE or ShapeCollection2D.RECTANGLE for every shape.
+            x (array-like): The x-coordinates of the shapes.
+            y (array-like): The y-coordinates of the shapes.
+            radius (array-like): The radius of every circle (ignored for rectangles).
+            width (array-like): The width of every rectangle (ignored for circles).
+            height (array-like): The height of every rectangle (ignored for circles).
+            angle (array-like, optional): The counter-clockwise rotation of every rectangle around its
+                lower-left corner (x, y) in radians (ignored for circles). Defaults to no rotation.
+        """
+        kind = Utils.validate_numbers(kind)
+        # checked before the cast to uint8, which would truncate 0.7 to a circle or wrap 257 to a rectangle
+        if not np.all(np.isin(kind, (self.CIRCLE, self.RECTANGLE))):
+            raise ValueError("Every kind must be ShapeCollection2D.CIRCLE or ShapeCollection2D.RECTANGLE.")
+        self._kind = kind.astype(np.uint8)
+        n = len(self._kind)
+        self._x = self._column(x, n)
+        self._y = self._column(y, n)
+        self._radius = self._column(radius, n)
+        self._width = self._column(width, n)
+        self._height = self._column(height, n)
+        self._angle = self._column(angle, n)
+        self._pending = None  # (scale, angle, tx, ty) of the transforms recorded with lazy=True
+
+        is_circle = self._kind == self.CIRCLE
+        Utils.validate_positive_array(self._radius[is_circle])
+        Utils.validate_positive_array(self._width[~is_circle])
+        Utils.validate_positive_array(self._height[~is_circle])
+
+    @staticmethod
+    def _column(values, n: int) -> np.ndarray:
+        # numeric column of length n as a float64 array, an empty input means a column of zeros
+        values = np.asarray(values)
+        if values.size == 0 and n:
+            return np.zeros(n)
+        values = Utils.validate_numbers(values)
+        if values.shape != (n,):
+            raise ValueError(f"Expected a column of {n} values, got shape {values.shape}.")
+        return values
+
+    @classmethod
+    def from_shapes(cls, shapes) -> "ShapeCollection2D":
+        """
+        Build a collection from Circle and Rectangle objects.
+
+        Args:
+            shapes (iterable): The Circle and Rectangle objects, kept in order.
+        """
+        shapes = list(shapes)
+        kind = np.empty(len(shapes), dtype=np.uint8)
+        columns = np.zeros((5, len(shapes)))  # x, y, radius, width, height
+        for i, shape in enumerate(shapes):
+            if isinstance(shape, Circle):
+                kind[i] = cls.CIRCLE
+                columns[:, i] = (shape.x, shape.y, shape.radius, 0, 0)
+            elif isinstance(shape, Rectangle):
+                kind[i] = cls.RECTANGLE
+                columns[:, i] = (shape.x, shape.y, 0, shape.width, shape.height)
+            else:
+                raise TypeError("Only circles and rectangles can be added to ShapeCollection2D.")
+        return cls(kind, *columns)
+
+    def to_shapes(self) -> list:
+        """Return the shapes as a list of Circle and Rectangle objects, raises ValueError for rotated rectangles."""
+        self.apply_transforms()
+        if np.any(self._angle[self._kind == self.RECTANGLE] != 0):
+            raise ValueError("Rotated rectangles cannot be converted to Rectangle objects.")
+        rows = zip(self._kind.tolist(), self._x.tolist(), self._y.tolist(),
+                   self._radius.tolist(), self._width.tolist(), self._height.tolist())
+        # the columns were validated when the collection was built, so no per-shape checks
+        return [Circle.trusted(r, x, y) if kind == self.CIRCLE else Rectangle.trusted(w, h, x, y)
+                for kind, x, y, r, w, h in rows]
+
+    @classmethod
+    def concatenate(cls, collections) -> "ShapeCollection2D":
+        """Join several collections into one, keeping their order."""
+        collections = list(collections)
+        if not collections:
+            return cls()
+        return cls(*(np.concatenate([getattr(c, name) for c in collections])
+                     for name in ("kind", "x", "y", "radius", "width", "height", "angle")))
+
+    def __len__(self) -> int:
+        return len(self._kind)
+
+    def __getitem__(self, index):
+        """Return one shape as a Shape2D object, or a new collection for a slice, mask or index array."""
+        self.apply_transforms()
+        if isinstance(index, Number):
+            kind, x, y = self._kind[index], self._x[index], self._y[index]
+            if kind == self.CIRCLE:
+                return Circle.trusted(float(self._radius[index]), float(x), float(y))
+            if self._angle[index] != 0:
+                raise ValueError("A rotated rectangle cannot be converted to a Rectangle object.")
+            return Rectangle.trusted(float(self._width[index]), float(self._height[index]), float(x), float(y))
+        return ShapeCollection2D(self._kind[index], self._x[index], self._y[index], self._radius[index],
+                                 self._width[index], self._height[index], self._angle[index])
+
+    @property
+    def kind(self) -> np.ndarray:
+        return self._kind
+
+    @property
+    def x(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._y
+
+    @property
+    def radius(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._radius
+
+    @property
+    def width(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._width
+
+    @property
+    def height(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._height
+
+    @property
+    def angle(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._angle
+
+    @property
+    def area(self) -> np.ndarray:
+        """Return the area of every shape, with the same formulas as Circle and Rectangle."""
+        self.apply_transforms()
+        # float_power calls the same pow() as the ** of a Python float, so the results match the scalar classes exactly
+        return np.where(self._kind == self.CIRCLE, np.pi * np.float_power(self._radius, 2), self._width * self._height)
+
+    @property
+    def perimeter(self) -> np.ndarray:
+        """Return the perimeter of every shape, with the same formulas as Circle and Rectangle."""
+        self.apply_transforms()
+        return np.where(self._kind == self.CIRCLE, 2 * np.pi * self._radius, 2 * (self._width + self._height))
+
+    def bounds(self) -> tuple:
+        """
+        Return the bounding boxes of all shapes as four arrays (min_x, min_y, max_x, max_y).
+
+        Circles are centered on (x, y), rectangles start at their lower-left corner (x, y)
+        and may be rotated around it.
+        """
+        self.apply_transforms()
+        is_circle = self._kind == self.CIRCLE
+        # the corners of a rectangle lie at 0, w, h and w + h from (x, y), with w and h the rotated sides
+        cos, sin = np.cos(self._angle), np.sin(self._angle)
+        wx, wy = self._width * cos, self._width * sin
+        hx, hy = -self._height * sin, self._height * cos
+        min_x = np.where(is_circle, self._x - self._radius, self._x + np.minimum(wx, 0) + np.minimum(hx, 0))
+        min_y = np.where(is_circle, self._y - self._radius, self._y + np.minimum(wy, 0) + np.minimum(hy, 0))
+        max_x = np.where(is_circle, self._x + self._radius, self._x + np.maximum(wx, 0) + np.maximum(hx, 0))
+        max_y = np.where(is_circle, self._y + self._radius, self._y + np.maximum(wy, 0) + np.maximum(hy, 0))
+        return min_x, min_y, max_x, max_y
+
+    def corners(self) -> np.ndarray:
+        """Return the corners of every rectangle counter-clockwise from (x, y), shape (rectangles, 4, 2)."""
+        self.apply_transforms()
+        is_rectangle = self._kind == self.RECTANGLE
+        x, y, angle = self._x[is_rectangle], self._y[is_rectangle], self._angle[is_rectangle]
+        cos, sin = np.cos(angle), np.sin(angle)
+        width, height = self._width[is_rectangle], self._height[is_rectangle]
+        wx, wy = width * cos, width * sin
+        hx, hy = -height * sin, height * cos
+        return np.stack((np.column_stack((x, y)), np.column_stack((x + wx, y + wy)),
+                         np.column_stack((x + wx + hx, y + wy + hy)), np.column_stack((x + hx, y + hy))), axis=1)
+
+    def total_area(self) -> float:
+        """Return the sum of the areas of all shapes."""
+        return float(self.area.sum())
+
+    def argsort(self, key: str = "area", reverse: bool = False) -> np.ndarray:
+        """
+        Return the indices that sort the shapes.
+
+        Args:
+            key (str, optional): "area" or "perimeter". Defaults to "area".
+            reverse (bool, optional): Sort from the largest to the smallest. Defaults to False.
+        """
+        if key not in ("area", "perimeter"):
+            raise ValueError(f"Cannot sort by {key}, use 'area' or 'perimeter'.")
+        values = getattr(self, key)
+        return np.argsort(-values if reverse else values, kind="stable")  # stable, like sorted()
+
+    def sorted(self, key: str = "area", reverse: bool = False) -> "ShapeCollection2D":
+        """Return a new collection with the shapes sorted by area or perimeter."""
+        return self[self.argsort(key, reverse)]
+
+    def _offsets(self, values) -> np.ndarray:
+        # one offset for every shape, or one offset per shape, checked before it is recorded
+        values = Utils.validate_numbers(values)
+        if values.ndim and values.shape != (len(self),):
+            raise ValueError(f"Expected one offset or {len(self)} offsets, got shape {values.shape}.")
+        return values
+
+    def translate(self, dx: Number, dy: Number, lazy: bool = False) -> None:
+        """
+        Translate every shape by the same offsets, or by one offset per shape.
+
+        Args:
+            dx (Number | array-like): Offset in the x-direction.
+            dy (Number | array-like): Offset in the y-direction.
+            lazy (bool, optional): Only record the translation, see apply_transforms(). Defaults to False.
+        """
+        dx, dy = self._offsets(dx), self._offsets(dy)
+        scale, angle, tx, ty = self._pending or (1, 0, 0, 0)
+        self._transform(scale, angle, tx + dx, ty + dy, lazy)
+
+    def scale(self, factor: Number, cx: Number = 0, cy: Number = 0, lazy: bool = False) -> None:
+        """
+        Scale every shape uniformly around a fixed point.
+
+        The sizes and the distances of the positions to (cx, cy) are multiplied by the factor.
+
+        Args:
+            factor (Number): The scale factor, must be positive.
+            cx (Number, optional): The x-coordinate of the fixed point. Defaults to 0.
+            cy (Number, optional): The y-coordinate of the fixed point. Defaults to 0.
+            lazy (bool, optional): Only record the scaling, see apply_transforms(). Defaults to False.
+        """
+        Utils.validate_positive(factor)
+        scale, angle, tx, ty = self._pending or (1, 0, 0, 0)
+        self._transform(scale * factor, angle, factor * tx + (1 - factor) * cx, factor * ty + (1 - factor) * cy, lazy)
+
+    def rotate(self, angle: Number, cx: Number = 0, cy: Number = 0, lazy: bool = False) -> None:
+        """
+        Rotate every shape counter-clockwise around a fixed point.
+
+        Circles move around the point. Rectangles move the same way and also turn by the angle.
+
+        Args:
+            angle (Number): The angle in radians.
+            cx (Number, optional): The x-coordinate of the fixed point. Defaults to 0.
+            cy (Number, optional): The y-coordinate of the fixed point. Defaults to 0.
+            lazy (bool, optional): Only record the rotation, see apply_transforms(). Defaults to False.
+        """
+        Utils.validate_number(angle)
+        scale, total, tx, ty = self._pending or (1, 0, 0, 0)
+        cos, sin = np.cos(angle), np.sin(angle)
+        self._transform(scale, total + angle, cx + cos * (tx - cx) - sin * (ty - cy),
+                        cy + sin * (tx - cx) + cos * (ty - cy), lazy)
+
+    def _transform(self, scale, angle, tx, ty, lazy: bool) -> None:
+        # record p -> scale * R(angle) * p + (tx, ty), the composition of every transform not applied yet
+        self._pending = (scale, angle, tx, ty)
+        if not lazy:
+            self.apply_transforms()
+
+    def apply_transforms(self) -> None:
+        """
+        Apply the transforms recorded with lazy=True to the arrays, in one pass.
+
+        Any number of lazy transforms costs the same single pass. It runs automatically before
+        positions, sizes or derived values are read, so it rarely needs to be called directly.
+        """
+        if self._pending is None:
+            return
+        scale, angle, tx, ty = self._pending
+        # in place, so arrays returned by the properties before stay up to date
+        if angle:
+            cos, sin = np.cos(angle), np.sin(angle)
+            x = self._x.copy()
+            self._x *= cos
+            self._x -= sin * self._y
+            self._y *= cos
+            self._y += sin * x
+            self._angle[self._kind == self.RECTANGLE] += angle
+        if scale != 1:
+            for column in (self._x, self._y, self._radius, self._width, self._height):
+                column *= scale
+        self._x += tx
+        self._y += ty
+        self._pending = None  # cleared only now, so a failed update keeps the recorded transforms
+
+    def __repr__(self) -> str:
+        circles = int(np.count_nonzero(self._kind == self.CIRCLE))
+        return f"ShapeCollection2D(circles={circles}, rectangles={len(self) - circles})"
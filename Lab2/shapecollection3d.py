@@ -0,0 +1,267 @@
+from numbers import Number
+import numpy as np
+from cube import Cube
+from shape3d import Shape3D
+from sphere import Sphere
+from utils import Utils
+
+class ShapeCollection3D:
+    """
+    Array-backed collection of cubes and spheres.
+
+    Every shape is one row in contiguous NumPy arrays (x, y, z, side, radius and a kind tag),
+    so volume, surface area, translation and comparisons run for all shapes in one vectorized call.
+    Columns that do not apply to a shape (radius for cubes, side for spheres) hold 0.
+
+    translate() and scale() accept lazy=True to only compose the transform into one pending
+    transform, which is applied in a single pass the next time positions or sizes are read.
+    Cubes stay axis-aligned, so there is no rotation.
+    """
+
+    CUBE = 0
+    SPHERE = 1
+
+    def __init__(self, kind=(), x=(), y=(), z=(), side=(), radius=()):
+        """
+        Initialize a collection from equally long columns.
+
+        Args:
+            kind (array-like): ShapeCollection3D.CUBE or ShapeCollection3D.SPHERE for every shape.
+            x (array-like): The x-coordinates of the shapes.
+            y (array-like): The y-coordinates of the shapes.
+            z (array-like): The z-coordinates of the shapes.
+            side (array-like): The side length of every cube (ignored for spheres).
+            radius (array-like): The radius of every sphere (ignored for cubes).
+        """
+        self._kind = np.asarray(kind, dtype=np.uint8)
+        n = len(self._kind)
+        self._x = self._column(x, n)
+        self._y = self._column(y, n)
+        self._z = self._column(z, n)
+        self._side = self._column(side, n)
+        self._radius = self._column(radius, n)
+        self._pending = None  # (scale, tx, ty, tz) of the transforms recorded with lazy=True
+
+        is_cube = self._kind == self.CUBE
+        if not np.all(is_cube | (self._kind == self.SPHERE)):
+            raise ValueError("Every kind must be ShapeCollection3D.CUBE or ShapeCollection3D.SPHERE.")
+        Utils.validate_positive_array(self._side[is_cube])
+        Utils.validate_positive_array(self._radius[~is_cube])
+
+    @staticmethod
+    def _column(values, n: int) -> np.ndarray:
+        # numeric column of length n as a float64 array, an empty input means a column of zeros
+        values = np.asarray(values)
+        if values.size == 0 and n:
+            return np.zeros(n)
+        values = Utils.validate_numbers(values)
+        if values.shape != (n,):
+            raise ValueError(f"Expected a column of {n} values, got shape {values.shape}.")
+        return values
+
+    @classmethod
+    def from_shapes(cls, shapes) -> "ShapeCollection3D":
+        """
+        Build a collection from Cube and Sphere objects.
+
+        Args:
+            shapes (iterable): The Cube and Sphere objects, kept in order.
+        """
+        shapes = list(shapes)
+        kind = np.empty(len(shapes), dtype=np.uint8)
+        columns = np.zeros((5, len(shapes)))  # x, y, z, side, radius
+        for i, shape in enumerate(shapes):
+            if isinstance(shape, Cube):
+                kind[i] = cls.CUBE
+                columns[:, i] = (shape.x, shape.y, shape.z, shape.side, 0)
+            elif isinstance(shape, Sphere):
+                kind[i] = cls.SPHERE
+                columns[:, i] = (shape.x, shape.y, shape.z, 0, shape.radius)
+            else:
+                raise TypeError("Only cubes and spheres can be added to ShapeCollection3D.")
+        return cls(kind, *columns)
+
+    def to_shapes(self) -> list:
+        """Return the shapes as a list of Cube and Sphere objects."""
+        self.apply_transforms()
+        rows = zip(self._kind.tolist(), self._x.tolist(), self._y.tolist(), self._z.tolist(),
+                   self._side.tolist(), self._radius.tolist())
+        # the columns were validated when the collection was built, so no per-shape checks
+        return [Cube.trusted(s, x, y, z) if kind == self.CUBE else Sphere.trusted(r, x, y, z)
+                for kind, x, y, z, s, r in rows]
+
+    def __len__(self) -> int:
+        return len(self._kind)
+
+    def __getitem__(self, index):
+        """Return one shape as a Shape3D object, or a new collection for a slice, mask or index array."""
+        self.apply_transforms()
+        if isinstance(index, Number):
+            position = float(self._x[index]), float(self._y[index]), float(self._z[index])
+            if self._kind[index] == self.CUBE:
+                return Cube.trusted(float(self._side[index]), *position)
+            return Sphere.trusted(float(self._radius[index]), *position)
+        return ShapeCollection3D(self._kind[index], self._x[index], self._y[index], self._z[index],
+                                 self._side[index], self._radius[index])
+
+    @property
+    def kind(self) -> np.ndarray:
+        return self._kind
+
+    @property
+    def x(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._y
+
+    @property
+    def z(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._z
+
+    @property
+    def side(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._side
+
+    @property
+    def radius(self) -> np.ndarray:
+        self.apply_transforms()
+        return self._radius
+
+    @property
+    def volume(self) -> np.ndarray:
+        """Return the volume of every shape, with the same formulas as Cube and Sphere."""
+        self.apply_transforms()
+        # float_power calls the same pow() as the ** of a Python float, so the results match the scalar classes exactly
+        return np.where(self._kind == self.CUBE, np.float_power(self._side, 3),
+                        (4/3) * np.pi * np.float_power(self._radius, 3))
+
+    @property
+    def surface_area(self) -> np.ndarray:
+        """Return the surface area of every shape, with the same formulas as Cube and Sphere."""
+        self.apply_transforms()
+        return np.where(self._kind == self.CUBE, 6 * np.float_power(self._side, 2),
+                        4 * np.pi * np.float_power(self._radius, 2))
+
+    def total_volume(self) -> float:
+        """Return the sum of the volumes of all shapes."""
+        return float(self.volume.sum())
+
+    def total_surface_area(self) -> float:
+        """Return the sum of the surface areas of all shapes."""
+        return float(self.surface_area.sum())
+
+    def is_unit_sphere(self) -> np.ndarray:
+        """Return True for every sphere with radius 1 (always False for cubes)."""
+        self.apply_transforms()
+        return (self._kind == self.SPHERE) & (self._radius == 1)
+
+    def _offsets(self, values) -> np.ndarray:
+        # one offset for every shape, or one offset per shape, checked before it is recorded
+        values = Utils.validate_numbers(values)
+        if values.ndim and values.shape != (len(self),):
+            raise ValueError(f"Expected one offset or {len(self)} offsets, got shape {values.shape}.")
+        return values
+
+    def translate(self, dx: Number, dy: Number, dz: Number, lazy: bool = False) -> None:
+        """
+        Translate every shape by the same offsets, or by one offset per shape.
+
+        Args:
+            dx (Number | array-like): Offset in the x-direction.
+            dy (Number | array-like): Offset in the y-direction.
+            dz (Number | array-like): Offset in the z-direction.
+            lazy (bool, optional): Only record the translation, see apply_transforms(). Defaults to False.
+        """
+        dx, dy, dz = self._offsets(dx), self._offsets(dy), self._offsets(dz)
+        scale, tx, ty, tz = self._pending or (1, 0, 0, 0)
+        self._transform(scale, tx + dx, ty + dy, tz + dz, lazy)
+
+    def scale(self, factor: Number, cx: Number = 0, cy: Number = 0, cz: Number = 0, lazy: bool = False) -> None:
+        """
+        Scale every shape uniformly around a fixed point.
+
+        The sizes and the distances of the positions to (cx, cy, cz) are multiplied by the factor.
+
+        Args:
+            factor (Number): The scale factor, must be positive.
+            cx (Number, optional): The x-coordinate of the fixed point. Defaults to 0.
+            cy (Number, optional): The y-coordinate of the fixed point. Defaults to 0.
+            cz (Number, optional): The z-coordinate of the fixed point. Defaults to 0.
+            lazy (bool, optional): Only record the scaling, see apply_transforms(). Defaults to False.
+        """
+        Utils.validate_positive(factor)
+        scale, tx, ty, tz = self._pending or (1, 0, 0, 0)
+        self._transform(scale * factor, factor * tx + (1 - factor) * cx, factor * ty + (1 - factor) * cy,
+                        factor * tz + (1 - factor) * cz, lazy)
+
+    def _transform(self, scale, tx, ty, tz, lazy: bool) -> None:
+        # record p -> scale * p + (tx, ty, tz), the composition of every transform not applied yet
+        self._pending = (scale, tx, ty, tz)
+        if not lazy:
+            self.apply_transforms()
+
+    def apply_transforms(self) -> None:
+        """
+        Apply the transforms recorded with lazy=True to the arrays, in one pass.
+
+        It runs automatically before positions, sizes or derived values are read,
+        so it rarely needs to be called directly.
+        """
+        if self._pending is None:
+            return
+        scale, tx, ty, tz = self._pending
+        # in place, so arrays returned by the properties before stay up to date
+        if scale != 1:
+            for column in (self._x, self._y, self._z, self._side, self._radius):
+                column *= scale
+        self._x += tx
+        self._y += ty
+        self._z += tz
+        self._pending = None  # cleared only now, so a failed update keeps the recorded transforms
+
+    # Comparisons work like Shape3D, shape by shape, against one Shape3D or another collection
+    # of the same length. They return boolean arrays.
+    def __eq__(self, other: object):
+        if not isinstance(other, (ShapeCollection3D, Shape3D)):
+            return NotImplemented
+        return (self.volume == other.volume) & (self.surface_area == other.surface_area)
+
+    def __ne__(self, other: object):
+        if not isinstance(other, (ShapeCollection3D, Shape3D)):
+            return NotImplemented
+        return ~self.__eq__(other)
+
+    def __lt__(self, other: object):
+        if not isinstance(other, (ShapeCollection3D, Shape3D)):
+            return NotImplemented
+        return self.volume < other.volume
+
+    def __gt__(self, other: object):
+        if not isinstance(other, (ShapeCollection3D, Shape3D)):
+            return NotImplemented
+        return self.volume > other.volume
+
+    def __le__(self, other: object):
+        if not isinstance(other, (ShapeCollection3D, Shape3D)):
+            return NotImplemented
+        return self.volume <= other.volume
+
+    def __ge__(self, other: object):
+        if not isinstance(other, (ShapeCollection3D, Shape3D)):
+            return NotImplemented
+        return self.volume >= other.volume
+
+    __hash__ = None  # == returns an array, so collections cannot be dictionary keys
+
+    def __str__(self) -> str:
+        return f"ShapeCollection3D(total_volume={self.total_volume()}, total_surface_area={self.total_surface_area()})"
+
+    def __repr__(self) -> str:
+        cubes = int(np.count_nonzero(self._kind == self.CUBE))
+        return f"ShapeCollection3D(cubes={cubes}, spheres={len(self) - cubes})"
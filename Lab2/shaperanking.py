@@ -0,0 +1,88 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from numbers import Number
+from operator import itemgetter
+
+class ShapeRanking:
+    """
+    Shapes kept in order of a sort key that is computed once per shape.
+
+    The ranking stores (key, sequence number, shape) entries in a sorted list. Top-k and
+    range queries find their position with a binary search in O(log n), instead of
+    comparing shapes with __lt__, which evaluates area or volume on both operands every time.
+    Shapes are tracked by identity, so equal shapes can be ranked side by side.
+    """
+
+    def __init__(self, shapes=(), key="area"):
+        """
+        Rank shapes, sorting them once.
+
+        Args:
+            shapes (iterable, optional): The shapes to rank.
+            key (str | callable, optional): The name of the property to rank by ("area",
+                "perimeter", "volume", "surface_area") or a function of one shape. Defaults to "area".
+        """
+        self._key = (lambda shape: getattr(shape, key)) if isinstance(key, str) else key
+        self._counter = count()  # sequence numbers keep entries with equal keys in insertion order
+        self._entries = sorted((self._key(shape), next(self._counter), shape) for shape in shapes)
+        self._by_id = {id(entry[2]): entry for entry in self._entries}
+        if len(self._by_id) != len(self._entries):
+            raise ValueError("The same shape cannot be ranked twice.")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over the shapes from the smallest to the largest key."""
+        return (shape for key, sequence, shape in self._entries)
+
+    def __contains__(self, shape: object) -> bool:
+        return id(shape) in self._by_id
+
+    def key_of(self, shape) -> Number:
+        """Return the stored sort key of a ranked shape."""
+        return self._by_id[id(shape)][0]
+
+    def add(self, shape) -> None:
+        """Add a shape, computing its key once."""
+        if id(shape) in self._by_id:
+            raise ValueError(f"{shape!r} is already ranked.")
+        entry = (self._key(shape), next(self._counter), shape)
+        insort(self._entries, entry)
+        self._by_id[id(shape)] = entry
+
+    def remove(self, shape) -> None:
+        """Remove a shape, raises KeyError if it is not ranked."""
+        if id(shape) not in self._by_id:
+            raise KeyError(f"{shape!r} is not ranked.")
+        key, sequence, shape = self._by_id.pop(id(shape))
+        del self._entries[bisect_left(self._entries, (key, sequence))]
+
+    def update(self, shape) -> None:
+        """Move a shape to its new place after it was resized."""
+        self.remove(shape)
+        self.add(shape)
+
+    def rank(self, shape) -> int:
+        """Return the position of a ranked shape, 0 for the smallest key."""
+        key, sequence, shape = self._by_id[id(shape)]
+        return bisect_left(self._entries, (key, sequence))
+
+    def smallest(self, k: int = 1) -> list:
+        """Return the k shapes with the smallest keys, smallest first."""
+        return [shape for key, sequence, shape in self._entries[:max(k, 0)]]
+
+    def largest(self, k: int = 1) -> list:
+        """Return the k shapes with the largest keys, largest first."""
+        return [shape for key, sequence, shape in reversed(self._entries[max(len(self._entries) - k, 0):])]
+
+    def between(self, low: Number, high: Number) -> list:
+        """Return the shapes with low <= key <= high, smallest first."""
+        start = bisect_left(self._entries, low, key=itemgetter(0))
+        end = bisect_right(self._entries, high, key=itemgetter(0))
+        return [shape for key, sequence, shape in self._entries[start:end]]
+
+    def count_between(self, low: Number, high: Number) -> int:
+        """Return the number of shapes with low <= key <= high in O(log n)."""
+        return max(bisect_right(self._entries, high, key=itemgetter(0))
+                   - bisect_left(self._entries, low, key=itemgetter(0)), 0)
@@ -0,0 +1,230 @@
+from math import floor
+from numbers import Number
+from circle import Circle
+from rectangle import Rectangle
+from shape2d import Shape2D
+
+MAX_CELLS_PER_SHAPE = 64  # shapes that would cover more grid cells are kept in a separate list of large shapes
+
+
+def shape_bounds(shape: Shape2D) -> tuple:
+    """
+    Return the bounding box (min_x, min_y, max_x, max_y) of a circle or rectangle.
+
+    Circles are centered on (x, y), rectangles start at their lower-left corner (x, y),
+    the same way Shape2DPlotter draws them.
+    """
+    if isinstance(shape, Circle):
+        return shape.x - shape.radius, shape.y - shape.radius, shape.x + shape.radius, shape.y + shape.radius
+    if isinstance(shape, Rectangle):
+        return shape.x, shape.y, shape.x + shape.width, shape.y + shape.height
+    raise TypeError("Only circles and rectangles can be added to SpatialIndex2D.")
+
+
+def contains_point(shape: Shape2D, px: Number, py: Number) -> bool:
+    """Return True if the point (px, py) lies inside or on the border of the shape."""
+    if isinstance(shape, Circle):
+        return (px - shape.x) ** 2 + (py - shape.y) ** 2 <= shape.radius ** 2
+    min_x, min_y, max_x, max_y = shape_bounds(shape)
+    return min_x <= px <= max_x and min_y <= py <= max_y
+
+
+def intersects_box(shape: Shape2D, box: tuple) -> bool:
+    """Return True if the shape and the box (min_x, min_y, max_x, max_y) share at least one point."""
+    min_x, min_y, max_x, max_y = box
+    if isinstance(shape, Circle):
+        nearest_x = min(max(shape.x, min_x), max_x)  # the point of the box that is closest to the center
+        nearest_y = min(max(shape.y, min_y), max_y)
+        return contains_point(shape, nearest_x, nearest_y)
+    shape_min_x, shape_min_y, shape_max_x, shape_max_y = shape_bounds(shape)
+    return shape_min_x <= max_x and min_x <= shape_max_x and shape_min_y <= max_y and min_y <= shape_max_y
+
+
+def shapes_overlap(a: Shape2D, b: Shape2D) -> bool:
+    """Return True if two circles or rectangles share at least one point (touching counts)."""
+    if isinstance(a, Circle) and isinstance(b, Circle):
+        return (a.x - b.x) ** 2 + (a.y - b.y) ** 2 <= (a.radius + b.radius) ** 2
+    if isinstance(a, Rectangle):
+        return intersects_box(b, shape_bounds(a))
+    return intersects_box(a, shape_bounds(b))
+
+
+class SpatialIndex2D:
+    """
+    Uniform grid index over circles and rectangles for point, box and overlap queries.
+
+    Every shape is registered in the grid cells that its bounding box covers, so a query
+    only tests the shapes in the cells it touches instead of scanning all shapes.
+    A shape that would cover more than MAX_CELLS_PER_SHAPE cells is kept in a list of
+    large shapes instead, which every query scans, so one huge shape among many small
+    ones cannot fill millions of cells.
+    Shapes are tracked by identity, because shapes with the same area compare equal.
+    """
+
+    def __init__(self, shapes=(), cell_size: Number = None):
+        """
+        Bulk load an index.
+
+        Args:
+            shapes (iterable, optional): The circles and rectangles to index.
+            cell_size (Number, optional): Width and height of a grid cell. Defaults to twice the
+                median bounding box size of the shapes, so most shapes cover one to four cells.
+        """
+        shapes = list(shapes)
+        if cell_size is None:
+            extents = sorted(max(max_x - min_x, max_y - min_y)
+                             for min_x, min_y, max_x, max_y in map(shape_bounds, shapes))
+            cell_size = 2 * extents[len(extents) // 2] if extents else 1.0
+        if not cell_size > 0:
+            raise ValueError(f"{cell_size} is not positive and non-zero.")
+        self.cell_size = cell_size
+        self._cells = {}  # (column, row) -> {id(shape): shape}
+        self._large = {}  # id(shape) -> shape, for shapes that cover too many cells
+        self._entries = {}  # id(shape) -> (shape, bounds, cells), cells is None for large shapes
+        for shape in shapes:
+            self.insert(shape)
+
+    def _shape_cells(self, bounds: tuple):
+        # the cells of a shape, or None when it covers more than MAX_CELLS_PER_SHAPE cells
+        min_x, min_y, max_x, max_y = bounds
+        columns = floor(max_x / self.cell_size) - floor(min_x / self.cell_size) + 1
+        rows = floor(max_y / self.cell_size) - floor(min_y / self.cell_size) + 1
+        if columns * rows > MAX_CELLS_PER_SHAPE:
+            return None
+        return self._cell_range(bounds)
+
+    def _register(self, shape: Shape2D, cells) -> None:
+        # add a shape to its cells, or to the large shapes
+        if cells is None:
+            self._large[id(shape)] = shape
+            return
+        for cell in cells:
+            self._cells.setdefault(cell, {})[id(shape)] = shape
+
+    def _unregister(self, shape: Shape2D, cells) -> None:
+        # remove a shape from its cells, or from the large shapes, and drop the cells that become empty
+        if cells is None:
+            del self._large[id(shape)]
+            return
+        for cell in cells:
+            members = self._cells[cell]
+            del members[id(shape)]
+            if not members:
+                del self._cells[cell]
+
+    def _cell_range(self, bounds: tuple) -> list:
+        # all (column, row) cells that a bounding box covers
+        min_x, min_y, max_x, max_y = bounds
+        first_column, first_row = floor(min_x / self.cell_size), floor(min_y / self.cell_size)
+        last_column, last_row = floor(max_x / self.cell_size), floor(max_y / self.cell_size)
+        return [(column, row) for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return (shape for shape, bounds, cells in self._entries.values())
+
+    def __contains__(self, shape: object) -> bool:
+        return id(shape) in self._entries
+
+    def insert(self, shape: Shape2D) -> None:
+        """Add a shape to the index (a shape that is already indexed is updated instead)."""
+        if id(shape) in self._entries:
+            self.update(shape)
+            return
+        bounds = shape_bounds(shape)
+        cells = self._shape_cells(bounds)
+        self._register(shape, cells)
+        self._entries[id(shape)] = (shape, bounds, cells)
+
+    def remove(self, shape: Shape2D) -> None:
+        """Remove a shape from the index, raises KeyError if it is not indexed."""
+        if id(shape) not in self._entries:
+            raise KeyError(f"{shape!r} is not in the index.")
+        shape, bounds, cells = self._entries.pop(id(shape))
+        self._unregister(shape, cells)
+
+    def update(self, shape: Shape2D) -> None:
+        """Re-register a shape after it was moved, only touching the cells that changed."""
+        old_shape, old_bounds, old_cells = self._entries[id(shape)]
+        bounds = shape_bounds(shape)
+        if bounds == old_bounds:
+            return
+        cells = self._shape_cells(bounds)
+        if cells is None or old_cells is None:  # moving into or out of the large shapes
+            self._unregister(shape, old_cells)
+            self._register(shape, cells)
+        elif cells != old_cells:
+            for cell in set(old_cells) - set(cells):
+                members = self._cells[cell]
+                del members[id(shape)]
+                if not members:
+                    del self._cells[cell]
+            for cell in set(cells) - set(old_cells):
+                self._cells.setdefault(cell, {})[id(shape)] = shape
+        self._entries[id(shape)] = (shape, bounds, cells)
+
+    def translate(self, shape: Shape2D, dx: Number, dy: Number) -> None:
+        """
+        Translate an indexed shape and update its position in the index.
+
+        Args:
+            shape (Shape2D): The indexed shape to move.
+            dx (Number): Offset in the x-direction.
+            dy (Number): Offset in the y-direction.
+        """
+        if id(shape) not in self._entries:
+            raise KeyError(f"{shape!r} is not in the index.")
+        shape.translate(dx, dy)
+        self.update(shape)
+
+    def query_point(self, px: Number, py: Number) -> list:
+        """Return the shapes that contain the point (px, py)."""
+        cell = (floor(px / self.cell_size), floor(py / self.cell_size))
+        found = [shape for shape in self._cells.get(cell, {}).values() if contains_point(shape, px, py)]
+        return found + [shape for shape in self._large.values() if contains_point(shape, px, py)]
+
+    def query_box(self, min_x: Number, min_y: Number, max_x: Number, max_y: Number) -> list:
+        """Return the shapes that intersect the box from (min_x, min_y) to (max_x, max_y)."""
+        box = (min_x, min_y, max_x, max_y)
+        first_column, first_row = floor(min_x / self.cell_size), floor(min_y / self.cell_size)
+        last_column, last_row = floor(max_x / self.cell_size), floor(max_y / self.cell_size)
+        if (last_column - first_column + 1) * (last_row - first_row + 1) > len(self._cells):
+            # a box larger than the occupied grid: walk the occupied cells instead of the empty ones
+            cells = [cell for cell in self._cells
+                     if first_column <= cell[0] <= last_column and first_row <= cell[1] <= last_row]
+        else:
+            cells = self._cell_range(box)
+        found = {}
+        for cell in cells:
+            for key, shape in self._cells.get(cell, {}).items():
+                if key not in found and intersects_box(shape, box):
+                    found[key] = shape
+        for key, shape in self._large.items():
+            if intersects_box(shape, box):
+                found[key] = shape
+        return list(found.values())
+
+    def overlapping_pairs(self) -> list:
+        """Return every pair of indexed shapes that overlap, each pair once."""
+        pairs = []
+        for cell, members in self._cells.items():
+            members = list(members.values())
+            for i, a in enumerate(members):
+                a_bounds = self._entries[id(a)][1]
+                for b in members[i + 1:]:
+                    b_bounds = self._entries[id(b)][1]
+                    # report the pair only in the cell that holds the corner of the overlap of both boxes
+                    corner = (floor(max(a_bounds[0], b_bounds[0]) / self.cell_size),
+                              floor(max(a_bounds[1], b_bounds[1]) / self.cell_size))
+                    if corner == cell and shapes_overlap(a, b):
+                        pairs.append((a, b))
+        checked = set()  # large shapes whose pairs were already reported
+        for key, large in self._large.items():
+            checked.add(key)
+            for other in self.query_box(*self._entries[key][1]):
+                if id(other) not in checked and shapes_overlap(large, other):
+                    pairs.append((large, other))
+        return pairs
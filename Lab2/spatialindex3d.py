@@ -0,0 +1,204 @@
+import heapq
+from math import sqrt
+from numbers import Number
+from cube import Cube
+from shape3d import Shape3D
+from sphere import Sphere
+
+
+def shape_bounds3d(shape: Shape3D) -> tuple:
+    """
+    Return the bounding box (min_x, min_y, min_z, max_x, max_y, max_z) of a cube or sphere.
+
+    Spheres are centered on (x, y, z), cubes start at their lowest corner (x, y, z),
+    the same way rectangles start at their lower-left corner in 2D.
+    """
+    if isinstance(shape, Sphere):
+        r = shape.radius
+        return shape.x - r, shape.y - r, shape.z - r, shape.x + r, shape.y + r, shape.z + r
+    if isinstance(shape, Cube):
+        s = shape.side
+        return shape.x, shape.y, shape.z, shape.x + s, shape.y + s, shape.z + s
+    raise TypeError("Only cubes and spheres can be added to SpatialIndex3D.")
+
+
+def box_distance(bounds: tuple, px: Number, py: Number, pz: Number) -> float:
+    """Return the distance from a point to a box, 0 if the point is inside."""
+    dx = max(bounds[0] - px, 0, px - bounds[3])
+    dy = max(bounds[1] - py, 0, py - bounds[4])
+    dz = max(bounds[2] - pz, 0, pz - bounds[5])
+    return sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def shape_distance(shape: Shape3D, px: Number, py: Number, pz: Number) -> float:
+    """Return the distance from a point to the surface of a shape, 0 if the point is inside."""
+    if isinstance(shape, Sphere):
+        return max(sqrt((px - shape.x) ** 2 + (py - shape.y) ** 2 + (pz - shape.z) ** 2) - shape.radius, 0)
+    return box_distance(shape_bounds3d(shape), px, py, pz)
+
+
+def boxes_overlap(a: tuple, b: tuple) -> bool:
+    """Return True if two boxes (min_x, min_y, min_z, max_x, max_y, max_z) share at least one point."""
+    return a[0] <= b[3] and b[0] <= a[3] and a[1] <= b[4] and b[1] <= a[4] and a[2] <= b[5] and b[2] <= a[5]
+
+
+def shapes_overlap3d(a: Shape3D, b: Shape3D) -> bool:
+    """Return True if two cubes or spheres share at least one point (touching counts)."""
+    if isinstance(a, Sphere) and isinstance(b, Sphere):
+        return (a.x - b.x) ** 2 + (a.y - b.y) ** 2 + (a.z - b.z) ** 2 <= (a.radius + b.radius) ** 2
+    if isinstance(a, Sphere):
+        a, b = b, a
+    if isinstance(b, Sphere):  # cube and sphere: the closest point of the cube must lie in the sphere
+        return box_distance(shape_bounds3d(a), b.x, b.y, b.z) <= b.radius
+    return boxes_overlap(shape_bounds3d(a), shape_bounds3d(b))
+
+
+def _union(boxes) -> tuple:
+    # the smallest box that contains all boxes
+    boxes = list(boxes)
+    return (min(box[0] for box in boxes), min(box[1] for box in boxes), min(box[2] for box in boxes),
+            max(box[3] for box in boxes), max(box[4] for box in boxes), max(box[5] for box in boxes))
+
+
+class _Node:
+    # one node of the hierarchy: a leaf holds (shape, bounds) items, an inner node two children
+    __slots__ = ("bounds", "left", "right", "items")
+
+    def __init__(self, bounds, left=None, right=None, items=None):
+        self.bounds = bounds
+        self.left = left
+        self.right = right
+        self.items = items
+
+
+class SpatialIndex3D:
+    """
+    Bounding volume hierarchy (BVH) over cubes and spheres for overlap and nearest-neighbour queries.
+
+    The shapes are split recursively at the median of the longest axis, so the tree is
+    balanced and a query only visits the branches whose boxes it touches. After shapes
+    move, refit() updates the boxes in O(n) without sorting the shapes again, and
+    translate_all() moves every shape and refits the tree in one call.
+    """
+
+    def __init__(self, shapes=(), leaf_size: int = 8):
+        """
+        Build the hierarchy.
+
+        Args:
+            shapes (iterable, optional): The cubes and spheres to index.
+            leaf_size (int, optional): The largest number of shapes in one leaf. Defaults to 8.
+        """
+        if leaf_size < 1:
+            raise ValueError(f"{leaf_size} is not positive and non-zero.")
+        self.leaf_size = leaf_size
+        self._shapes = list(shapes)
+        self._root = None
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def __iter__(self):
+        return iter(self._shapes)
+
+    def rebuild(self) -> None:
+        """Build the tree again from the current shapes, e.g. after many shapes moved far apart."""
+        items = [(shape, shape_bounds3d(shape)) for shape in self._shapes]
+        self._root = self._build(items) if items else None
+
+    def _build(self, items) -> _Node:
+        # split the items at the median center of the longest axis of their centers
+        bounds = _union(box for shape, box in items)
+        if len(items) <= self.leaf_size:
+            return _Node(bounds, items=items)
+        # box around the doubled centers, only the spread per axis matters
+        centers = _union((box[0] + box[3], box[1] + box[4], box[2] + box[5]) * 2 for shape, box in items)
+        axis = max(range(3), key=lambda i: centers[i + 3] - centers[i])
+        items.sort(key=lambda item: item[1][axis] + item[1][axis + 3])
+        middle = len(items) // 2
+        return _Node(bounds, self._build(items[:middle]), self._build(items[middle:]))
+
+    def refit(self) -> None:
+        """Update every box bottom-up after shapes were moved or resized, keeping the tree."""
+        def refit_node(node):
+            if node.items is not None:
+                node.items = [(shape, shape_bounds3d(shape)) for shape, box in node.items]
+                node.bounds = _union(box for shape, box in node.items)
+            else:
+                node.bounds = _union((refit_node(node.left), refit_node(node.right)))
+            return node.bounds
+
+        if self._root is not None:
+            refit_node(self._root)
+
+    def translate_all(self, dx: Number, dy: Number, dz: Number) -> None:
+        """
+        Translate every indexed shape by the same offsets and refit the tree.
+
+        Args:
+            dx (Number): Offset in the x-direction.
+            dy (Number): Offset in the y-direction.
+            dz (Number): Offset in the z-direction.
+        """
+        for shape in self._shapes:
+            shape.translate(dx, dy, dz)
+        self.refit()  # the relative positions are unchanged, so the tree stays balanced
+
+    def _candidates(self, box: tuple):
+        # (shape, bounds) of every leaf item whose box overlaps the given box
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if not boxes_overlap(node.bounds, box):
+                continue
+            if node.items is not None:
+                yield from (item for item in node.items if boxes_overlap(item[1], box))
+            else:
+                stack.extend((node.left, node.right))
+
+    def query_point(self, px: Number, py: Number, pz: Number) -> list:
+        """Return the indexed shapes that contain the point (px, py, pz)."""
+        return [shape for shape, box in self._candidates((px, py, pz, px, py, pz))
+                if shape_distance(shape, px, py, pz) == 0]
+
+    def query_overlap(self, shape: Shape3D) -> list:
+        """Return the indexed shapes that overlap a cube or sphere (the shape itself is skipped)."""
+        return [other for other, box in self._candidates(shape_bounds3d(shape))
+                if other is not shape and shapes_overlap3d(shape, other)]
+
+    def overlapping_pairs(self) -> list:
+        """Return every pair of indexed shapes that overlap, each pair once."""
+        order = {id(shape): i for i, shape in enumerate(self._shapes)}
+        return [(shape, other) for shape in self._shapes for other in self.query_overlap(shape)
+                if order[id(shape)] < order[id(other)]]
+
+    def nearest(self, px: Number, py: Number, pz: Number, k: int = 1) -> list:
+        """
+        Return the k shapes closest to a point as (distance, shape) pairs, nearest first.
+
+        The distance is measured to the surface of a shape and is 0 for shapes that contain
+        the point. The tree is searched best-first, so far away branches are never opened.
+        """
+        if self._root is None or k < 1:
+            return []
+        queue = [(box_distance(self._root.bounds, px, py, pz), 0, self._root)]
+        found = []  # max-heap of (-distance, tie, shape) with the k best shapes so far
+        tie = 1  # keeps heap entries comparable when distances are equal
+        while queue:
+            distance, _, node = heapq.heappop(queue)
+            if len(found) == k and distance > -found[0][0]:
+                break  # no branch left can hold a closer shape
+            if node.items is not None:
+                for shape, box in node.items:
+                    shape_dist = shape_distance(shape, px, py, pz)
+                    if len(found) < k:
+                        heapq.heappush(found, (-shape_dist, tie, shape))
+                    elif shape_dist < -found[0][0]:
+                        heapq.heapreplace(found, (-shape_dist, tie, shape))
+                    tie += 1
+            else:
+                for child in (node.left, node.right):
+                    heapq.heappush(queue, (box_distance(child.bounds, px, py, pz), tie, child))
+                    tie += 1
+        return [(-distance, shape) for distance, _, shape in sorted(found, reverse=True)]
@@ -11,25 +11,51 @@ class Sphere(Shape3D):
     Provides calculation of surface area and volume.
     """
 
+    __slots__ = ("_radius",)
+
     def __init__(self, radius: Number, x: Number = 0, y: Number = 0, z: Number = 0):
         Utils.validate_positive(radius)
         super().__init__(x, y, z)
         self._radius = radius
 
+    @classmethod
+    def trusted(cls, radius: Number, x: Number = 0, y: Number = 0, z: Number = 0) -> "Sphere":
+        """
+        Create a sphere without validating the radius.
+
+        Only for values that were validated already, e.g. in bulk with Utils.validate_positive_array.
+        An invalid radius is not detected and gives wrong results later.
+        """
+        sphere = cls.__new__(cls)
+        Shape3D.__init__(sphere, x, y, z)
+        sphere._radius = radius
+        return sphere
+
     @property
     def radius(self) -> Number:
         """Return the radius of the sphere."""
         return self._radius
 
+    @radius.setter
+    def radius(self, value: Number) -> None:
+        """Set a new positive radius, the cached volume and surface area are recomputed on next access."""
+        Utils.validate_positive(value)
+        self._radius = value
+        self._invalidate()
+
     @property
     def surface_area(self) -> Number:
         """Return the total surface area of the sphere."""
-        return 4 * pi * (self._radius ** 2)
+        if self._surface_area is None:
+            self._surface_area = 4 * pi * (self._radius ** 2)
+        return self._surface_area
 
     @property
     def volume(self) -> Number:
         """Return the volume of the sphere."""
-        return (4/3) * pi * (self._radius ** 3)
+        if self._volume is None:
+            self._volume = (4/3) * pi * (self._radius ** 3)
+        return self._volume
 
     def is_unit_sphere(self) -> bool:
         """Return True if the sphere is a unit sphere (radius == 1)."""
@@ -83,6 +83,30 @@ class TestCircle(unittest.TestCase):
         self.assertTrue(c1 >= c3)  # strictly greater
         self.assertFalse(c3 >= c1)
 
+    def test_resize(self):
+        c = Circle(1)
+        self.assertAlmostEqual(c.area, pi, places=9)
+        c.radius = 2  # the cached area and perimeter must be recomputed
+        self.assertAlmostEqual(c.area, pi * 4, places=9)
+        self.assertAlmostEqual(c.perimeter, 4 * pi, places=9)
+        with self.assertRaises(ValueError):
+            c.radius = 0
+        self.assertEqual(c.radius, 2)
+
+    def test_trusted(self):
+        c = Circle.trusted(5, 2, 3)  # no validation, same object as Circle(5, 2, 3)
+        self.assertIsInstance(c, Circle)
+        self.assertEqual((c.radius, c.x, c.y), (5, 2, 3))
+        self.assertEqual(c.area, Circle(5).area)
+        c.radius = 1  # the setters still validate
+        self.assertEqual(c.perimeter, 2 * pi)
+
+    def test_slots(self):
+        c = Circle(1)
+        self.assertFalse(hasattr(c, "__dict__"))  # attributes live in __slots__
+        with self.assertRaises(AttributeError):
+            c.color = "red"
+
     def test_str(self):
         c = Circle(5, -1, 2)
         s = str(c)
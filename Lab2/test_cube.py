@@ -23,6 +23,7 @@ class TestCube(unittest.TestCase):
         self.assertEqual(c._x, 1)
         self.assertEqual(c._y, -2)
         self.assertEqual(c._z, 3)
+        self.assertEqual((c.x, c.y, c.z), (1, -2, 3))
 
     def test_invalid_input(self):
         with self.assertRaises(ValueError):
@@ -82,6 +83,29 @@ class TestCube(unittest.TestCase):
         self.assertTrue(c1 >= c3)  # strictly greater
         self.assertFalse(c3 >= c1)
 
+    def test_resize(self):
+        c = Cube(2)
+        self.assertEqual(c.volume, 8)
+        c.side = 3  # the cached volume and surface area must be recomputed
+        self.assertEqual(c.volume, 27)
+        self.assertEqual(c.surface_area, 54)
+        with self.assertRaises(ValueError):
+            c.side = -1
+        self.assertEqual(c.side, 3)
+
+    def test_trusted(self):
+        c = Cube.trusted(2, 1, 2, 3)  # no validation, same object as Cube(2, 1, 2, 3)
+        self.assertIsInstance(c, Cube)
+        self.assertEqual((c.side, c.x, c.y, c.z), (2, 1, 2, 3))
+        self.assertEqual(c.volume, 8)
+        self.assertEqual(c, Cube(2))
+
+    def test_slots(self):
+        c = Cube(2)
+        self.assertFalse(hasattr(c, "__dict__"))  # attributes live in __slots__
+        with self.assertRaises(AttributeError):
+            c.color = "red"
+
     def test_str(self):
         c = Cube(2, 1, 2, 3)
         self.assertEqual(str(c), "Cube(side=2, pos=(1, 2, 3))")
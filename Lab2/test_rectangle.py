@@ -89,6 +89,31 @@ class TestRectangle(unittest.TestCase):
         self.assertTrue(r1 >= r3)
         self.assertFalse(r3 >= r1)
 
+    def test_resize(self):
+        r = Rectangle(2, 3)
+        self.assertEqual(r.area, 6)
+        r.width = 4  # the cached area and perimeter must be recomputed
+        self.assertEqual(r.area, 12)
+        r.height = 1
+        self.assertEqual(r.area, 4)
+        self.assertEqual(r.perimeter, 10)
+        with self.assertRaises(TypeError):
+            r.width = "a"
+        self.assertEqual(r.width, 4)
+
+    def test_trusted(self):
+        r = Rectangle.trusted(3, 4, 1, 2)  # no validation, same object as Rectangle(3, 4, 1, 2)
+        self.assertIsInstance(r, Rectangle)
+        self.assertEqual((r.width, r.height, r.x, r.y), (3, 4, 1, 2))
+        self.assertEqual(r.area, 12)
+        self.assertEqual(r, Rectangle(3, 4))
+
+    def test_slots(self):
+        r = Rectangle(2, 3)
+        self.assertFalse(hasattr(r, "__dict__"))  # attributes live in __slots__
+        with self.assertRaises(AttributeError):
+            r.color = "red"
+
     def test_str(self):
         r = Rectangle(4, 5, -1, 2)
         s = str(r)
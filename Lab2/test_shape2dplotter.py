@@ -0,0 +1,219 @@
+"""
+Unit tests for Shape2DPlotter.
+
+This test suite draws on the non-interactive Agg backend, so no display is needed.
+
+Tests included:
+- one collection artist per shape kind
+- positions and sizes of the drawn circles and rectangles
+- unified axis limits with padding
+- shapes and collections plotted together
+- other 2D shapes are skipped, not refused
+- headless rendering to PNG, SVG and PDF files
+- map tiles per zoom level, each with only the shapes it intersects
+- culling of shapes outside the view on pan and zoom
+- one update per drawn frame, not per changed axis limit
+- sub-pixel shapes drawn as point markers
+- rejection of non-2D shapes and negative min_pixels
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.image as mpimg
+import matplotlib.pyplot as plt
+import numpy as np
+from circle import Circle
+from cube import Cube
+from rectangle import Rectangle
+from shape2d import Shape2D
+from shape2dplotter import Shape2DPlotter
+from shapecollection2d import ShapeCollection2D
+
+
+class TestShape2DPlotter(unittest.TestCase):
+    def setUp(self):
+        self.plotter = Shape2DPlotter()
+        for shape in [Circle(1, 0, 0), Rectangle(4, 2, 2, 3), Circle(0.5, -2, 1)]:
+            self.plotter.add_shape(shape)
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_one_artist_per_kind(self):
+        self.plotter.plot_all()
+        self.assertEqual(len(self.plotter.ax.collections), 2)
+        self.assertEqual(len(self.plotter.ax.patches), 0)
+
+    def test_drawn_geometry(self):
+        self.plotter.plot_all()
+        circles, rectangles = self.plotter.ax.collections
+        self.assertEqual(circles.get_offsets().tolist(), [[0, 0], [-2, 1]])
+        self.assertEqual(circles.get_widths().tolist(), [2, 1])  # diameters
+        self.assertEqual(rectangles.get_paths()[0].vertices[:4].tolist(), [[2, 3], [6, 3], [6, 5], [2, 5]])
+
+    def test_limits(self):
+        self.plotter.plot_all()
+        pad = 0.1 * 8.5  # the shapes span x from -2.5 to 6 and y from -1 to 5
+        self.assertTrue(np.allclose(self.plotter.ax.get_xlim(), (-2.5 - pad, 6 + pad)))
+        self.assertTrue(np.allclose(self.plotter.ax.get_ylim(), (-1 - pad, 5 + pad)))
+
+    def test_collection(self):
+        collection = ShapeCollection2D([0] * 1000, np.arange(1000), np.zeros(1000), np.full(1000, 5))
+        self.plotter.add_collection(collection)
+        self.plotter.plot_all()
+        circles, rectangles = self.plotter.ax.collections
+        self.assertEqual(len(circles.get_offsets()), 1000)
+        self.assertEqual(len(rectangles.get_paths()), 1)
+        self.assertEqual(len(self.plotter.ax.lines[0].get_xdata()), 2)  # the small circles of setUp
+        self.assertEqual(self.plotter.ax.get_xlim()[1], 1004 + 0.1 * 1009)
+
+    def test_other_shapes_skipped(self):
+        class Triangle(Shape2D):
+            @property
+            def area(self):
+                return 1
+
+            @property
+            def perimeter(self):
+                return 3
+
+        self.plotter.add_shape(Triangle(100, 100))
+        self.plotter.plot_all()
+        circles, rectangles = self.plotter.ax.collections
+        self.assertEqual(len(circles.get_offsets()) + len(rectangles.get_paths()), 3)
+        self.assertLess(self.plotter.ax.get_xlim()[1], 100)  # not part of the limits either
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(len(self.plotter.save_tiles(directory, level=0, tile_size=16)), 1)
+
+    def test_rotated_rectangles(self):
+        collection = ShapeCollection2D([1], [0], [0], [0], [2], [1])
+        collection.rotate(np.pi / 2)
+        plotter = Shape2DPlotter(headless=True)
+        plotter.add_collection(collection)
+        plotter.plot_all()
+        vertices = plotter.ax.collections[1].get_paths()[0].vertices[:4]
+        self.assertTrue(np.allclose(vertices, [[0, 0], [0, 2], [-1, 2], [-1, 0]]))
+        self.assertTrue(np.allclose(plotter.ax.get_xlim(), (-1.2, 0.2)))
+
+    def test_empty(self):
+        plotter = Shape2DPlotter()
+        plotter.plot_all()
+        self.assertEqual(len(plotter.ax.collections), 0)
+
+    def test_culling(self):
+        collection = ShapeCollection2D([0, 1] * 500, np.arange(1000) * 10, np.zeros(1000),
+                                       np.full(1000, 4), np.full(1000, 8), np.full(1000, 8))
+        plotter = Shape2DPlotter(headless=True)
+        plotter.add_collection(collection)
+        plotter.plot_all()
+
+        def drawn():
+            circles, rectangles = plotter.ax.collections
+            return len(circles.get_offsets()) + len(rectangles.get_paths())
+
+        plotter.ax.set_xlim(95, 205)  # zoom in: shapes 9 to 20 intersect the view
+        plotter.update_view()  # a headless figure is never drawn, so update by hand
+        self.assertEqual(drawn(), 12)
+        plotter.ax.set_xlim(100, 150)  # zoom in further, only the visible shapes are tested
+        plotter.update_view()
+        self.assertEqual(sorted(plotter._visible.tolist()), list(range(10, 16)))
+        plotter.ax.set_xlim(5000, 5100)  # pan
+        plotter.update_view()
+        self.assertEqual(drawn(), 11)
+        self.assertEqual(sorted(plotter._visible.tolist()), list(range(500, 511)))
+        plotter.ax.set_xlim(-1000, 20000)
+        plotter.update_view()
+        self.assertEqual(drawn() + sum(len(line.get_xdata()) for line in plotter.ax.lines), 1000)
+
+    def test_level_of_detail(self):
+        plotter = Shape2DPlotter(headless=True)
+        plotter.add_shape(Rectangle(1000, 1000))
+        plotter.add_shape(Circle(0.01, 500, 500))  # far below one pixel
+        plotter.add_shape(Rectangle(0.01, 0.01, 200, 200))
+        plotter.plot_all()
+        circles, rectangles = plotter.ax.collections
+        self.assertEqual(len(circles.get_offsets()), 0)
+        self.assertEqual(len(rectangles.get_paths()), 1)
+        circle_points, rectangle_points = plotter.ax.lines
+        self.assertEqual(circle_points.get_xydata().tolist(), [[500, 500]])
+        self.assertEqual(rectangle_points.get_xydata().tolist(), [[200.005, 200.005]])
+
+        plotter.ax.set_xlim(499.9, 500.1)  # zoomed in far enough to draw the circle again
+        plotter.ax.set_ylim(499.9, 500.1)
+        plotter.update_view()
+        self.assertEqual(len(plotter.ax.collections[0].get_offsets()), 1)
+        self.assertEqual(len(plotter.ax.lines), 0)
+
+        full = Shape2DPlotter(headless=True, min_pixels=0)
+        full.add_shape(Circle(0.01, 500, 500))
+        full.add_shape(Rectangle(1000, 1000))
+        full.plot_all()
+        self.assertEqual(len(full.ax.collections[0].get_offsets()), 1)
+
+    def test_update_per_frame(self):
+        self.plotter.add_shape(Rectangle(100, 1, 0, -10))  # wider than the others, tested on every pan
+        self.plotter.plot_all()
+        with mock.patch.object(self.plotter, "_draw", wraps=self.plotter._draw) as draw:
+            self.plotter.ax.set_xlim(-3, -1)  # a pan sets the x and then the y limits
+            self.plotter.ax.set_ylim(0, 2)
+            self.assertEqual(draw.call_count, 0)
+            self.plotter.fig.canvas.draw()
+            self.assertEqual(draw.call_count, 1)
+            self.plotter.fig.canvas.draw()  # an unchanged view is not rebuilt
+            self.assertEqual(draw.call_count, 1)
+            self.plotter.ax.set_xlim(50, 52)  # a pan to the wide rectangle only
+            self.plotter.ax.set_ylim(-11, -9)
+            self.plotter.fig.canvas.draw()
+            self.assertEqual(draw.call_count, 2)
+        self.assertEqual(self.plotter._visible.tolist(), [3])
+
+    def test_headless(self):
+        plt.close("all")
+        plotter = Shape2DPlotter(headless=True)
+        plotter.add_shape(Circle(1))
+        plotter.plot_all()
+        self.assertEqual(plt.get_fignums(), [])  # not registered with pyplot
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt in ("png", "svg", "pdf"):
+                path = os.path.join(directory, f"shapes.{fmt}")
+                plotter.save(path)
+                self.assertGreater(os.path.getsize(path), 0)
+        with self.assertRaises(RuntimeError):
+            plotter.show()
+
+    def test_tiles(self):
+        plotter = Shape2DPlotter(headless=True)
+        plotter.add_shape(Circle(1, 0, 0))  # lower-left corner of the scene
+        plotter.add_shape(Rectangle(1, 1, 9, 9))  # upper-right corner of the scene
+        with tempfile.TemporaryDirectory() as directory:
+            paths = plotter.save_tiles(directory, level=1, tile_size=64)
+            self.assertEqual(sorted(os.path.basename(path) for path in paths),
+                             ["1_0_0.png", "1_0_1.png", "1_1_0.png", "1_1_1.png"])
+            self.assertEqual(mpimg.imread(paths[0]).shape, (64, 64, 4))
+
+            def drawn(column, row):
+                image = mpimg.imread(os.path.join(directory, f"1_{column}_{row}.png"))
+                return bool(np.any(image[..., :3] < 1))
+
+            self.assertTrue(drawn(0, 1))  # the circle, rows count from the top
+            self.assertTrue(drawn(1, 0))  # the rectangle
+            self.assertFalse(drawn(0, 0))
+            self.assertFalse(drawn(1, 1))
+        with self.assertRaises(ValueError):
+            plotter.save_tiles(directory, level=-1)
+
+    def test_invalid_input(self):
+        with self.assertRaises(TypeError):
+            self.plotter.add_shape(Cube(1))
+        with self.assertRaises(TypeError):
+            self.plotter.add_collection([Circle(1)])
+        with self.assertRaises(ValueError):
+            Shape2DPlotter(headless=True, min_pixels=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
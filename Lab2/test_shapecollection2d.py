@@ -0,0 +1,173 @@
+"""
+Unit tests for ShapeCollection2D.
+
+This test suite verifies that the array-backed collection gives the same results as
+the Circle and Rectangle classes.
+
+Tests included:
+- conversion from and to lists of shapes
+- column and value validation
+- vectorized area, perimeter and total area
+- sort order by area and perimeter
+- indexing, slicing and translation
+- bounding boxes and concatenation
+- bulk scaling and rotation, eager and lazy
+- offsets of the wrong shape are refused without losing lazy transforms
+"""
+
+import unittest
+from math import pi
+import numpy as np
+from circle import Circle
+from rectangle import Rectangle
+from shapecollection2d import ShapeCollection2D
+
+
+class TestShapeCollection2D(unittest.TestCase):
+    def setUp(self):
+        self.shapes = [Circle(2, 1, 1), Rectangle(3, 4, -1, 2), Circle(0.5), Rectangle(2, 2, 5, 5)]
+        self.collection = ShapeCollection2D.from_shapes(self.shapes)
+
+    def test_from_shapes(self):
+        self.assertEqual(len(self.collection), 4)
+        self.assertEqual(self.collection.kind.tolist(), [0, 1, 0, 1])
+        self.assertEqual(self.collection.x.tolist(), [1, -1, 0, 5])
+        self.assertEqual(self.collection.radius.tolist(), [2, 0, 0.5, 0])
+        self.assertEqual(self.collection.width.tolist(), [0, 3, 0, 2])
+
+    def test_to_shapes(self):
+        for shape, original in zip(self.collection.to_shapes(), self.shapes):
+            self.assertIsInstance(shape, type(original))
+            self.assertEqual(shape, original)
+            self.assertEqual((shape.x, shape.y), (original.x, original.y))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            ShapeCollection2D([0], [0], [0], [-1])
+        with self.assertRaises(ValueError):
+            ShapeCollection2D([1], [0], [0], width=[2], height=[0])
+        for kind in (7, 0.7, 2, 257, -1):  # no kind is truncated or wrapped into a valid one
+            with self.assertRaises(ValueError):
+                ShapeCollection2D([kind], [0], [0], [1], [1], [1])
+        with self.assertRaises(TypeError):
+            ShapeCollection2D([True], [0], [0], [1], [1], [1])
+        with self.assertRaises(ValueError):
+            ShapeCollection2D([0, 0], [0], [0, 0], [1, 1])
+        with self.assertRaises(TypeError):
+            ShapeCollection2D([0], ["a"], [0], [1])
+        with self.assertRaises(TypeError):
+            ShapeCollection2D.from_shapes(["circle"])
+
+    def test_area(self):
+        expected = [shape.area for shape in self.shapes]
+        self.assertEqual(self.collection.area.tolist(), expected)
+        self.assertAlmostEqual(self.collection.area[0], pi * 4, places=9)
+
+    def test_matches_scalar_classes(self):
+        rng = np.random.default_rng(1)
+        shapes = [Circle(float(a)) if i % 2 else Rectangle(float(a), float(b))
+                  for i, (a, b) in enumerate(rng.uniform(0.1, 100, (200, 2)))]
+        collection = ShapeCollection2D.from_shapes(shapes)
+        self.assertEqual(collection.area.tolist(), [shape.area for shape in shapes])
+        self.assertEqual(collection.perimeter.tolist(), [shape.perimeter for shape in shapes])
+
+    def test_perimeter(self):
+        expected = [shape.perimeter for shape in self.shapes]
+        self.assertEqual(self.collection.perimeter.tolist(), expected)
+
+    def test_total_area(self):
+        self.assertAlmostEqual(self.collection.total_area(), sum(shape.area for shape in self.shapes), places=9)
+        self.assertEqual(ShapeCollection2D().total_area(), 0)
+
+    def test_sorted(self):
+        expected = sorted(self.shapes)
+        self.assertEqual(self.collection.sorted().area.tolist(), [shape.area for shape in expected])
+        largest_first = self.collection.sorted("perimeter", reverse=True).perimeter
+        self.assertTrue(np.all(np.diff(largest_first) <= 0))
+        with self.assertRaises(ValueError):
+            self.collection.argsort("volume")
+
+    def test_getitem(self):
+        self.assertIsInstance(self.collection[0], Circle)
+        self.assertEqual(self.collection[1].width, 3)
+        part = self.collection[self.collection.kind == ShapeCollection2D.RECTANGLE]
+        self.assertEqual(len(part), 2)
+        self.assertEqual(part.area.tolist(), [12, 4])
+
+    def test_translate(self):
+        self.collection.translate(10, -5)
+        self.assertEqual(self.collection.x.tolist(), [11, 9, 10, 15])
+        self.assertEqual(self.collection.y.tolist(), [-4, -3, -5, 0])
+        self.collection.translate(np.arange(4), 0)
+        self.assertEqual(self.collection.x.tolist(), [11, 10, 12, 18])
+
+    def test_bounds(self):
+        min_x, min_y, max_x, max_y = self.collection.bounds()
+        self.assertEqual(min_x.tolist(), [-1, -1, -0.5, 5])
+        self.assertEqual(min_y.tolist(), [-1, 2, -0.5, 5])
+        self.assertEqual(max_x.tolist(), [3, 2, 0.5, 7])
+        self.assertEqual(max_y.tolist(), [3, 6, 0.5, 7])
+
+    def test_concatenate(self):
+        joined = ShapeCollection2D.concatenate([self.collection, self.collection[:1]])
+        self.assertEqual(len(joined), 5)
+        self.assertEqual(joined[4], self.shapes[0])
+        self.assertEqual(len(ShapeCollection2D.concatenate([])), 0)
+
+    def test_scale(self):
+        self.collection.scale(2)
+        self.assertEqual(self.collection.x.tolist(), [2, -2, 0, 10])
+        self.assertEqual(self.collection.radius.tolist(), [4, 0, 1, 0])
+        self.assertEqual(self.collection.area.tolist(), [shape.area * 4 for shape in self.shapes])
+        self.collection.scale(0.5, 10, 10)  # back to the original size, around (10, 10)
+        self.assertEqual(self.collection.x.tolist(), [6, 4, 5, 10])
+        self.assertEqual(self.collection.width.tolist(), [0, 3, 0, 2])
+        with self.assertRaises(ValueError):
+            self.collection.scale(0)
+
+    def test_rotate(self):
+        self.collection.rotate(pi / 2)
+        self.assertTrue(np.allclose(self.collection.x, [-1, -2, 0, -5]))
+        self.assertTrue(np.allclose(self.collection.y, [1, -1, 0, 5]))
+        self.assertEqual(self.collection.angle.tolist(), [0, pi / 2, 0, pi / 2])  # circles do not turn
+        # a quarter turn around (-2, -1) makes the 3 x 4 rectangle 4 wide and 3 high
+        bounds = np.array(self.collection.bounds())[:, 1]
+        self.assertTrue(np.allclose(bounds, [-6, -1, -2, 2]))
+        self.assertTrue(np.allclose(self.collection.corners()[0], [[-2, -1], [-2, 2], [-6, 2], [-6, -1]]))
+        self.assertEqual(self.collection.area.tolist(), [shape.area for shape in self.shapes])
+        self.assertIsInstance(self.collection[0], Circle)
+        with self.assertRaises(ValueError):
+            self.collection.to_shapes()
+        with self.assertRaises(ValueError):
+            self.collection[1]
+
+    def test_lazy_transforms(self):
+        eager = ShapeCollection2D.from_shapes(self.shapes)
+        x = self.collection.x
+        for collection, lazy in ((eager, False), (self.collection, True)):
+            collection.translate(3, -1, lazy=lazy)
+            collection.rotate(0.3, 1, 2, lazy=lazy)
+            collection.scale(1.5, -4, 0, lazy=lazy)
+            collection.translate(np.arange(4), 1, lazy=lazy)
+            collection.rotate(-1.1, lazy=lazy)
+        self.assertEqual(x.tolist(), [1, -1, 0, 5])  # nothing applied yet
+        for name in ("x", "y", "radius", "width", "height", "angle"):
+            self.assertTrue(np.allclose(getattr(self.collection, name), getattr(eager, name)))
+        self.assertIs(self.collection.x, x)  # applied in place
+        self.assertTrue(np.allclose(self.collection.area, eager.area))
+
+    def test_invalid_offsets_keep_pending(self):
+        x = self.collection.x.tolist()
+        self.collection.translate(5, 5, lazy=True)
+        with self.assertRaises(ValueError):
+            self.collection.translate(np.ones(3), 0)
+        with self.assertRaises(TypeError):
+            self.collection.translate("1", 0, lazy=True)
+        self.assertEqual(self.collection.x.tolist(), [value + 5 for value in x])  # the lazy translation survives
+
+    def test_repr(self):
+        self.assertEqual(repr(self.collection), "ShapeCollection2D(circles=2, rectangles=2)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Unit tests for ShapeCollection3D.
+
+This test suite mirrors the Cube and Sphere tests against the array-backed collection
+and checks that it gives the same numbers as the scalar classes.
+
+Tests included:
+- initialization, conversion and value validation
+- volume and surface area calculations
+- translation of x/y/z positions
+- bulk scaling, eager and lazy
+- offsets of the wrong shape are refused without losing lazy transforms
+- unit sphere detection
+- comparison operators (>, <, ==, >=, <=) based on volume
+- string representations (__str__ and __repr__)
+"""
+
+import unittest
+from math import pi
+import numpy as np
+from cube import Cube
+from sphere import Sphere
+from shapecollection3d import ShapeCollection3D
+
+class TestShapeCollection3D(unittest.TestCase):
+
+    def setUp(self):
+        self.shapes = [Cube(4, 1, -2, 3), Sphere(5, 2, -3, 7), Cube(2), Sphere(1)]
+        self.collection = ShapeCollection3D.from_shapes(self.shapes)
+
+    def test_init(self):
+        c = ShapeCollection3D([ShapeCollection3D.CUBE, ShapeCollection3D.SPHERE], [1, 2], [-2, -3], [3, 7],
+                              side=[4, 0], radius=[0, 5])
+        self.assertEqual(c.side.tolist(), [4, 0])
+        self.assertEqual(c.radius.tolist(), [0, 5])
+        self.assertEqual(c.x.tolist(), [1, 2])
+        self.assertEqual(c.y.tolist(), [-2, -3])
+        self.assertEqual(c.z.tolist(), [3, 7])
+        self.assertEqual(len(ShapeCollection3D()), 0)
+
+    def test_from_and_to_shapes(self):
+        self.assertEqual(self.collection.kind.tolist(), [0, 1, 0, 1])
+        for shape, original in zip(self.collection.to_shapes(), self.shapes):
+            self.assertIsInstance(shape, type(original))
+            self.assertEqual(repr(shape).replace(".0", ""), repr(original))
+        with self.assertRaises(TypeError):
+            ShapeCollection3D.from_shapes([Cube(1), "sphere"])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            ShapeCollection3D([ShapeCollection3D.CUBE], [0], [0], [0], side=[-1])
+        with self.assertRaises(ValueError):
+            ShapeCollection3D([ShapeCollection3D.SPHERE], [0], [0], [0], radius=[0])
+        with self.assertRaises(ValueError):
+            ShapeCollection3D([ShapeCollection3D.CUBE, ShapeCollection3D.CUBE], [0], [0, 0], [0, 0], side=[1, 1])
+        with self.assertRaises(TypeError):
+            ShapeCollection3D([ShapeCollection3D.CUBE], [0], [0], [0], side=["a"])
+
+    def test_surface_area(self):
+        expected = [shape.surface_area for shape in self.shapes]
+        self.assertEqual(self.collection.surface_area.tolist(), expected)
+        self.assertEqual(self.collection.surface_area[0], 6 * (4 ** 2))
+        self.assertAlmostEqual(self.collection.surface_area[1], 4 * pi * 25, places=9)
+        self.assertAlmostEqual(self.collection.total_surface_area(), sum(expected), places=9)
+
+    def test_volume(self):
+        expected = [shape.volume for shape in self.shapes]
+        self.assertEqual(self.collection.volume.tolist(), expected)
+        self.assertEqual(self.collection.volume[2], 2 ** 3)
+        self.assertAlmostEqual(self.collection.volume[1], (4/3) * pi * 125, places=9)
+        self.assertAlmostEqual(self.collection.total_volume(), sum(expected), places=9)
+
+    def test_matches_scalar_classes(self):
+        rng = np.random.default_rng(1)
+        shapes = [Cube(float(size)) if i % 2 else Sphere(float(size)) for i, size in enumerate(rng.uniform(0.1, 100, 200))]
+        collection = ShapeCollection3D.from_shapes(shapes)
+        self.assertEqual(collection.volume.tolist(), [shape.volume for shape in shapes])
+        self.assertEqual(collection.surface_area.tolist(), [shape.surface_area for shape in shapes])
+
+    def test_translate(self):
+        self.collection.translate(4, -1, 2)
+        self.assertEqual(self.collection.x.tolist(), [5, 6, 4, 4])
+        self.assertEqual(self.collection.y.tolist(), [-3, -4, -1, -1])
+        self.assertEqual(self.collection.z.tolist(), [5, 9, 2, 2])
+        self.collection.translate(np.arange(4), 0, 0)
+        self.assertEqual(self.collection.x.tolist(), [5, 7, 6, 7])
+
+    def test_scale(self):
+        self.collection.scale(2, 1, 1, 1)
+        self.assertEqual(self.collection.x.tolist(), [1, 3, -1, -1])
+        self.assertEqual(self.collection.z.tolist(), [5, 13, -1, -1])
+        self.assertEqual(self.collection.side.tolist(), [8, 0, 4, 0])
+        self.assertEqual(self.collection.volume.tolist(), [shape.volume * 8 for shape in self.shapes])
+        with self.assertRaises(ValueError):
+            self.collection.scale(-1)
+
+    def test_lazy_transforms(self):
+        eager = ShapeCollection3D.from_shapes(self.shapes)
+        z = self.collection.z
+        for collection, lazy in ((eager, False), (self.collection, True)):
+            collection.translate(1, 2, 3, lazy=lazy)
+            collection.scale(3, 1, 0, -1, lazy=lazy)
+            collection.translate(0, np.arange(4), 0, lazy=lazy)
+            collection.scale(0.25, lazy=lazy)
+        self.assertEqual(z.tolist(), [3, 7, 0, 0])  # nothing applied yet
+        for name in ("x", "y", "z", "side", "radius"):
+            self.assertTrue(np.allclose(getattr(self.collection, name), getattr(eager, name)))
+        self.assertIs(self.collection.z, z)
+        self.assertTrue(np.allclose(self.collection.volume, eager.volume))
+
+    def test_invalid_offsets_keep_pending(self):
+        z = self.collection.z.tolist()
+        self.collection.translate(0, 0, 5, lazy=True)
+        with self.assertRaises(ValueError):
+            self.collection.translate(0, 0, np.ones(5))
+        self.assertEqual(self.collection.z.tolist(), [value + 5 for value in z])
+
+    def test_is_unit_sphere(self):
+        self.assertEqual(self.collection.is_unit_sphere().tolist(), [False, False, False, True])
+
+    def test_equality(self):
+        same = ShapeCollection3D.from_shapes([Cube(4, 10, 10, 10), Sphere(5), Cube(3), Sphere(1)])
+        self.assertEqual((self.collection == same).tolist(), [True, True, False, True])
+        self.assertEqual((self.collection != same).tolist(), [False, False, True, False])
+        self.assertEqual((self.collection == Cube(2)).tolist(), [False, False, True, False])
+
+    def test_less_than(self):
+        self.assertEqual((self.collection < Cube(3)).tolist(), [False, False, True, True])
+        self.assertEqual((Cube(3) < self.collection).tolist(), [True, True, False, False])
+
+    def test_greater_than(self):
+        self.assertEqual((self.collection > Cube(3)).tolist(), [True, True, False, False])
+        self.assertEqual((Cube(3) > self.collection).tolist(), [False, False, True, True])
+
+    def test_less_or_equal(self):
+        self.assertEqual((self.collection <= Cube(2)).tolist(), [False, False, True, True])  # equal sides
+        self.assertEqual((self.collection <= self.collection).tolist(), [True] * 4)
+
+    def test_greater_or_equal(self):
+        self.assertEqual((self.collection >= Cube(2)).tolist(), [True, True, True, False])  # equal sides
+        self.assertEqual((self.collection >= self.collection).tolist(), [True] * 4)
+
+    def test_getitem(self):
+        self.assertEqual(repr(self.collection[0]), "Cube(side=4.0, x=1.0, y=-2.0, z=3.0)")
+        spheres = self.collection[self.collection.kind == ShapeCollection3D.SPHERE]
+        self.assertEqual(len(spheres), 2)
+        self.assertEqual(spheres.radius.tolist(), [5, 1])
+
+    def test_str(self):
+        c = ShapeCollection3D.from_shapes([Cube(2, 1, 2, 3)])
+        self.assertEqual(str(c), "ShapeCollection3D(total_volume=8.0, total_surface_area=24.0)")
+
+    def test_repr(self):
+        self.assertEqual(repr(self.collection), "ShapeCollection3D(cubes=2, spheres=2)")
+
+if __name__ == '__main__':
+    unittest.main()
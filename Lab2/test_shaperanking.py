@@ -0,0 +1,94 @@
+"""
+Unit tests for ShapeRanking.
+
+This test suite checks the ranking against sorted() over the same shapes.
+
+Tests included:
+- initial order and stored keys
+- top-k largest and smallest
+- range queries by key
+- add, remove and update after a resize
+- ranking by other properties and by a function
+"""
+
+import random
+import unittest
+from circle import Circle
+from cube import Cube
+from rectangle import Rectangle
+from shaperanking import ShapeRanking
+from sphere import Sphere
+
+
+class TestShapeRanking(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.shapes = [Circle(rng.uniform(0.5, 5)) if i % 2 else Rectangle(rng.uniform(1, 9), rng.uniform(1, 9))
+                       for i in range(200)]
+        self.ranking = ShapeRanking(self.shapes)
+
+    def test_order(self):
+        self.assertEqual([shape.area for shape in self.ranking], sorted(shape.area for shape in self.shapes))
+        self.assertEqual(len(self.ranking), 200)
+        self.assertEqual(self.ranking.key_of(self.shapes[3]), self.shapes[3].area)
+
+    def test_smallest_and_largest(self):
+        areas = sorted(shape.area for shape in self.shapes)
+        self.assertEqual([shape.area for shape in self.ranking.smallest(5)], areas[:5])
+        self.assertEqual([shape.area for shape in self.ranking.largest(5)], areas[::-1][:5])
+        self.assertEqual(self.ranking.largest(0), [])
+        self.assertEqual(len(self.ranking.largest(1000)), 200)
+        small = ShapeRanking([Circle(1), Circle(2), Circle(3)])
+        self.assertEqual([shape.radius for shape in small.largest(5)], [3, 2, 1])  # n < k < 2n
+        self.assertEqual(small.largest(-1), [])
+
+    def test_between(self):
+        expected = sorted(shape.area for shape in self.shapes if 10 <= shape.area <= 20)
+        self.assertEqual([shape.area for shape in self.ranking.between(10, 20)], expected)
+        self.assertEqual(self.ranking.count_between(10, 20), len(expected))
+        self.assertEqual(self.ranking.between(20, 10), [])
+        self.assertEqual(self.ranking.count_between(20, 10), 0)
+
+    def test_equal_shapes(self):
+        a, b = Circle(1), Circle(1, 5, 5)  # equal by area, kept in insertion order
+        ranking = ShapeRanking([a, b])
+        self.assertEqual(list(ranking), [a, b])
+        self.assertIs(ranking.smallest()[0], a)
+        with self.assertRaises(ValueError):
+            ranking.add(a)
+        with self.assertRaises(ValueError):
+            ShapeRanking([a, a])
+
+    def test_add_and_remove(self):
+        big = Circle(100)
+        self.ranking.add(big)
+        self.assertIs(self.ranking.largest()[0], big)
+        self.assertEqual(self.ranking.rank(big), 200)
+        self.ranking.remove(big)
+        self.assertNotIn(big, self.ranking)
+        with self.assertRaises(KeyError):
+            self.ranking.remove(big)
+        smallest = self.ranking.smallest()[0]
+        self.ranking.remove(smallest)
+        self.assertEqual(len(self.ranking), 199)
+        self.assertEqual(self.ranking.rank(self.ranking.smallest()[0]), 0)
+
+    def test_update_after_resize(self):
+        shape = self.ranking.smallest()[0]
+        if isinstance(shape, Circle):  # resized in place
+            shape.radius = 1000
+        else:
+            shape.width = shape.height = 1000
+        self.ranking.update(shape)
+        self.assertIs(self.ranking.largest()[0], shape)
+
+    def test_other_keys(self):
+        shapes = [Cube(3), Sphere(1), Cube(1), Sphere(2)]
+        by_volume = ShapeRanking(shapes, key="volume")
+        self.assertEqual(by_volume.largest(4), sorted(shapes, key=lambda shape: shape.volume, reverse=True))
+        by_side = ShapeRanking([Cube(3), Cube(1)], key=lambda cube: -cube.side)
+        self.assertEqual(by_side.smallest()[0].side, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Unit tests for SpatialIndex2D.
+
+This test suite compares the grid index with a brute-force scan over the same shapes.
+
+Tests included:
+- bounding boxes and exact geometry helpers
+- point, box and overlap queries
+- incremental insert and remove
+- updates after translate
+- shapes of very different sizes, where the large ones are kept out of the grid
+- validation of the shapes and the cell size
+"""
+
+import random
+import unittest
+from circle import Circle
+from cube import Cube
+from rectangle import Rectangle
+from spatialindex2d import MAX_CELLS_PER_SHAPE, SpatialIndex2D, contains_point, intersects_box, shape_bounds, shapes_overlap
+
+
+def random_shapes(n, seed=3):
+    rng = random.Random(seed)
+    shapes = []
+    for i in range(n):
+        x, y = rng.uniform(-50, 50), rng.uniform(-50, 50)
+        if i % 2:
+            shapes.append(Circle(rng.uniform(0.5, 6), x, y))
+        else:
+            shapes.append(Rectangle(rng.uniform(0.5, 10), rng.uniform(0.5, 10), x, y))
+    return shapes
+
+
+def ids(shapes):
+    return sorted(id(shape) for shape in shapes)
+
+
+class TestSpatialIndex2D(unittest.TestCase):
+    def setUp(self):
+        self.shapes = random_shapes(300)
+        self.index = SpatialIndex2D(self.shapes)
+
+    def test_shape_bounds(self):
+        self.assertEqual(shape_bounds(Circle(2, 1, 1)), (-1, -1, 3, 3))
+        self.assertEqual(shape_bounds(Rectangle(3, 2, 1, 1)), (1, 1, 4, 3))
+        with self.assertRaises(TypeError):
+            shape_bounds(Cube(1))
+
+    def test_geometry(self):
+        self.assertTrue(contains_point(Circle(1), 0.6, 0.8))  # on the border
+        self.assertFalse(contains_point(Circle(1), 0.8, 0.8))
+        self.assertTrue(intersects_box(Circle(1), (0.5, 0.5, 2, 2)))
+        self.assertFalse(intersects_box(Circle(1), (0.8, 0.8, 2, 2)))  # only the bounding boxes overlap
+        self.assertTrue(shapes_overlap(Circle(1), Circle(1, 2, 0)))  # touching
+        self.assertTrue(shapes_overlap(Rectangle(2, 2), Circle(1, 2.5, 1)))
+        self.assertFalse(shapes_overlap(Circle(1, 2.9, 2.9), Rectangle(2, 2)))
+
+    def test_query_point(self):
+        for px, py in [(0, 0), (10.5, -3), (-40, 40), (100, 100)]:
+            expected = [shape for shape in self.shapes if contains_point(shape, px, py)]
+            self.assertEqual(ids(self.index.query_point(px, py)), ids(expected))
+
+    def test_query_box(self):
+        for box in [(-5, -5, 5, 5), (20, -30, 21, 40), (-1000, -1000, 1000, 1000)]:
+            expected = [shape for shape in self.shapes if intersects_box(shape, box)]
+            self.assertEqual(ids(self.index.query_box(*box)), ids(expected))
+
+    def test_overlapping_pairs(self):
+        expected = {tuple(sorted((id(a), id(b)))) for i, a in enumerate(self.shapes)
+                    for b in self.shapes[i + 1:] if shapes_overlap(a, b)}
+        pairs = [tuple(sorted((id(a), id(b)))) for a, b in self.index.overlapping_pairs()]
+        self.assertEqual(len(pairs), len(set(pairs)))  # every pair once
+        self.assertEqual(set(pairs), expected)
+
+    def test_insert_and_remove(self):
+        index = SpatialIndex2D(cell_size=5)
+        a, b = Circle(1), Rectangle(2, 2, 10, 10)
+        index.insert(a)
+        index.insert(b)
+        self.assertEqual(len(index), 2)
+        self.assertIn(b, index)
+        self.assertEqual(index.query_point(11, 11), [b])
+        index.remove(b)
+        self.assertEqual(index.query_point(11, 11), [])
+        self.assertNotIn(b, index)
+        with self.assertRaises(KeyError):
+            index.remove(b)
+
+    def test_equal_shapes_are_kept_apart(self):
+        a, b = Circle(1), Circle(1, 30, 30)  # equal by area, different objects
+        index = SpatialIndex2D([a, b])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.query_point(30, 30), [b])
+
+    def test_translate(self):
+        shape = self.shapes[0]
+        x, y = shape.x, shape.y
+        self.index.translate(shape, 500, 500)
+        self.assertEqual((shape.x, shape.y), (x + 500, y + 500))
+        self.assertEqual(self.index.query_box(450, 450, 600, 600), [shape])
+        for other in self.shapes[1:50]:
+            other.translate(3, -2)  # moved outside the index, then updated
+            self.index.update(other)
+        expected = [s for s in self.shapes if intersects_box(s, (-10, -10, 10, 10))]
+        self.assertEqual(ids(self.index.query_box(-10, -10, 10, 10)), ids(expected))
+
+    def test_mixed_sizes(self):
+        rng = random.Random(5)
+        shapes = [Circle(0.01, rng.uniform(0, 1), rng.uniform(0, 1)) for _ in range(100)]
+        shapes += [Rectangle(200, 200, -100, -100), Circle(0.5, 0.5, 0.5)]
+        index = SpatialIndex2D(shapes)  # the cell size follows the tiny circles
+        self.assertLess(sum(len(members) for members in index._cells.values()), MAX_CELLS_PER_SHAPE * len(shapes))
+        for px, py in [(0.5, 0.5), (shapes[0].x, shapes[0].y), (90, -90), (150, 0)]:
+            expected = [shape for shape in shapes if contains_point(shape, px, py)]
+            self.assertEqual(ids(index.query_point(px, py)), ids(expected))
+        for box in [(0.2, 0.2, 0.3, 0.3), (-50, -50, -40, -40), (-1000, -1000, 1000, 1000)]:
+            expected = [shape for shape in shapes if intersects_box(shape, box)]
+            self.assertEqual(ids(index.query_box(*box)), ids(expected))
+        expected = {tuple(sorted((id(a), id(b)))) for i, a in enumerate(shapes)
+                    for b in shapes[i + 1:] if shapes_overlap(a, b)}
+        pairs = [tuple(sorted((id(a), id(b)))) for a, b in index.overlapping_pairs()]
+        self.assertEqual(len(pairs), len(set(pairs)))
+        self.assertEqual(set(pairs), expected)
+
+        huge = Circle(1000)
+        index.insert(huge)  # inserting a large shape does not fill the grid either
+        self.assertEqual(len(index.query_point(999, 0)), 1)
+        index.remove(huge)
+        self.assertEqual(index.query_point(999, 0), [])
+        grown = shapes[0]
+        grown.radius = 5  # a small shape that grows into a large one and back
+        index.update(grown)
+        self.assertIn(grown, index.query_point(grown.x + 4, grown.y))
+        grown.radius = 0.01
+        index.update(grown)
+        self.assertNotIn(grown, index.query_point(grown.x + 4, grown.y))
+        self.assertEqual(index.query_point(grown.x, grown.y)[0], grown)
+
+    def test_invalid_cell_size(self):
+        with self.assertRaises(ValueError):
+            SpatialIndex2D(cell_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
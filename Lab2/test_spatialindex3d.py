@@ -0,0 +1,117 @@
+"""
+Unit tests for SpatialIndex3D.
+
+This test suite compares the bounding volume hierarchy with a brute-force scan over
+the same cubes and spheres.
+
+Tests included:
+- bounding boxes, distances and overlap tests of single shapes
+- point containment and overlap queries
+- k-nearest lookups
+- refit and translate_all after moves
+- validation of the shapes and the leaf size
+"""
+
+import random
+import unittest
+from circle import Circle
+from cube import Cube
+from sphere import Sphere
+from spatialindex3d import SpatialIndex3D, shape_bounds3d, shape_distance, shapes_overlap3d
+
+
+def random_shapes(n, seed=5):
+    rng = random.Random(seed)
+    shapes = []
+    for i in range(n):
+        position = (rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-50, 50))
+        if i % 2:
+            shapes.append(Sphere(rng.uniform(0.5, 6), *position))
+        else:
+            shapes.append(Cube(rng.uniform(0.5, 8), *position))
+    return shapes
+
+
+def ids(shapes):
+    return sorted(id(shape) for shape in shapes)
+
+
+class TestSpatialIndex3D(unittest.TestCase):
+    def setUp(self):
+        self.shapes = random_shapes(400)
+        self.index = SpatialIndex3D(self.shapes, leaf_size=4)
+
+    def test_shape_bounds(self):
+        self.assertEqual(shape_bounds3d(Sphere(2, 1, 1, 1)), (-1, -1, -1, 3, 3, 3))
+        self.assertEqual(shape_bounds3d(Cube(2, 1, 1, 1)), (1, 1, 1, 3, 3, 3))
+        with self.assertRaises(TypeError):
+            shape_bounds3d(Circle(1))
+
+    def test_geometry(self):
+        self.assertEqual(shape_distance(Sphere(1), 0, 0, 3), 2)
+        self.assertEqual(shape_distance(Sphere(1), 0, 0, 0.5), 0)
+        self.assertEqual(shape_distance(Cube(1), 4, 0.5, 0.5), 3)
+        self.assertTrue(shapes_overlap3d(Sphere(1), Sphere(1, 2, 0, 0)))  # touching
+        self.assertTrue(shapes_overlap3d(Cube(2), Sphere(1, 2.5, 1, 1)))
+        self.assertFalse(shapes_overlap3d(Sphere(1, 2.9, 2.9, 2.9), Cube(2)))  # only the bounding boxes overlap
+        self.assertTrue(shapes_overlap3d(Cube(2), Cube(1, 2, 2, 2)))
+
+    def test_query_point(self):
+        for point in [(0, 0, 0), (10, -20, 5), (200, 200, 200)]:
+            expected = [shape for shape in self.shapes if shape_distance(shape, *point) == 0]
+            self.assertEqual(ids(self.index.query_point(*point)), ids(expected))
+
+    def test_query_overlap(self):
+        for probe in [Sphere(10), Cube(15, -20, -20, -20), Sphere(1, 500, 0, 0)]:
+            expected = [shape for shape in self.shapes if shapes_overlap3d(probe, shape)]
+            self.assertEqual(ids(self.index.query_overlap(probe)), ids(expected))
+        shape = self.shapes[0]
+        self.assertNotIn(id(shape), ids(self.index.query_overlap(shape)))
+
+    def test_overlapping_pairs(self):
+        expected = {tuple(sorted((id(a), id(b)))) for i, a in enumerate(self.shapes)
+                    for b in self.shapes[i + 1:] if shapes_overlap3d(a, b)}
+        pairs = [tuple(sorted((id(a), id(b)))) for a, b in self.index.overlapping_pairs()]
+        self.assertEqual(len(pairs), len(set(pairs)))  # every pair once
+        self.assertEqual(set(pairs), expected)
+
+    def test_nearest(self):
+        for point in [(0, 0, 0), (60, 60, 60), (-10, 30, 0)]:
+            expected = sorted(shape_distance(shape, *point) for shape in self.shapes)[:5]
+            found = self.index.nearest(*point, k=5)
+            self.assertEqual([distance for distance, shape in found], expected)
+            for distance, shape in found:
+                self.assertEqual(shape_distance(shape, *point), distance)
+        self.assertEqual(len(self.index.nearest(0, 0, 0, k=1000)), len(self.shapes))
+        self.assertEqual(SpatialIndex3D().nearest(0, 0, 0), [])
+
+    def test_refit(self):
+        for shape in self.shapes[:100]:
+            shape.translate(7, -3, 2)
+        self.index.refit()
+        probe = Sphere(12, 5, 5, 5)
+        expected = [shape for shape in self.shapes if shapes_overlap3d(probe, shape)]
+        self.assertEqual(ids(self.index.query_overlap(probe)), ids(expected))
+
+    def test_translate_all(self):
+        x, y, z = self.shapes[1].x, self.shapes[1].y, self.shapes[1].z
+        self.index.translate_all(100, 0, -100)
+        self.assertEqual((self.shapes[1].x, self.shapes[1].y, self.shapes[1].z), (x + 100, y, z - 100))
+        expected = sorted(shape_distance(shape, 100, 0, -100) for shape in self.shapes)[:3]
+        self.assertEqual([distance for distance, shape in self.index.nearest(100, 0, -100, k=3)], expected)
+
+    def test_rebuild(self):
+        self.shapes[0].translate(1000, 0, 0)
+        self.index.rebuild()
+        self.assertEqual(self.index.query_point(self.shapes[0].x + 0.1, self.shapes[0].y + 0.1,
+                                                self.shapes[0].z + 0.1), [self.shapes[0]])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            SpatialIndex3D(leaf_size=0)
+        with self.assertRaises(TypeError):
+            SpatialIndex3D([Circle(1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -89,6 +89,29 @@ class TestSphere(unittest.TestCase):
         self.assertTrue(s1 >= s3)  # strictly greater
         self.assertFalse(s3 >= s1)
 
+    def test_resize(self):
+        s = Sphere(1)
+        self.assertAlmostEqual(s.volume, (4/3) * pi, places=9)
+        s.radius = 2  # the cached volume and surface area must be recomputed
+        self.assertAlmostEqual(s.volume, (4/3) * pi * 8, places=9)
+        self.assertAlmostEqual(s.surface_area, 4 * pi * 4, places=9)
+        self.assertFalse(s.is_unit_sphere())
+        with self.assertRaises(ValueError):
+            s.radius = 0
+
+    def test_trusted(self):
+        s = Sphere.trusted(2, 1, 2, 3)  # no validation, same object as Sphere(2, 1, 2, 3)
+        self.assertIsInstance(s, Sphere)
+        self.assertEqual((s.radius, s.x, s.y, s.z), (2, 1, 2, 3))
+        self.assertEqual(s.volume, Sphere(2).volume)
+        self.assertEqual(s, Sphere(2))
+
+    def test_slots(self):
+        s = Sphere(2)
+        self.assertFalse(hasattr(s, "__dict__"))  # attributes live in __slots__
+        with self.assertRaises(AttributeError):
+            s.color = "red"
+
     def test_str(self):
         s = Sphere(4, -1, 2, 3)
         self.assertEqual(str(s), "Sphere(radius=4, pos=(-1, 2, 3))")
@@ -0,0 +1,63 @@
+"""
+Unit tests for the Utils validation methods.
+
+Tests included:
+- validation of single numbers and positive numbers
+- bulk validation of sequences and NumPy arrays
+- validation in the collections and trusted construction from them
+"""
+
+import unittest
+import numpy as np
+from circle import Circle
+from rectangle import Rectangle
+from shapecollection2d import ShapeCollection2D
+from utils import Utils
+
+
+class TestUtils(unittest.TestCase):
+    def test_validate_number(self):
+        for value in (1, 2.5, np.float64(3), np.int32(4), True):
+            Utils.validate_number(value)
+        for value in ("1", None, [1]):
+            with self.assertRaises(TypeError):
+                Utils.validate_number(value)
+
+    def test_validate_positive(self):
+        Utils.validate_positive(0.1)
+        with self.assertRaises(ValueError):
+            Utils.validate_positive(0)
+        with self.assertRaises(TypeError):
+            Utils.validate_positive("5")
+
+    def test_validate_numbers(self):
+        values = Utils.validate_numbers([1, 2, 3])
+        self.assertEqual(values.dtype, np.float64)
+        self.assertEqual(values.tolist(), [1, 2, 3])
+        self.assertEqual(Utils.validate_numbers(np.arange(3, dtype=np.int8)).dtype, np.float64)
+        with self.assertRaises(TypeError):
+            Utils.validate_numbers(["1", "2"])
+        with self.assertRaises(TypeError):
+            Utils.validate_numbers([True, False])
+
+    def test_validate_positive_array(self):
+        self.assertEqual(Utils.validate_positive_array((0.5, 2)).tolist(), [0.5, 2])
+        self.assertEqual(len(Utils.validate_positive_array([])), 0)
+        for values in ([1, 0], [-1, 2], [1, np.nan]):
+            with self.assertRaises(ValueError):
+                Utils.validate_positive_array(values)
+        with self.assertRaises(TypeError):
+            Utils.validate_positive_array([None, 1])
+
+    def test_trusted_bulk_construction(self):
+        collection = ShapeCollection2D([0, 1], [1, 2], [3, 4], [5, 0], [0, 6], [0, 7])  # validated once
+        circle, rectangle = collection.to_shapes()
+        self.assertEqual(circle, Circle(5))
+        self.assertEqual((rectangle.width, rectangle.height, rectangle.x, rectangle.y), (6, 7, 2, 4))
+        self.assertIsInstance(rectangle, Rectangle)
+        with self.assertRaises(ValueError):
+            ShapeCollection2D([0], [0], [0], [np.nan])
+
+
+if __name__ == "__main__":
+    unittest.main()
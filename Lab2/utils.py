@@ -1,14 +1,24 @@
 from numbers import Number
+import numpy as np
 
 class Utils:
     """
     Validation for numeric numbers in this geometric lab.
     Made to control that it is a number is positive and non-zero.
+
+    validate_number and validate_positive check one value. validate_numbers and
+    validate_positive_array check a whole sequence or NumPy array in one vectorized pass,
+    for bulk construction (see ShapeCollection2D, ShapeCollection3D and the trusted()
+    constructors of the shape classes).
     """
+
+    # exact types that are numbers without the slower isinstance check against the Number ABC
+    _FAST_NUMBER_TYPES = frozenset((int, float, np.float64))
+
     @staticmethod
     def validate_number(value):
         """Raise TypeError if value is not a number."""
-        if not isinstance(value, Number):
+        if type(value) not in Utils._FAST_NUMBER_TYPES and not isinstance(value, Number):
             raise TypeError(f"{value} is not a number.")
 
     @staticmethod
@@ -16,4 +26,39 @@ class Utils:
         """Raise ValueError if value is not a positive non-zero number."""
         Utils.validate_number(value)
         if value <= 0:
-            raise ValueError(f"{value} is not positive and non-zero.")
\ No newline at end of file
+            raise ValueError(f"{value} is not positive and non-zero.")
+
+    @staticmethod
+    def validate_numbers(values) -> np.ndarray:
+        """
+        Raise TypeError unless values is a sequence or array of numbers, checked in one pass.
+
+        Args:
+            values (array-like): The values to check. Booleans are not accepted as numbers here.
+
+        Returns:
+            np.ndarray: The values as a float64 array.
+        """
+        array = np.asarray(values)
+        if array.dtype == bool or not np.issubdtype(array.dtype, np.number):
+            raise TypeError(f"{array.dtype} is not a numeric array.")
+        return array.astype(np.float64)
+
+    @staticmethod
+    def validate_positive_array(values) -> np.ndarray:
+        """
+        Raise ValueError unless every value is a positive non-zero number, checked in one pass.
+
+        NaN is rejected as well. Raises TypeError like validate_numbers for non-numeric values.
+
+        Args:
+            values (array-like): The values to check.
+
+        Returns:
+            np.ndarray: The values as a float64 array.
+        """
+        array = Utils.validate_numbers(values)
+        invalid = ~(array > 0)
+        if np.any(invalid):
+            raise ValueError(f"{array[invalid][0]} is not positive and non-zero.")
+        return array